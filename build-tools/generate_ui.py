@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import io
+import pathlib
+
+from PyQt5 import uic
+
+ui_dir = pathlib.Path("./comictaggerlib/ui")
+
+# .ui files that are compiled ahead of time instead of being loaded with uic.loadUi at runtime
+ui_files = ("settingswindow.ui", "TemplateHelp.ui", "taggerwindow.ui", "seriesselectionwindow.ui")
+
+
+def generate(ui_file: pathlib.Path) -> str:
+    src = io.StringIO()
+    with ui_file.open(encoding="utf-8") as f:
+        uic.compileUi(f, src, from_imports=True)
+    return src.getvalue()
+
+
+if __name__ == "__main__":
+    for name in ui_files:
+        ui_file = ui_dir / name
+        py_file = ui_dir / (ui_file.stem.casefold() + "_ui.py")
+        py_file.write_text(generate(ui_file), encoding="utf-8")
+        print(py_file)
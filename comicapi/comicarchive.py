@@ -460,7 +460,7 @@ class ComicArchive:
 
             self.apply_archive_info_to_metadata(metadata)
             # Set the coverImage value, if it's not the first page
-            cover_idx = int(metadata.get_cover_page_index_list()[0])
+            cover_idx = metadata.get_cover_page_index()
             if cover_idx != 0:
                 metadata.cover_image = self.get_page_name(cover_idx)
 
@@ -63,7 +63,7 @@ class FileNameParser:
         else:
             placeholders = placeholders_allow_dashes
         for ph in placeholders:
-            string = re.sub(ph, self.repl, string)
+            string = ph.sub(self.repl, string)
         return string
 
     def get_issue_count(self, filename: str, issue_end: int) -> str:
@@ -272,6 +272,13 @@ class GenericMetadata:
 
         return 0
 
+    def get_cover_page_index(self) -> int:
+        # return the archive page index of the first cover page, stopping at the first one found
+        for p in self.pages:
+            if p.get("Type") == PageType.FrontCover:
+                return int(p["Image"])
+        return 0
+
     def get_cover_page_index_list(self) -> list[int]:
         # return a list of archive page indices of cover pages
         coverlist = []
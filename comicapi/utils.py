@@ -21,7 +21,7 @@ import pathlib
 import platform
 import unicodedata
 from collections import defaultdict
-from collections.abc import Iterable, Mapping
+from collections.abc import Collection, Iterable, Mapping
 from shutil import which  # noqa: F401
 from typing import Any, TypeVar
 
@@ -213,7 +213,7 @@ def xlate(data: Any) -> str | None:
 def split(s: str | None, c: str) -> list[str]:
     s = xlate(s)
     if s:
-        return [x.strip() for x in s.strip().split(c) if x.strip()]
+        return [stripped for x in s.split(c) if (stripped := x.strip())]
     return []
 
 
@@ -291,11 +291,12 @@ def titles_match(search_title: str, record_title: str, threshold: int = 90) -> b
     return ratio >= threshold
 
 
-def unique_file(file_name: pathlib.Path) -> pathlib.Path:
+def unique_file(file_name: pathlib.Path, taken: Collection[pathlib.Path] = ()) -> pathlib.Path:
+    """Returns file_name or the first numbered variant of it that neither exists nor is in taken"""
     name = file_name.stem
     counter = 1
     while True:
-        if not file_name.exists():
+        if not file_name.exists() and file_name not in taken:
             return file_name
         file_name = file_name.with_stem(name + " (" + str(counter) + ")")
         counter += 1
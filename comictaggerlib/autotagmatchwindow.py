@@ -21,7 +21,6 @@ from typing import Callable
 
 from PyQt5 import QtCore, QtGui, QtWidgets, uic
 
-from comicapi.comicarchive import MetaDataStyle
 from comicapi.genericmetadata import GenericMetadata
 from comictaggerlib.coverimagewidget import CoverImageWidget
 from comictaggerlib.ctsettings import ct_ns
@@ -249,7 +248,6 @@ class AutoTagMatchWindow(QtWidgets.QDialog):
         QtWidgets.QApplication.setOverrideCursor(QtGui.QCursor(QtCore.Qt.CursorShape.WaitCursor))
         md.overlay(ct_md)
         success = ca.write_metadata(md, self._style)
-        ca.load_cache([MetaDataStyle.CBI, MetaDataStyle.CIX])
 
         QtWidgets.QApplication.restoreOverrideCursor()
 
@@ -389,7 +389,7 @@ class CLI:
                 ii.set_additional_metadata(md)
                 ii.only_use_additional_meta_data = True
                 ii.set_output_function(myoutput)
-                ii.cover_page_index = md.get_cover_page_index_list()[0]
+                ii.cover_page_index = md.get_cover_page_index()
                 matches = ii.search()
 
                 result = ii.search_result
@@ -25,12 +25,11 @@ import pathlib
 from PyQt5 import QtCore, QtGui, QtWidgets, uic
 
 from comicapi.comicarchive import ComicArchive
-from comictaggerlib.graphics import graphics_path
 from comictaggerlib.imagefetcher import ImageFetcher
 from comictaggerlib.imagepopup import ImagePopup
 from comictaggerlib.pageloader import PageLoader
 from comictaggerlib.ui import ui_path
-from comictaggerlib.ui.qtutils import get_qimage_from_data, reduce_widget_font_size
+from comictaggerlib.ui.qtutils import get_icon, get_pixmap, get_qimage_from_data, reduce_widget_font_size
 from comictalker.comictalker import ComicTalker
 
 logger = logging.getLogger(__name__)
@@ -101,8 +100,8 @@ class CoverImageWidget(QtWidgets.QWidget):
         self.imageCount = 1
         self.imageData = b""
 
-        self.btnLeft.setIcon(QtGui.QIcon(str(graphics_path / "left.png")))
-        self.btnRight.setIcon(QtGui.QIcon(str(graphics_path / "right.png")))
+        self.btnLeft.setIcon(get_icon("left.png"))
+        self.btnRight.setIcon(get_icon("right.png"))
 
         self.btnLeft.clicked.connect(self.decrement_image)
         self.btnRight.clicked.connect(self.increment_image)
@@ -261,7 +260,7 @@ class CoverImageWidget(QtWidgets.QWidget):
         self.page_loader = None
 
     def load_default(self) -> None:
-        self.current_pixmap = QtGui.QPixmap(str(graphics_path / "nocover.png"))
+        self.current_pixmap = get_pixmap("nocover.png")
         self.set_display_pixmap()
 
     def resizeEvent(self, resize_event: QtGui.QResizeEvent) -> None:
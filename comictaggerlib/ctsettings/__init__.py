@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import pathlib
 from typing import Any
 
@@ -18,6 +19,13 @@ from comictaggerlib.ctsettings.settngs_namespace import settngs_namespace as ct_
 from comictaggerlib.ctsettings.types import ComicTaggerPaths
 from comictalker import ComicTalker
 
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
 logger = logging.getLogger(__name__)
 
 talkers: dict[str, ComicTalker] = {}
@@ -45,6 +53,15 @@ class SettingsEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, pathlib.Path):
+        return str(obj)
+    # orjson only serializes plain tuples, settings like File_Rename__replacements are namedtuples
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError
+
+
 def validate_types(config: settngs.Config[settngs.Values]) -> settngs.Config[settngs.Values]:
     # Go through each setting
     for group in config.definitions.values():
@@ -100,12 +117,17 @@ def save_file(
     """
     file_options = settngs.clean_config(config, file=True)
     try:
-        if not filename.exists():
-            filename.parent.mkdir(exist_ok=True, parents=True)
-            filename.touch()
+        filename.parent.mkdir(exist_ok=True, parents=True)
+
+        if orjson_available:
+            json_bytes = orjson.dumps(file_options, default=_orjson_default, option=orjson.OPT_INDENT_2)
+        else:
+            json_bytes = json.dumps(file_options, cls=SettingsEncoder, indent=2, ensure_ascii=False).encode("utf-8")
 
-        json_str = json.dumps(file_options, cls=SettingsEncoder, indent=2)
-        filename.write_text(json_str + "\n", encoding="utf-8")
+        # Write to a temporary file first so an interrupted save never leaves a truncated settings file
+        tmp_file = filename.with_name(filename.name + ".tmp")
+        tmp_file.write_bytes(json_bytes + b"\n")
+        os.replace(tmp_file, filename)
     except Exception:
         logger.exception("Failed to save config file: %s", filename)
         return False
@@ -195,6 +195,12 @@ class FileSelectionList(QtWidgets.QWidget):
         first_added = None
         rar_added_ro = False
         self.twList.setSortingEnabled(False)
+        # Duplicates are looked up here instead of scanning every row per file, rows stay put while sorting is off
+        listed_rows = {
+            str(cast(ComicArchive, self.get_archive_by_row(r)).path): r for r in range(self.twList.rowCount())
+        }
+        # The rows are painted once after they have all been added instead of after every insert
+        self.twList.setUpdatesEnabled(False)
         for idx, f in enumerate(filelist):
             QtCore.QCoreApplication.processEvents()
             if progdialog.wasCanceled():
@@ -202,12 +208,13 @@ class FileSelectionList(QtWidgets.QWidget):
             progdialog.setValue(idx + 1)
             progdialog.setLabelText(f)
             QtCore.QCoreApplication.processEvents()
-            row = self.add_path_item(f)
+            row = self.add_path_item(f, listed_rows)
             if row is not None:
                 ca = self.get_archive_by_row(row)
                 rar_added_ro = bool(ca and ca.archiver.name() == "RAR" and not ca.archiver.is_writable())
                 if first_added is None:
                     first_added = row
+        self.twList.setUpdatesEnabled(True)
 
         progdialog.hide()
         QtCore.QCoreApplication.processEvents()
@@ -269,12 +276,16 @@ class FileSelectionList(QtWidgets.QWidget):
 
         return -1
 
-    def add_path_item(self, path: str) -> int:
+    def add_path_item(self, path: str, listed_rows: dict[str, int] | None = None) -> int:
+        # listed_rows maps the paths in the list to their rows, it is updated with the added row
         path = str(path)
         path = os.path.abspath(path)
 
-        if self.is_list_dupe(path):
-            return self.get_current_list_row(path)
+        if listed_rows is None:
+            if self.is_list_dupe(path):
+                return self.get_current_list_row(path)
+        elif path in listed_rows:
+            return listed_rows[path]
 
         ca = ComicArchive(path, str(graphics_path / "nocover.png"))
 
@@ -315,6 +326,8 @@ class FileSelectionList(QtWidgets.QWidget):
 
             self.update_row(row)
 
+            if listed_rows is not None:
+                listed_rows[path] = row
             return row
         return -1
 
@@ -62,6 +62,7 @@ try:
 
     qt_exception_hook = UncaughtHook()
     from comictaggerlib.taggerwindow import TaggerWindow
+    from comictaggerlib.ui.qtutils import get_icon
 
     try:
         # needed here to initialize QWebEngine
@@ -110,7 +111,7 @@ def open_tagger_window(
 
     if platform.system() == "Darwin":
         # Set the MacOS dock icon
-        app.setWindowIcon(QtGui.QIcon(str(graphics_path / "app.png")))
+        app.setWindowIcon(get_icon("app.png"))
 
     if platform.system() == "Windows":
         # For pure python, tell windows that we're not python,
@@ -135,7 +136,7 @@ def open_tagger_window(
 
     try:
         tagger_window = TaggerWindow(config[0].Runtime_Options__files, config, talkers)
-        tagger_window.setWindowIcon(QtGui.QIcon(str(graphics_path / "app.png")))
+        tagger_window.setWindowIcon(get_icon("app.png"))
         tagger_window.show()
 
         # Catch open file events (macOS)
@@ -67,7 +67,10 @@ class ImageFetcher:
             self.nam = QtNetwork.QNetworkAccessManager()
 
     def clear_cache(self) -> None:
-        os.unlink(self.db_file)
+        try:
+            os.unlink(self.db_file)
+        except FileNotFoundError:
+            pass
         if os.path.isdir(self.cache_folder):
             shutil.rmtree(self.cache_folder)
 
@@ -19,8 +19,8 @@ import logging
 
 from PyQt5 import QtCore, QtGui, QtWidgets, sip, uic
 
-from comictaggerlib.graphics import graphics_path
 from comictaggerlib.ui import ui_path
+from comictaggerlib.ui.qtutils import get_pixmap
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +49,7 @@ class ImagePopup(QtWidgets.QDialog):
         # TODO: macOS denies this
         screen = QtWidgets.QApplication.primaryScreen()
         self.desktopBg = screen.grabWindow(sip.voidptr(0), 0, 0, screen_size.width(), screen_size.height())
-        bg = QtGui.QPixmap(str(graphics_path / "popup_bg.png"))
+        bg = get_pixmap("popup_bg.png")
         self.clientBgPixmap = bg.scaled(
             screen_size.width(),
             screen_size.height(),
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging.handlers
+import os
 import pathlib
 import platform
 import sys
@@ -24,6 +25,17 @@ def get_file_handler(filename: pathlib.Path) -> logging.FileHandler:
     return file_handler
 
 
+def read_log_tail(filename: pathlib.Path, size: int = 256 * 1024) -> str:
+    """Returns at most the last size bytes of the log, starting at the first full line"""
+    with filename.open("rb") as f:
+        start = max(0, f.seek(0, os.SEEK_END) - size)
+        f.seek(start)
+        data = f.read()
+    if start > 0:
+        data = data.partition(b"\n")[2]
+    return data.decode("utf-8", "replace")
+
+
 def setup_logging(verbose: int, log_dir: pathlib.Path) -> None:
     logging.getLogger("comicapi").setLevel(logging.DEBUG)
     logging.getLogger("comictaggerlib").setLevel(logging.DEBUG)
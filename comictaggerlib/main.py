@@ -16,30 +16,41 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
 import locale
 import logging
 import logging.handlers
+import mmap
 import os
+import pathlib
 import signal
 import subprocess
 import sys
-from typing import cast
+from typing import Any, cast
 
 import settngs
 
 import comicapi.comicarchive
 import comicapi.utils
 import comictalker
-from comictaggerlib import cli, ctsettings
+from comictaggerlib import ctsettings
 from comictaggerlib.ctsettings import ct_ns
 from comictaggerlib.ctversion import version
 from comictaggerlib.log import setup_logging
 
 if sys.version_info < (3, 10):
-    import importlib_metadata
+    from importlib_metadata import distributions
 else:
-    import importlib.metadata as importlib_metadata
+    from importlib.metadata import distributions
+
+try:
+    import orjson
+
+    orjson_available = True
+except ImportError:
+    orjson_available = False
 
 logger = logging.getLogger("comictagger")
 
@@ -65,15 +76,34 @@ def _lang_code_mac() -> str:
     # - The macOS underlying API:
     #   https://developer.apple.com/documentation/foundation/nsuserdefaults.
 
-    lang_detect_command = "defaults read -g AppleLocale"
-
-    status, output = subprocess.getstatusoutput(lang_detect_command)
-    if status == 0:
-        # Command was successful.
-        lang_code = output
-    else:
-        logging.warning("Language detection command failed: %r", output)
-        lang_code = ""
+    # The result is cached and only re-read when the global preferences have changed.
+    prefs = pathlib.Path.home() / "Library" / "Preferences" / ".GlobalPreferences.plist"
+    cache = pathlib.Path.home() / "Library" / "Caches" / "comictagger" / "locale"
+    try:
+        if cache.stat().st_mtime >= prefs.stat().st_mtime:
+            return cache.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    try:
+        result = subprocess.run(["defaults", "read", "-g", "AppleLocale"], capture_output=True, text=True)
+    except OSError as e:
+        logging.warning("Language detection command failed: %r", e)
+        return ""
+
+    if result.returncode != 0:
+        logging.warning("Language detection command failed: %r", result.stderr.strip())
+        return ""
+
+    # Command was successful.
+    lang_code = result.stdout.strip()
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(".tmp")
+        tmp.write_text(lang_code, encoding="utf-8")
+        os.replace(tmp, cache)
+    except OSError:
+        logging.debug("Failed to cache language code in %s", cache)
 
     return lang_code
 
@@ -85,20 +115,42 @@ def configure_locale() -> None:
             os.environ["LANG"] = f"{code}.utf-8"
 
     locale.setlocale(locale.LC_ALL, "")
-    sys.stdout.reconfigure(encoding=sys.getdefaultencoding())  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding=sys.getdefaultencoding())  # type: ignore[attr-defined]
-    sys.stdin.reconfigure(encoding=sys.getdefaultencoding())  # type: ignore[attr-defined]
+    encoding = sys.getdefaultencoding()
+    for stream in (sys.stdout, sys.stderr, sys.stdin):
+        if isinstance(stream, io.TextIOWrapper) and stream.encoding != encoding:
+            stream.reconfigure(encoding=encoding)
+
+
+def _load_json_file(json_file: pathlib.Path) -> Any:
+    if not orjson_available:
+        return json.loads(json_file.read_text("utf-8"))
+
+    with open(json_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as buf:
+            return orjson.loads(buf)
 
 
 def update_publishers(config: settngs.Config[ct_ns]) -> None:
     json_file = config[0].Runtime_Options__config.user_config_dir / "publishers.json"
     if json_file.exists():
         try:
-            comicapi.utils.update_publishers(json.loads(json_file.read_text("utf-8")))
+            comicapi.utils.update_publishers(_load_json_file(json_file))
         except Exception as e:
             logger.exception("Failed to load publishers from %s: %s", json_file, e)
 
 
+@functools.cache
+def installed_packages() -> list[tuple[str, str]]:
+    packages = []
+    for pkg in distributions():
+        # Each access of Distribution.metadata re-reads the METADATA file
+        metadata = pkg.metadata
+        packages.append((metadata["Name"], metadata["Version"]))
+    return sorted(packages)
+
+
 class App:
     """docstring for App"""
 
@@ -162,16 +214,11 @@ class App:
         return config
 
     def initialize_dirs(self, paths: ctsettings.ComicTaggerPaths) -> None:
-        paths.user_data_dir.mkdir(parents=True, exist_ok=True)
-        paths.user_config_dir.mkdir(parents=True, exist_ok=True)
-        paths.user_cache_dir.mkdir(parents=True, exist_ok=True)
-        paths.user_state_dir.mkdir(parents=True, exist_ok=True)
-        paths.user_log_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug("user_data_dir: %s", paths.user_data_dir)
-        logger.debug("user_config_dir: %s", paths.user_config_dir)
-        logger.debug("user_cache_dir: %s", paths.user_cache_dir)
-        logger.debug("user_state_dir: %s", paths.user_state_dir)
-        logger.debug("user_log_dir: %s", paths.user_log_dir)
+        for name in ("user_data_dir", "user_config_dir", "user_cache_dir", "user_state_dir", "user_log_dir"):
+            path: pathlib.Path = getattr(paths, name)
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+            logger.debug("%s: %s", name, path)
 
     def main(self) -> None:
         assert self.config is not None
@@ -191,9 +238,10 @@ class App:
 
         signal.signal(signal.SIGINT, signal.SIG_DFL)
 
-        logger.debug("Installed Packages")
-        for pkg in sorted(importlib_metadata.distributions(), key=lambda x: x.name):
-            logger.debug("%s\t%s", pkg.metadata["Name"], pkg.metadata["Version"])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Installed Packages")
+            for name, pkg_version in installed_packages():
+                logger.debug("%s\t%s", name, pkg_version)
 
         comicapi.utils.load_publishers()
         update_publishers(self.config)
@@ -233,6 +281,8 @@ class App:
         if error and error[1]:
             print(f"A fatal error occurred please check the log for more information: {error[0]}")  # noqa: T201
             raise SystemExit(1)
+        from comictaggerlib import cli
+
         try:
             cli.CLI(self.config[0], talkers).run()
         except Exception:
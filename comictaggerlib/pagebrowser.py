@@ -18,13 +18,13 @@ from __future__ import annotations
 import logging
 import platform
 
-from PyQt5 import QtCore, QtGui, QtWidgets, uic
+from PyQt5 import QtCore, QtWidgets, uic
 
 from comicapi.comicarchive import ComicArchive
 from comicapi.genericmetadata import GenericMetadata
 from comictaggerlib.coverimagewidget import CoverImageWidget
-from comictaggerlib.graphics import graphics_path
 from comictaggerlib.ui import ui_path
+from comictaggerlib.ui.qtutils import get_icon
 
 logger = logging.getLogger(__name__)
 
@@ -60,8 +60,8 @@ class PageBrowserWindow(QtWidgets.QDialog):
             self.btnPrev.setText("<<")
             self.btnNext.setText(">>")
         else:
-            self.btnPrev.setIcon(QtGui.QIcon(str(graphics_path / "left.png")))
-            self.btnNext.setIcon(QtGui.QIcon(str(graphics_path / "right.png")))
+            self.btnPrev.setIcon(get_icon("left.png"))
+            self.btnNext.setIcon(get_icon("right.png"))
 
         self.btnNext.clicked.connect(self.next_page)
         self.btnPrev.clicked.connect(self.prev_page)
@@ -20,7 +20,7 @@ import logging
 from collections import deque
 
 import natsort
-from PyQt5 import QtCore, QtGui, QtWidgets, uic
+from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtCore import QUrl, pyqtSignal
 
 from comicapi import utils
@@ -32,8 +32,8 @@ from comictaggerlib.issueidentifier import IssueIdentifier
 from comictaggerlib.issueselectionwindow import IssueSelectionWindow
 from comictaggerlib.matchselectionwindow import MatchSelectionWindow
 from comictaggerlib.progresswindow import IDProgressWindow
-from comictaggerlib.ui import ui_path
 from comictaggerlib.ui.qtutils import new_web_view, reduce_widget_font_size
+from comictaggerlib.ui.seriesselectionwindow_ui import Ui_SeriesSelectionWindow
 from comictalker.comictalker import ComicTalker, TalkerError
 
 logger = logging.getLogger(__name__)
@@ -96,7 +96,7 @@ class IdentifyThread(QtCore.QThread):
         self.identifyComplete.emit()
 
 
-class SeriesSelectionWindow(QtWidgets.QDialog):
+class SeriesSelectionWindow(QtWidgets.QDialog, Ui_SeriesSelectionWindow):
     def __init__(
         self,
         parent: QtWidgets.QWidget,
@@ -113,8 +113,7 @@ class SeriesSelectionWindow(QtWidgets.QDialog):
     ) -> None:
         super().__init__(parent)
 
-        with (ui_path / "seriesselectionwindow.ui").open(encoding="utf-8") as uifile:
-            uic.loadUi(uifile, self)
+        self.setupUi(self)
 
         self.imageWidget = CoverImageWidget(
             self.imageContainer, CoverImageWidget.URLMode, config.Runtime_Options__config.user_cache_dir, talker
@@ -18,12 +18,12 @@ from __future__ import annotations
 import html
 import logging
 import os
-import pathlib
 import platform
-from typing import Any, cast
+import textwrap
+from typing import Any, Callable, cast
 
 import settngs
-from PyQt5 import QtCore, QtGui, QtWidgets, uic
+from PyQt5 import QtCore, QtWidgets
 
 import comictaggerlib.ui.talkeruigenerator
 from comicapi import utils
@@ -33,12 +33,20 @@ from comictaggerlib.ctsettings import ct_ns
 from comictaggerlib.ctversion import version
 from comictaggerlib.filerenamer import FileRenamer, Replacement, Replacements
 from comictaggerlib.imagefetcher import ImageFetcher
-from comictaggerlib.ui import ui_path
+from comictaggerlib.ui.qtutils import get_int_validator
+from comictaggerlib.ui.settingswindow_ui import Ui_SettingsWindow
+from comictaggerlib.ui.templatehelp_ui import Ui_TemplateHelpWindow
 from comictalker.comiccacher import ComicCacher
 from comictalker.comictalker import ComicTalker
 
 logger = logging.getLogger(__name__)
 
+SYSTEM = platform.system()
+
+# macOS apps conventionally call their settings "Preferences"
+settings_name = "Preferences" if SYSTEM == "Darwin" else "Settings"
+settings_name_lower = settings_name.casefold()
+
 windowsRarHelp = """
                 <html><head/><body><p>To write to CBR/RAR archives,
                 you will need to have the tools from
@@ -65,6 +73,28 @@ macRarHelp = """
                 </p>Once homebrew is installed, run: <b>brew install caskroom/cask/rar</b></body></html>
                 """
 
+# Name filters for the programs select_file can look for, anything else is a library
+windows_file_filters = {"RAR": "Rar Program (Rar.exe)"}
+
+rar_help = {
+    system: textwrap.dedent(text).strip()
+    for system, text in (("Windows", windowsRarHelp), ("Linux", linuxRarHelp), ("Darwin", macRarHelp))
+}
+
+nmit_tip = """<html>The <b>Name Match Ratio Threshold: Auto-Identify</b> is for eliminating automatic
+search matches that are too long compared to your series name search. The lower
+it is, the more likely to have a good match, but each search will take longer and
+use more bandwidth. Too high, and only the very closest matches will be explored.</html>"""
+
+nmst_tip = """<html>The <b>Name Match Ratio Threshold: Search</b> is for reducing the total
+number of results that are returned from a search. The lower it is, the more pages will
+be returned (max 5 pages or 500 results)</html>"""
+
+pbl_tip = """<html>
+The <b>Publisher Filter</b> is for eliminating automatic matches to certain publishers
+that you know are incorrect. Useful for avoiding international re-prints with same
+covers or series names. Enter publisher names separated by commas.
+</html>"""
 
 template_tooltip = """
 The template for the new filename. Uses python format strings https://docs.python.org/3/library/string.html#format-string-syntax
@@ -131,15 +161,49 @@ Spider-Geddon 1 (2018)
 Spider-Geddon #1 - New Players; Check In
 """
 
-
-class SettingsWindow(QtWidgets.QDialog):
+template_tooltip_html = f"<pre>{html.escape(template_tooltip)}</pre>"
+
+
+# (widget, setting, kind) copied between the form and the settings, kind is "check", "value" or "text"
+form_fields = (
+    ("cbxCheckForNewVersion", "General__check_for_new_version", "check"),
+    ("sbNameMatchIdentifyThresh", "Issue_Identifier__series_match_identify_thresh", "value"),
+    ("sbNameMatchSearchThresh", "Issue_Identifier__series_match_search_thresh", "value"),
+    ("cbxClearFormBeforePopulating", "Issue_Identifier__clear_form_before_populating", "check"),
+    ("cbxUseFilter", "Issue_Identifier__always_use_publisher_filter", "check"),
+    ("cbxSortByYear", "Issue_Identifier__sort_series_by_year", "check"),
+    ("cbxExactMatches", "Issue_Identifier__exact_series_matches_first", "check"),
+    ("cbxComplicatedParser", "Filename_Parsing__complicated_parser", "check"),
+    ("cbxRemoveC2C", "Filename_Parsing__remove_c2c", "check"),
+    ("cbxRemoveFCBD", "Filename_Parsing__remove_fcbd", "check"),
+    ("cbxRemovePublisher", "Filename_Parsing__remove_publisher", "check"),
+    ("cbxProtofoliusIssueNumberScheme", "Filename_Parsing__protofolius_issue_number_scheme", "check"),
+    ("cbxAllowIssueStartWithLetter", "Filename_Parsing__allow_issue_start_with_letter", "check"),
+    ("cbxAssumeLoneCreditIsPrimary", "Comic_Book_Lover__assume_lone_credit_is_primary", "check"),
+    ("cbxCopyCharactersToTags", "Comic_Book_Lover__copy_characters_to_tags", "check"),
+    ("cbxCopyTeamsToTags", "Comic_Book_Lover__copy_teams_to_tags", "check"),
+    ("cbxCopyLocationsToTags", "Comic_Book_Lover__copy_locations_to_tags", "check"),
+    ("cbxCopyStoryArcsToTags", "Comic_Book_Lover__copy_storyarcs_to_tags", "check"),
+    ("cbxCopyNotesToComments", "Comic_Book_Lover__copy_notes_to_comments", "check"),
+    ("cbxCopyWebLinkToComments", "Comic_Book_Lover__copy_weblink_to_comments", "check"),
+    ("cbxApplyCBLTransformOnCVIMport", "Comic_Book_Lover__apply_transform_on_import", "check"),
+    ("cbxApplyCBLTransformOnBatchOperation", "Comic_Book_Lover__apply_transform_on_bulk_operation", "check"),
+    ("leRenameTemplate", "File_Rename__template", "text"),
+    ("cbxSmartCleanup", "File_Rename__use_smart_string_cleanup", "check"),
+    ("cbxChangeExtension", "File_Rename__set_extension_based_on_archive", "check"),
+    ("cbxMoveFiles", "File_Rename__move_to_dir", "check"),
+    ("leDirectory", "File_Rename__dir", "text"),
+    ("cbxRenameStrict", "File_Rename__strict", "check"),
+)
+
+
+class SettingsWindow(QtWidgets.QDialog, Ui_SettingsWindow):
     def __init__(
         self, parent: QtWidgets.QWidget, config: settngs.Config[ct_ns], talkers: dict[str, ComicTalker]
     ) -> None:
         super().__init__(parent)
 
-        with (ui_path / "settingswindow.ui").open(encoding="utf-8") as uifile:
-            uic.loadUi(uifile, self)
+        self.setupUi(self)
 
         self.setWindowFlags(
             QtCore.Qt.WindowType(self.windowFlags() & ~QtCore.Qt.WindowType.WindowContextHelpButtonHint)
@@ -147,55 +211,85 @@ class SettingsWindow(QtWidgets.QDialog):
 
         self.config = config
         self.talkers = talkers
-        self.name = "Settings"
+        self.name = settings_name
 
-        if platform.system() == "Windows":
-            self.lblRarHelp.setText(windowsRarHelp)
+        # Kept for the life of the window so clearing the cache again does not set them up again
+        cache_dir = self.config[0].Runtime_Options__config.user_cache_dir
+        self.image_fetcher = ImageFetcher(cache_dir)
+        self.comic_cacher = ComicCacher(cache_dir, version)
 
-        elif platform.system() == "Linux":
-            self.lblRarHelp.setText(linuxRarHelp)
+        if SYSTEM in rar_help:
+            self.lblRarHelp.setText(rar_help[SYSTEM])
 
-        elif platform.system() == "Darwin":
+        if SYSTEM == "Darwin":
             self.leRarExePath.setReadOnly(False)
 
-            self.lblRarHelp.setText(macRarHelp)
-            self.name = "Preferences"
-
-        self.setWindowTitle("ComicTagger " + self.name)
-        self.lblDefaultSettings.setText("Revert to default " + self.name.casefold())
-        self.btnResetSettings.setText("Default " + self.name)
-
-        nmit_tip = """<html>The <b>Name Match Ratio Threshold: Auto-Identify</b> is for eliminating automatic
-                search matches that are too long compared to your series name search. The lower
-                it is, the more likely to have a good match, but each search will take longer and
-                use more bandwidth. Too high, and only the very closest matches will be explored.</html>"""
-        nmst_tip = """<html>The <b>Name Match Ratio Threshold: Search</b> is for reducing the total
-                number of results that are returned from a search. The lower it is, the more pages will
-                be returned (max 5 pages or 500 results)</html>"""
+        self.setWindowTitle(f"ComicTagger {settings_name}")
+        self.lblDefaultSettings.setText(f"Revert to default {settings_name_lower}")
+        self.btnResetSettings.setText(f"Default {settings_name}")
 
         self.sbNameMatchIdentifyThresh.setToolTip(nmit_tip)
         self.sbNameMatchSearchThresh.setToolTip(nmst_tip)
-
-        pbl_tip = """<html>
-            The <b>Publisher Filter</b> is for eliminating automatic matches to certain publishers
-            that you know are incorrect. Useful for avoiding international re-prints with same
-            covers or series names. Enter publisher names separated by commas.
-            </html>"""
         self.tePublisherFilter.setToolTip(pbl_tip)
 
-        validator = QtGui.QIntValidator(1, 4, self)
-        self.leIssueNumPadding.setValidator(validator)
+        self.leIssueNumPadding.setValidator(get_int_validator(1, 4))
 
-        self.leRenameTemplate.setToolTip(f"<pre>{html.escape(template_tooltip)}</pre>")
+        self.leRenameTemplate.setToolTip(template_tooltip_html)
         self.rename_error: Exception | None = None
+        self.template_help_win: TemplateHelpWindow | None = None
+        # Reused by every rename test, only its settings change
+        self.renamer = FileRenamer(md_test)
+        self.rename_settings: tuple[str, int, bool, bool, str, Replacements] | None = None
+        self.dir_settings: tuple[bool, str] | None = None
+
+        # Coalesce bursts of edits so the rename and directory tests only run once typing pauses
+        self.rename_timer = QtCore.QTimer(self)
+        self.rename_timer.setSingleShot(True)
+        self.rename_timer.setInterval(150)
+        self.rename_timer.timeout.connect(self.rename_test)
+        self.dir_timer = QtCore.QTimer(self)
+        self.dir_timer.setSingleShot(True)
+        self.dir_timer.setInterval(150)
+        self.dir_timer.timeout.connect(self.dir_test)
+
+        # (widget, signal, slot) connected in connect_signals, the widgets are blocked while settings_to_form runs
+        self.signals: tuple[tuple[QtWidgets.QWidget, str, Callable[..., Any]], ...] = (
+            (self.btnBrowseRar, "clicked", self.select_rar),
+            (self.btnClearCache, "clicked", self.clear_cache),
+            (self.btnResetSettings, "clicked", self.reset_settings),
+            (self.btnTemplateHelp, "clicked", self.show_template_help),
+            (self.cbxMoveFiles, "clicked", self.dir_test),
+            (self.leDirectory, "textEdited", self.schedule_dir_test),
+            (self.cbxComplicatedParser, "clicked", self.switch_parser),
+            (self.btnAddLiteralReplacement, "clicked", self.addLiteralReplacement),
+            (self.btnAddValueReplacement, "clicked", self.addValueReplacement),
+            (self.btnRemoveLiteralReplacement, "clicked", self.removeLiteralReplacement),
+            (self.btnRemoveValueReplacement, "clicked", self.removeValueReplacement),
+            (self.leRenameTemplate, "textEdited", self.schedule_rename_test),
+            (self.cbxMoveFiles, "clicked", self.rename_test),
+            (self.cbxRenameStrict, "clicked", self.rename_test),
+            (self.cbxSmartCleanup, "clicked", self.rename_test),
+            (self.cbxChangeExtension, "clicked", self.rename_test),
+            (self.leIssueNumPadding, "textEdited", self.schedule_rename_test),
+            (self.twLiteralReplacements, "cellChanged", self.schedule_rename_test),
+            (self.twValueReplacements, "cellChanged", self.schedule_rename_test),
+            (self.leFilenameParserTest, "textEdited", self.filename_parser_test),
+            (self.cbxRemoveC2C, "clicked", self.filename_parser_test),
+            (self.cbxRemoveFCBD, "clicked", self.filename_parser_test),
+            (self.cbxRemovePublisher, "clicked", self.filename_parser_test),
+            (self.cbxProtofoliusIssueNumberScheme, "clicked", self.filename_parser_test),
+            (self.cbxProtofoliusIssueNumberScheme, "clicked", self.protofolius_clicked),
+            (self.cbxAllowIssueStartWithLetter, "clicked", self.filename_parser_test),
+            (self.cbxSplitWords, "clicked", self.filename_parser_test),
+        )
 
         self.sources = comictaggerlib.ui.talkeruigenerator.generate_source_option_tabs(
             self.tComicTalkers, self.config, self.talkers
         )
         self.connect_signals()
         self.settings_to_form()
-        self.rename_test()
-        self.dir_test()
+        # None when the settings must be saved regardless of the form e.g. after they have been reset
+        self.initial_form_state: tuple[Any, ...] | None = self.form_state()
         self.leFilenameParserTest.setText(self.lblRenameTest.text())
         self.filename_parser_test()
 
@@ -203,63 +297,8 @@ class SettingsWindow(QtWidgets.QDialog):
         self.tabWidget.setCurrentIndex(0)
 
     def connect_signals(self) -> None:
-        self.btnBrowseRar.clicked.connect(self.select_rar)
-        self.btnClearCache.clicked.connect(self.clear_cache)
-        self.btnResetSettings.clicked.connect(self.reset_settings)
-        self.btnTemplateHelp.clicked.connect(self.show_template_help)
-        self.cbxMoveFiles.clicked.connect(self.dir_test)
-        self.leDirectory.textEdited.connect(self.dir_test)
-        self.cbxComplicatedParser.clicked.connect(self.switch_parser)
-
-        self.btnAddLiteralReplacement.clicked.connect(self.addLiteralReplacement)
-        self.btnAddValueReplacement.clicked.connect(self.addValueReplacement)
-        self.btnRemoveLiteralReplacement.clicked.connect(self.removeLiteralReplacement)
-        self.btnRemoveValueReplacement.clicked.connect(self.removeValueReplacement)
-
-        self.leRenameTemplate.textEdited.connect(self.rename_test)
-        self.cbxMoveFiles.clicked.connect(self.rename_test)
-        self.cbxRenameStrict.clicked.connect(self.rename_test)
-        self.cbxSmartCleanup.clicked.connect(self.rename_test)
-        self.cbxChangeExtension.clicked.connect(self.rename_test)
-        self.leIssueNumPadding.textEdited.connect(self.rename_test)
-        self.twLiteralReplacements.cellChanged.connect(self.rename_test)
-        self.twValueReplacements.cellChanged.connect(self.rename_test)
-
-        self.leFilenameParserTest.textEdited.connect(self.filename_parser_test)
-        self.cbxRemoveC2C.clicked.connect(self.filename_parser_test)
-        self.cbxRemoveFCBD.clicked.connect(self.filename_parser_test)
-        self.cbxRemovePublisher.clicked.connect(self.filename_parser_test)
-        self.cbxProtofoliusIssueNumberScheme.clicked.connect(self.filename_parser_test)
-        self.cbxProtofoliusIssueNumberScheme.clicked.connect(self.protofolius_clicked)
-        self.cbxAllowIssueStartWithLetter.clicked.connect(self.filename_parser_test)
-        self.cbxSplitWords.clicked.connect(self.filename_parser_test)
-
-    def disconnect_signals(self) -> None:
-        self.btnAddLiteralReplacement.clicked.disconnect()
-        self.btnAddValueReplacement.clicked.disconnect()
-        self.btnBrowseRar.clicked.disconnect()
-        self.btnClearCache.clicked.disconnect()
-        self.btnRemoveLiteralReplacement.clicked.disconnect()
-        self.btnRemoveValueReplacement.clicked.disconnect()
-        self.btnResetSettings.clicked.disconnect()
-        self.btnTemplateHelp.clicked.disconnect()
-        self.cbxChangeExtension.clicked.disconnect()
-        self.cbxComplicatedParser.clicked.disconnect()
-        self.cbxMoveFiles.clicked.disconnect()
-        self.cbxRenameStrict.clicked.disconnect()
-        self.cbxSmartCleanup.clicked.disconnect()
-        self.leDirectory.textEdited.disconnect()
-        self.leIssueNumPadding.textEdited.disconnect()
-        self.leRenameTemplate.textEdited.disconnect()
-        self.twLiteralReplacements.cellChanged.disconnect()
-        self.twValueReplacements.cellChanged.disconnect()
-        self.leFilenameParserTest.textEdited.disconnect()
-        self.cbxRemoveC2C.clicked.disconnect()
-        self.cbxRemoveFCBD.clicked.disconnect()
-        self.cbxRemovePublisher.clicked.disconnect()
-        self.cbxProtofoliusIssueNumberScheme.clicked.disconnect()
-        self.cbxAllowIssueStartWithLetter.clicked.disconnect()
-        self.cbxSplitWords.clicked.disconnect()
+        for widget, signal, slot in self.signals:
+            getattr(widget, signal).connect(slot)
 
     def protofolius_clicked(self, *args: Any, **kwargs: Any) -> None:
         if self.cbxProtofoliusIssueNumberScheme.isChecked():
@@ -313,43 +352,67 @@ class SettingsWindow(QtWidgets.QDialog):
     def removeLiteralReplacement(self) -> None:
         if self.twLiteralReplacements.currentRow() >= 0:
             self.twLiteralReplacements.removeRow(self.twLiteralReplacements.currentRow())
+            self.schedule_rename_test()
 
     def removeValueReplacement(self) -> None:
         if self.twValueReplacements.currentRow() >= 0:
             self.twValueReplacements.removeRow(self.twValueReplacements.currentRow())
+            self.schedule_rename_test()
 
     def insertRow(self, table: QtWidgets.QTableWidget, row: int, replacement: Replacement) -> None:
-        find, replace, strict_only = replacement
-        table.insertRow(row)
-        table.setItem(row, 0, QtWidgets.QTableWidgetItem(find))
-        table.setItem(row, 1, QtWidgets.QTableWidgetItem(replace))
-        tmp = QtWidgets.QTableWidgetItem()
-        if strict_only:
-            tmp.setCheckState(QtCore.Qt.Checked)
+        if row >= table.rowCount():
+            table.setRowCount(row + 1)
         else:
-            tmp.setCheckState(QtCore.Qt.Unchecked)
-        table.setItem(row, 2, tmp)
+            table.insertRow(row)
+        self.set_row(table, row, replacement)
 
-    def rename_test(self, *args: Any, **kwargs: Any) -> None:
-        self._rename_test(self.leRenameTemplate.text())
+    def set_row(self, table: QtWidgets.QTableWidget, row: int, replacement: Replacement) -> None:
+        find, replace, strict_only = replacement
+        strict = QtWidgets.QTableWidgetItem()
+        strict.setCheckState(QtCore.Qt.Checked if strict_only else QtCore.Qt.Unchecked)
+        for column, item in enumerate((QtWidgets.QTableWidgetItem(find), QtWidgets.QTableWidgetItem(replace), strict)):
+            table.setItem(row, column, item)
 
-    def dir_test(self) -> None:
-        self.lblDir.setText(
-            str(pathlib.Path(self.leDirectory.text().strip()).resolve()) if self.cbxMoveFiles.isChecked() else ""
-        )
+    def schedule_rename_test(self, *args: Any) -> None:
+        self.rename_timer.start()
+
+    def schedule_dir_test(self, *args: Any) -> None:
+        self.dir_timer.start()
 
-    def _rename_test(self, template: str) -> None:
+    def dir_test(self) -> None:
+        move = self.cbxMoveFiles.isChecked()
+        directory = self.leDirectory.text().strip()
+        # The label is still current if neither the checkbox nor the directory changed
+        dir_settings = (move, directory)
+        if dir_settings == self.dir_settings:
+            return
+        self.dir_settings = dir_settings
+
+        self.lblDir.setText(os.path.abspath(directory) if move else "")
+
+    def rename_test(self, *args: Any) -> None:
+        template = self.leRenameTemplate.text()
         if not str(self.leIssueNumPadding.text()).isdigit():
             self.leIssueNumPadding.setText("0")
-        fr = FileRenamer(
-            md_test,
-            platform="universal" if self.cbxRenameStrict.isChecked() else "auto",
-            replacements=self.get_replacements(),
-        )
-        fr.move = self.cbxMoveFiles.isChecked()
+        padding = int(self.leIssueNumPadding.text())
+        smart_cleanup = self.cbxSmartCleanup.isChecked()
+        move = self.cbxMoveFiles.isChecked()
+        rename_platform = "universal" if self.cbxRenameStrict.isChecked() else "auto"
+        replacements = self.get_replacements()
+
+        # The preview and rename_error are still current if nothing changed since the last test
+        rename_settings = (template, padding, smart_cleanup, move, rename_platform, replacements)
+        if rename_settings == self.rename_settings:
+            return
+        self.rename_settings = rename_settings
+
+        fr = self.renamer
         fr.set_template(template)
-        fr.set_issue_zero_padding(int(self.leIssueNumPadding.text()))
-        fr.set_smart_cleanup(self.cbxSmartCleanup.isChecked())
+        fr.set_issue_zero_padding(padding)
+        fr.set_smart_cleanup(smart_cleanup)
+        fr.move = move
+        fr.platform = rename_platform
+        fr.replacements = replacements
         try:
             self.lblRenameTest.setText(fr.determine_name(".cbz"))
             self.rename_error = None
@@ -365,97 +428,104 @@ class SettingsWindow(QtWidgets.QDialog):
         self.cbxRemovePublisher.setEnabled(complicated)
         self.filename_parser_test()
 
+    def rar_setting(self) -> str | None:
+        """Returns the name of the rar archiver's executable setting, None if there is no rar archiver"""
+        archiver = self.config[1].get("archiver")
+        if archiver is not None and "rar" in archiver.v:
+            return archiver.v["rar"].internal_name
+        return None
+
     def settings_to_form(self) -> None:
-        self.disconnect_signals()
+        # Filling in the form would otherwise run the tests once for every changed widget
+        blockers = [QtCore.QSignalBlocker(widget) for widget in dict.fromkeys(w for w, _, _ in self.signals)]
+        values = self.config[0]
         # Copy values from settings to form
-        if "archiver" in self.config[1] and "rar" in self.config[1]["archiver"].v:
-            self.leRarExePath.setText(getattr(self.config[0], self.config[1]["archiver"].v["rar"].internal_name))
+        rar_setting = self.rar_setting()
+        if rar_setting is not None:
+            self.leRarExePath.setText(getattr(values, rar_setting))
         else:
             self.leRarExePath.setEnabled(False)
-        self.sbNameMatchIdentifyThresh.setValue(self.config[0].Issue_Identifier__series_match_identify_thresh)
-        self.sbNameMatchSearchThresh.setValue(self.config[0].Issue_Identifier__series_match_search_thresh)
-        self.tePublisherFilter.setPlainText("\n".join(self.config[0].Issue_Identifier__publisher_filter))
-
-        self.cbxCheckForNewVersion.setChecked(self.config[0].General__check_for_new_version)
-
-        self.cbxComplicatedParser.setChecked(self.config[0].Filename_Parsing__complicated_parser)
-        self.cbxRemoveC2C.setChecked(self.config[0].Filename_Parsing__remove_c2c)
-        self.cbxRemoveFCBD.setChecked(self.config[0].Filename_Parsing__remove_fcbd)
-        self.cbxRemovePublisher.setChecked(self.config[0].Filename_Parsing__remove_publisher)
-        self.cbxProtofoliusIssueNumberScheme.setChecked(
-            self.config[0].Filename_Parsing__protofolius_issue_number_scheme
-        )
-        self.cbxAllowIssueStartWithLetter.setChecked(self.config[0].Filename_Parsing__allow_issue_start_with_letter)
+        for widget, setting, kind in form_fields:
+            self.load_field(widget, setting, kind)
+        self.tePublisherFilter.setPlainText("\n".join(values.Issue_Identifier__publisher_filter))
+        self.leIssueNumPadding.setText(str(values.File_Rename__issue_number_padding))
 
         self.switch_parser()
 
-        self.cbxClearFormBeforePopulating.setChecked(self.config[0].Issue_Identifier__clear_form_before_populating)
-        self.cbxUseFilter.setChecked(self.config[0].Issue_Identifier__always_use_publisher_filter)
-        self.cbxSortByYear.setChecked(self.config[0].Issue_Identifier__sort_series_by_year)
-        self.cbxExactMatches.setChecked(self.config[0].Issue_Identifier__exact_series_matches_first)
-
-        self.cbxAssumeLoneCreditIsPrimary.setChecked(self.config[0].Comic_Book_Lover__assume_lone_credit_is_primary)
-        self.cbxCopyCharactersToTags.setChecked(self.config[0].Comic_Book_Lover__copy_characters_to_tags)
-        self.cbxCopyTeamsToTags.setChecked(self.config[0].Comic_Book_Lover__copy_teams_to_tags)
-        self.cbxCopyLocationsToTags.setChecked(self.config[0].Comic_Book_Lover__copy_locations_to_tags)
-        self.cbxCopyStoryArcsToTags.setChecked(self.config[0].Comic_Book_Lover__copy_storyarcs_to_tags)
-        self.cbxCopyNotesToComments.setChecked(self.config[0].Comic_Book_Lover__copy_notes_to_comments)
-        self.cbxCopyWebLinkToComments.setChecked(self.config[0].Comic_Book_Lover__copy_weblink_to_comments)
-        self.cbxApplyCBLTransformOnCVIMport.setChecked(self.config[0].Comic_Book_Lover__apply_transform_on_import)
-        self.cbxApplyCBLTransformOnBatchOperation.setChecked(
-            self.config[0].Comic_Book_Lover__apply_transform_on_bulk_operation
-        )
-
-        self.leRenameTemplate.setText(self.config[0].File_Rename__template)
-        self.leIssueNumPadding.setText(str(self.config[0].File_Rename__issue_number_padding))
-        self.cbxSmartCleanup.setChecked(self.config[0].File_Rename__use_smart_string_cleanup)
-        self.cbxChangeExtension.setChecked(self.config[0].File_Rename__set_extension_based_on_archive)
-        self.cbxMoveFiles.setChecked(self.config[0].File_Rename__move_to_dir)
-        self.leDirectory.setText(self.config[0].File_Rename__dir)
-        self.cbxRenameStrict.setChecked(self.config[0].File_Rename__strict)
-
         for table, replacments in zip(
-            (self.twLiteralReplacements, self.twValueReplacements), self.config[0].File_Rename__replacements
+            (self.twLiteralReplacements, self.twValueReplacements), values.File_Rename__replacements
         ):
-            table.clearContents()
-            for i in reversed(range(table.rowCount())):
-                table.removeRow(i)
+            table.setRowCount(0)
+            table.setRowCount(len(replacments))
             for row, replacement in enumerate(replacments):
-                self.insertRow(table, row, replacement)
+                self.set_row(table, row, replacement)
 
         # Set talker values
         comictaggerlib.ui.talkeruigenerator.settings_to_talker_form(self.sources, self.config)
 
-        self.connect_signals()
+        for blocker in blockers:
+            blocker.unblock()
+        self.rename_test()
+        self.dir_test()
 
-    def get_replacements(self) -> Replacements:
-        literal_replacements = []
-        value_replacements = []
-        for row in range(self.twLiteralReplacements.rowCount()):
-            if self.twLiteralReplacements.item(row, 0).text():
-                literal_replacements.append(
-                    Replacement(
-                        self.twLiteralReplacements.item(row, 0).text(),
-                        self.twLiteralReplacements.item(row, 1).text(),
-                        self.twLiteralReplacements.item(row, 2).checkState() == QtCore.Qt.Checked,
-                    )
-                )
-        for row in range(self.twValueReplacements.rowCount()):
-            if self.twValueReplacements.item(row, 0).text():
-                value_replacements.append(
-                    Replacement(
-                        self.twValueReplacements.item(row, 0).text(),
-                        self.twValueReplacements.item(row, 1).text(),
-                        self.twValueReplacements.item(row, 2).checkState() == QtCore.Qt.Checked,
-                    )
+    def load_field(self, widget: str, setting: str, kind: str) -> None:
+        value = getattr(self.config[0], setting)
+        if kind == "check":
+            getattr(self, widget).setChecked(value)
+        elif kind == "value":
+            getattr(self, widget).setValue(value)
+        else:
+            getattr(self, widget).setText(value)
+
+    def field_value(self, widget: str, kind: str) -> Any:
+        if kind == "check":
+            return getattr(self, widget).isChecked()
+        if kind == "value":
+            return getattr(self, widget).value()
+        return getattr(self, widget).text()
+
+    def store_field(self, widget: str, setting: str, kind: str) -> None:
+        value = self.field_value(widget, kind)
+        # Only changed values are written back
+        if getattr(self.config[0], setting) != value:
+            setattr(self.config[0], setting, value)
+
+    def form_state(self) -> tuple[Any, ...]:
+        """Returns everything accept reads from the form, for detecting whether it was changed"""
+        return (
+            *(self.field_value(widget, kind) for widget, _, kind in form_fields),
+            self.tePublisherFilter.toPlainText(),
+            self.leIssueNumPadding.text(),
+            self.leRarExePath.text(),
+            self.get_replacements(),
+            comictaggerlib.ui.talkeruigenerator.talker_form_state(self.sources),
+        )
+
+    def table_replacements(self, table: QtWidgets.QTableWidget) -> list[Replacement]:
+        checked = QtCore.Qt.Checked
+        replacements = []
+        for row in range(table.rowCount()):
+            find = table.item(row, 0).text()
+            if find:
+                replacements.append(
+                    Replacement(find, table.item(row, 1).text(), table.item(row, 2).checkState() == checked)
                 )
-        return Replacements(literal_replacements, value_replacements)
+        return replacements
+
+    def get_replacements(self) -> Replacements:
+        return Replacements(
+            self.table_replacements(self.twLiteralReplacements), self.table_replacements(self.twValueReplacements)
+        )
 
     def accept(self) -> None:
-        self.rename_test()
+        values = self.config[0]
+        # Every other edit has already run the rename test, only a pending one needs to be flushed
+        if self.rename_timer.isActive():
+            self.rename_timer.stop()
+            self.rename_test()
         if self.rename_error is not None:
             if isinstance(self.rename_error, ValueError):
-                logger.exception("Invalid format string: %s", self.config[0].File_Rename__template)
+                logger.exception("Invalid format string: %s", values.File_Rename__template)
                 QtWidgets.QMessageBox.critical(
                     self,
                     "Invalid format string!",
@@ -469,7 +539,7 @@ class SettingsWindow(QtWidgets.QDialog):
                 return
             else:
                 logger.exception(
-                    "Formatter failure: %s metadata: %s", self.config[0].File_Rename__template, self.renamer.metadata
+                    "Formatter failure: %s metadata: %s", values.File_Rename__template, self.renamer.metadata
                 )
                 QtWidgets.QMessageBox.critical(
                     self,
@@ -481,65 +551,32 @@ class SettingsWindow(QtWidgets.QDialog):
                     + "https://github.com/comictagger/comictagger</a>",
                 )
 
+        # Nothing to save if the form is as it was opened
+        if self.form_state() == self.initial_form_state:
+            QtWidgets.QDialog.accept(self)
+            return
+
         # Copy values from form to settings and save
-        if "archiver" in self.config[1] and "rar" in self.config[1]["archiver"].v:
-            setattr(self.config[0], self.config[1]["archiver"].v["rar"].internal_name, str(self.leRarExePath.text()))
+        rar_setting = self.rar_setting()
+        if rar_setting is not None:
+            setattr(values, rar_setting, str(self.leRarExePath.text()))
 
             # make sure rar program is now in the path for the rar class
-            if self.config[0].archiver_rar:  # type: ignore[attr-defined]
+            if values.archiver_rar:  # type: ignore[attr-defined]
                 utils.add_to_path(os.path.dirname(str(self.leRarExePath.text())))
 
-        if not str(self.leIssueNumPadding.text()).isdigit():
-            self.leIssueNumPadding.setText("0")
-
-        self.config[0].General__check_for_new_version = self.cbxCheckForNewVersion.isChecked()
-
-        self.config[0].Issue_Identifier__series_match_identify_thresh = self.sbNameMatchIdentifyThresh.value()
-        self.config[0].Issue_Identifier__series_match_search_thresh = self.sbNameMatchSearchThresh.value()
-        self.config[0].Issue_Identifier__publisher_filter = utils.split(self.tePublisherFilter.toPlainText(), "\n")
-
-        self.config[0].Filename_Parsing__complicated_parser = self.cbxComplicatedParser.isChecked()
-        self.config[0].Filename_Parsing__remove_c2c = self.cbxRemoveC2C.isChecked()
-        self.config[0].Filename_Parsing__remove_fcbd = self.cbxRemoveFCBD.isChecked()
-        self.config[0].Filename_Parsing__remove_publisher = self.cbxRemovePublisher.isChecked()
-        self.config[0].Filename_Parsing__allow_issue_start_with_letter = self.cbxAllowIssueStartWithLetter.isChecked()
-        self.config.values.Filename_Parsing__protofolius_issue_number_scheme = (
-            self.cbxProtofoliusIssueNumberScheme.isChecked()
-        )
-
-        self.config[0].Issue_Identifier__clear_form_before_populating = self.cbxClearFormBeforePopulating.isChecked()
-        self.config[0].Issue_Identifier__always_use_publisher_filter = self.cbxUseFilter.isChecked()
-        self.config[0].Issue_Identifier__sort_series_by_year = self.cbxSortByYear.isChecked()
-        self.config[0].Issue_Identifier__exact_series_matches_first = self.cbxExactMatches.isChecked()
-
-        self.config[0].Comic_Book_Lover__assume_lone_credit_is_primary = self.cbxAssumeLoneCreditIsPrimary.isChecked()
-        self.config[0].Comic_Book_Lover__copy_characters_to_tags = self.cbxCopyCharactersToTags.isChecked()
-        self.config[0].Comic_Book_Lover__copy_teams_to_tags = self.cbxCopyTeamsToTags.isChecked()
-        self.config[0].Comic_Book_Lover__copy_locations_to_tags = self.cbxCopyLocationsToTags.isChecked()
-        self.config[0].Comic_Book_Lover__copy_storyarcs_to_tags = self.cbxCopyStoryArcsToTags.isChecked()
-        self.config[0].Comic_Book_Lover__copy_notes_to_comments = self.cbxCopyNotesToComments.isChecked()
-        self.config[0].Comic_Book_Lover__copy_weblink_to_comments = self.cbxCopyWebLinkToComments.isChecked()
-        self.config[0].Comic_Book_Lover__apply_transform_on_import = self.cbxApplyCBLTransformOnCVIMport.isChecked()
-        self.config.values.Comic_Book_Lover__apply_transform_on_bulk_operation = (
-            self.cbxApplyCBLTransformOnBatchOperation.isChecked()
-        )
-
-        self.config[0].File_Rename__template = str(self.leRenameTemplate.text())
-        self.config[0].File_Rename__issue_number_padding = int(self.leIssueNumPadding.text())
-        self.config[0].File_Rename__use_smart_string_cleanup = self.cbxSmartCleanup.isChecked()
-        self.config[0].File_Rename__set_extension_based_on_archive = self.cbxChangeExtension.isChecked()
-        self.config[0].File_Rename__move_to_dir = self.cbxMoveFiles.isChecked()
-        self.config[0].File_Rename__dir = self.leDirectory.text()
-
-        self.config[0].File_Rename__strict = self.cbxRenameStrict.isChecked()
-        self.config[0].File_Rename__replacements = self.get_replacements()
+        for widget, setting, kind in form_fields:
+            self.store_field(widget, setting, kind)
+        values.Issue_Identifier__publisher_filter = utils.split(self.tePublisherFilter.toPlainText(), "\n")
+        values.File_Rename__issue_number_padding = int(self.leIssueNumPadding.text())
+        values.File_Rename__replacements = self.get_replacements()
 
         # Read settings from talker tabs
         self.config = comictaggerlib.ui.talkeruigenerator.form_settings_to_config(self.sources, self.config)
 
         self.update_talkers_config()
 
-        ctsettings.save_file(self.config, self.config[0].Runtime_Options__config.user_config_dir / "settings.json")
+        ctsettings.save_file(self.config, values.Runtime_Options__config.user_config_dir / "settings.json")
         self.parent().config = self.config
         QtWidgets.QDialog.accept(self)
 
@@ -552,12 +589,13 @@ class SettingsWindow(QtWidgets.QDialog):
         self.select_file(self.leRarExePath, "RAR")
 
     def clear_cache(self) -> None:
-        ImageFetcher(self.config[0].Runtime_Options__config.user_cache_dir).clear_cache()
-        ComicCacher(self.config[0].Runtime_Options__config.user_cache_dir, version).clear_cache()
+        self.image_fetcher.clear_cache()
+        self.comic_cacher.clear_cache()
         QtWidgets.QMessageBox.information(self, self.name, "Cache has been cleared.")
 
     def reset_settings(self) -> None:
         self.config = cast(settngs.Config[ct_ns], settngs.get_namespace(settngs.defaults(self.config[1])))
+        self.initial_form_state = None
         self.settings_to_form()
         QtWidgets.QMessageBox.information(self, self.name, self.name + " have been returned to default values.")
 
@@ -565,20 +603,13 @@ class SettingsWindow(QtWidgets.QDialog):
         dialog = QtWidgets.QFileDialog(self)
         dialog.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFile)
 
-        if platform.system() == "Windows":
-            if name == "RAR":
-                flt = "Rar Program (Rar.exe)"
-            else:
-                flt = "Libraries (*.dll)"
-            dialog.setNameFilter(flt)
+        if SYSTEM == "Windows":
+            dialog.setNameFilter(windows_file_filters.get(name, "Libraries (*.dll)"))
         else:
             dialog.setFilter(QtCore.QDir.Filter.Files)
 
         dialog.setDirectory(os.path.dirname(str(control.text())))
-        if name == "RAR":
-            dialog.setWindowTitle(f"Find {name} program")
-        else:
-            dialog.setWindowTitle(f"Find {name} library")
+        dialog.setWindowTitle(f"Find {name} {'program' if name in windows_file_filters else 'library'}")
 
         if dialog.exec():
             file_list = dialog.selectedFiles()
@@ -588,14 +619,15 @@ class SettingsWindow(QtWidgets.QDialog):
         self.tabWidget.setCurrentIndex(5)
 
     def show_template_help(self) -> None:
-        template_help_win = TemplateHelpWindow(self)
-        template_help_win.setModal(False)
-        template_help_win.show()
+        if self.template_help_win is None:
+            self.template_help_win = TemplateHelpWindow(self)
+            self.template_help_win.setModal(False)
+        self.template_help_win.show()
+        self.template_help_win.raise_()
 
 
-class TemplateHelpWindow(QtWidgets.QDialog):
+class TemplateHelpWindow(QtWidgets.QDialog, Ui_TemplateHelpWindow):
     def __init__(self, parent: QtWidgets.QWidget) -> None:
         super().__init__(parent)
 
-        with (ui_path / "TemplateHelp.ui").open(encoding="utf-8") as uifile:
-            uic.loadUi(uifile, self)
+        self.setupUi(self)
@@ -15,23 +15,25 @@
 # limitations under the License.
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import locale
 import logging
-import operator
 import os
-import pickle
+import pathlib
 import platform
-import pprint
 import re
+import struct
 import sys
+import time
 import webbrowser
 from datetime import datetime
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, TypeVar
 from urllib.parse import urlparse
 
-import natsort
 import settngs
-from PyQt5 import QtCore, QtGui, QtNetwork, QtWidgets, uic
+from PyQt5 import QtCore, QtGui, QtNetwork, QtWidgets
 
 from comicapi import utils
 from comicapi.comicarchive import ComicArchive, MetaDataStyle
@@ -41,41 +43,206 @@ from comicapi.genericmetadata import GenericMetadata
 from comicapi.issuestring import IssueString
 from comictaggerlib import ctsettings, ctversion
 from comictaggerlib.applicationlogwindow import ApplicationLogWindow, QTextEditLogger
-from comictaggerlib.autotagmatchwindow import AutoTagMatchWindow
-from comictaggerlib.autotagprogresswindow import AutoTagProgressWindow
-from comictaggerlib.autotagstartwindow import AutoTagStartWindow
 from comictaggerlib.cbltransformer import CBLTransformer
 from comictaggerlib.coverimagewidget import CoverImageWidget
-from comictaggerlib.crediteditorwindow import CreditEditorWindow
 from comictaggerlib.ctsettings import ct_ns
-from comictaggerlib.exportwindow import ExportConflictOpts, ExportWindow
 from comictaggerlib.fileselectionlist import FileInfo, FileSelectionList
-from comictaggerlib.graphics import graphics_path
-from comictaggerlib.issueidentifier import IssueIdentifier
+from comictaggerlib.log import read_log_tail
 from comictaggerlib.logwindow import LogWindow
-from comictaggerlib.optionalmsgdialog import OptionalMessageDialog
-from comictaggerlib.pagebrowser import PageBrowserWindow
 from comictaggerlib.pagelisteditor import PageListEditor
-from comictaggerlib.renamewindow import RenameWindow
 from comictaggerlib.resulttypes import IssueResult, MultipleMatch, OnlineMatchResults
-from comictaggerlib.seriesselectionwindow import SeriesSelectionWindow
-from comictaggerlib.settingswindow import SettingsWindow
-from comictaggerlib.ui import ui_path
-from comictaggerlib.ui.qtutils import center_window_on_parent, reduce_widget_font_size
-from comictaggerlib.versionchecker import VersionChecker
+from comictaggerlib.ui.qtutils import (
+    center_window_on_parent,
+    get_icon,
+    get_int_validator,
+    get_pixmap,
+    reduce_widget_font_size,
+)
+from comictaggerlib.ui.taggerwindow_ui import Ui_TaggerWindow
 from comictalker.comictalker import ComicTalker, TalkerError
 from comictalker.talker_utils import cleanup_html
 
+# The dialogs that are only opened from a menu or button are imported when they are first used
+if TYPE_CHECKING:
+    from comictaggerlib.autotagprogresswindow import AutoTagProgressWindow
+    from comictaggerlib.autotagstartwindow import AutoTagStartWindow
+    from comictaggerlib.pagebrowser import PageBrowserWindow
+
+try:
+    import win32con
+    import win32gui
+
+    win32_available = True
+except ImportError:
+    win32_available = False
+
 logger = logging.getLogger(__name__)
 
+SYSTEM = platform.system()
+
+leading_numbers = re.compile(r"^[\d.]+")
+
+website = "https://github.com/comictagger/comictagger"
+
+new_version_message = (
+    "New version ({new}) available!<br>(You are currently running {current})<br><br>"
+    f"Visit <a href='{website}/releases/latest'>{website}/releases/latest</a> for more info.<br><br>"
+)
+
 
 def execute(f: Callable[[], Any]) -> None:
     f()
 
 
-class TaggerWindow(QtWidgets.QMainWindow):
+# File lists are sent to an already running instance NUL separated, NUL is the only character a path can't contain
+def encode_file_list(file_list: list[str]) -> bytes:
+    # Prefixed with the payload length so the receiver knows when it has all of it
+    payload = "\0".join(file_list).encode("utf-8", "surrogateescape")
+    return struct.pack(">I", len(payload)) + payload
+
+
+def decode_file_list(data: bytes | bytearray) -> list[str] | None:
+    # Returns None until data holds the whole message
+    if len(data) < 4:
+        return None
+    (length,) = struct.unpack_from(">I", data)
+    if len(data) < 4 + length:
+        return None
+    return [f for f in data[4 : 4 + length].decode("utf-8", "surrogateescape").split("\0") if f]
+
+
+def sort_by_name(items: Iterable[tuple[str | None, str | None]]) -> tuple[tuple[str | None, str | None], ...]:
+    # Country and language names have no numbers in them, a plain collation key sorts them like humansorted does
+    if utils.icu_available:
+        import icu
+
+        collation_key: Callable[[str], Any] = icu.Collator.createInstance(icu.Locale.getDefault()).getSortKey
+    else:
+        collation_key = locale.strxfrm
+    return tuple(sorted(items, key=lambda item: collation_key(item[1] or "")))
+
+
+# The country and language lists never change, sort them once per process instead of for every window
+@functools.cache
+def sorted_countries() -> tuple[tuple[str | None, str | None], ...]:
+    return sort_by_name(utils.countries().items())
+
+
+@functools.cache
+def sorted_languages() -> tuple[tuple[str | None, str | None], ...]:
+    return sort_by_name(utils.languages().items())
+
+
+class TaskSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object)
+
+
+class ArchiveTask(QtCore.QRunnable):
+    """Base for the tasks that run_archive_tasks runs on a thread pool thread, one archive each"""
+
+    def __init__(self, ca: ComicArchive) -> None:
+        super().__init__()
+        # Kept alive by run_archive_tasks until the finished signal has been handled
+        self.setAutoDelete(False)
+        self.ca = ca
+        self.signals = TaskSignals()
+        self.canceled = False
+        # None if the task was canceled before it started
+        self.success: bool | None = None
+
+    def run(self) -> None:
+        if not self.canceled:
+            try:
+                self.success = self.work()
+            except Exception:
+                logger.exception("Failed to process %s", self.ca.path)
+                self.success = False
+        self.signals.finished.emit(self)
+
+    def work(self) -> bool:
+        raise NotImplementedError
+
+
+T = TypeVar("T", bound=ArchiveTask)
+
+
+class ExportTask(ArchiveTask):
+    """Exports a single archive as a zip archive on a thread pool thread"""
+
+    def __init__(self, ca: ComicArchive, export_name: pathlib.Path) -> None:
+        super().__init__(ca)
+        self.export_name = export_name
+
+    def work(self) -> bool:
+        return self.ca.export_as_zip(self.export_name)
+
+
+class TagTask(ArchiveTask):
+    """Removes or copies the tags of a single archive on a thread pool thread"""
+
+    def __init__(self, ca: ComicArchive, update: Callable[[ComicArchive], bool]) -> None:
+        super().__init__(ca)
+        self.update = update
+
+    def work(self) -> bool:
+        success = self.update(self.ca)
+        # Writing clears the archive's cache, only the tag flags are needed to update the file list
+        self.ca.has_cix()
+        self.ca.has_cbi()
+        return success
+
+
+class CoverLoadTask(QtCore.QRunnable):
+    """Reads the metadata and cover image of an archive on a thread pool thread"""
+
+    def __init__(self, ca: ComicArchive, style: int) -> None:
+        super().__init__()
+        # Kept alive by auto_tag until the finished signal has been handled
+        self.setAutoDelete(False)
+        self.ca = ca
+        self.style = style
+        self.signals = TaskSignals()
+        self.md = GenericMetadata()
+        self.image_data = b""
+        # Set on the GUI thread once the finished signal has been handled
+        self.loaded = False
+
+    def run(self) -> None:
+        try:
+            self.md = self.ca.read_metadata(self.style)
+        except Exception as e:
+            logger.error("Failed to load metadata for %s: %s", self.ca.path, e)
+        try:
+            self.image_data = self.ca.get_page(self.md.get_cover_page_index())
+        except Exception:
+            logger.exception("Failed to load the cover of %s", self.ca.path)
+        self.signals.finished.emit(self)
+
+
+class VersionCheckSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(tuple)
+
+
+class VersionCheckTask(QtCore.QRunnable):
+    """Asks GitHub for the latest release on a thread pool thread so startup doesn't wait on the network"""
+
+    def __init__(self, install_id: str) -> None:
+        super().__init__()
+        # Kept alive by TaggerWindow until the finished signal has been handled
+        self.setAutoDelete(False)
+        self.install_id = install_id
+        self.signals = VersionCheckSignals()
+
+    def run(self) -> None:
+        from comictaggerlib.versionchecker import VersionChecker
+
+        self.signals.finished.emit(VersionChecker().get_latest_version(self.install_id))
+
+
+class TaggerWindow(QtWidgets.QMainWindow, Ui_TaggerWindow):
     appName = "ComicTagger"
     version = ctversion.version
+    cix_credits = frozenset(ComicInfoXml().get_parseable_credits())
 
     def __init__(
         self,
@@ -86,24 +253,99 @@ class TaggerWindow(QtWidgets.QMainWindow):
     ) -> None:
         super().__init__(parent)
 
-        with (ui_path / "taggerwindow.ui").open(encoding="utf-8") as uifile:
-            uic.loadUi(uifile, self)
+        self.setupUi(self)
         self.config = config
         self.talkers = talkers
         self.log_window = self.setup_logger()
 
+        # Fields and credits that can't be saved in the current data style are shown in this color
+        self.inactive_color = QtGui.QColor(255, 170, 150)
+        self.inactive_brush = QtGui.QBrush(self.inactive_color)
+        self.active_brush = QtGui.QBrush(self.leSeries.palette().color(QtGui.QPalette.ColorRole.Base))
+        # Bumped whenever a credit role is set, the credit colors only need re-applying when it or the style changes
+        self.credits_version = 0
+        self.credit_colors_state: tuple[int, int] | None = None
+
+        # Fields that only one of the data styles can save, see update_style_tweaks
+        self.cbi_only = (self.leVolumeCount, self.cbCountry, self.teTags)
+        self.cix_only = (
+            self.leImprint,
+            self.teNotes,
+            self.cbBW,
+            self.cbManga,
+            self.leStoryArc,
+            self.leScanInfo,
+            self.leSeriesGroup,
+            self.leAltSeries,
+            self.leAltIssueNum,
+            self.leAltIssueCount,
+            self.leWebLink,
+            self.teCharacters,
+            self.teTeams,
+            self.teLocations,
+            self.cbMaturityRating,
+            self.cbFormat,
+        )
+        self.active_palette = self.leSeries.palette()
+        self.inactive_text_palette = self.leSeries.palette()
+        self.inactive_text_palette.setColor(QtGui.QPalette.ColorRole.Base, self.inactive_color)
+        self.inactive_check_box_palette = self.leSeries.palette()
+        self.inactive_combo_box_palette = self.leSeries.palette()
+        self.inactive_combo_box_palette.setColor(QtGui.QPalette.ColorRole.Base, self.inactive_color)
+        for widget in (*self.cbi_only, *self.cix_only):
+            self.inactive_check_box_palette.setColor(widget.backgroundRole(), self.inactive_color)
+            self.inactive_combo_box_palette.setColor(widget.backgroundRole(), self.inactive_color)
+            self.inactive_combo_box_palette.setColor(widget.foregroundRole(), self.inactive_color)
+
+        # Template for the credits table items, which can be selected but not edited in place
+        self.credit_item = QtWidgets.QTableWidgetItem()
+        self.credit_item.setFlags(QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsEnabled)
+
+        # Actions that only need an archive to be loaded, see update_menus
+        self.archive_actions = (
+            self.actionParse_Filename,
+            self.actionParse_Filename_split_words,
+            self.actionAutoIdentify,
+            self.actionAutoTag,
+            self.actionRename,
+            self.actionApplyCBLTransform,
+            self.actionReCalcPageDims,
+            self.actionRepackage,
+            self.actionRemoveAuto,
+            self.actionRemoveCRTags,
+            self.actionRemoveCBLTags,
+            self.actionCopyTags,
+        )
+        self.menu_state: tuple[bool, bool, bool, bool] | None = None
+        self.last_event_pump = 0.0
+        # Python tasks must not share Qt's global thread pool, Qt uses it to smooth scale images
+        # while the GUI thread holds the GIL and would wait forever for a task that is waiting for the GIL
+        self.task_pool = QtCore.QThreadPool(self)
+
         # prevent multiple instances
         socket = QtNetwork.QLocalSocket(self)
         socket.connectToServer(config[0].internal__install_id)
-        alive = socket.waitForConnected(3000)
+        # A running instance answers almost immediately, don't stall startup on a stale socket
+        alive = socket.waitForConnected(250)
+        if not alive and socket.error() not in (
+            QtNetwork.QLocalSocket.LocalSocketError.ServerNotFoundError,
+            QtNetwork.QLocalSocket.LocalSocketError.ConnectionRefusedError,
+        ):
+            # The socket was not refused, so the instance may only be busy, give it longer so the files still reach it
+            socket.abort()
+            socket.connectToServer(config[0].internal__install_id)
+            alive = socket.waitForConnected(3000)
         if alive:
             logger.setLevel(logging.INFO)
             logger.info("Another application with key [%s] is already running", config[0].internal__install_id)
             # send file list to other instance
             if file_list:
-                socket.write(pickle.dumps(file_list))
-                if not socket.waitForBytesWritten(3000):
-                    logger.error(socket.errorString())
+                socket.write(encode_file_list(file_list))
+                # A long list is written in several chunks, all of it has to be sent before exiting
+                while socket.bytesToWrite():
+                    if not socket.waitForBytesWritten(3000):
+                        logger.error(socket.errorString())
+                        break
             socket.disconnectFromServer()
             sys.exit()
         else:
@@ -112,6 +354,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
             self.socketServer.newConnection.connect(self.on_incoming_socket_connection)
             ok = self.socketServer.listen(config[0].internal__install_id)
             if not ok:
+                # Nothing answered on the socket, even after the longer wait, so it was left behind by a previous instance
                 if self.socketServer.serverError() == QtNetwork.QAbstractSocket.SocketError.AddressInUseError:
                     self.socketServer.removeServer(config[0].internal__install_id)
                     ok = self.socketServer.listen(config[0].internal__install_id)
@@ -132,30 +375,27 @@ class TaggerWindow(QtWidgets.QMainWindow):
         grid_layout = QtWidgets.QGridLayout(self.tabPages)
         grid_layout.addWidget(self.page_list_editor)
 
-        self.fileSelectionList = FileSelectionList(self.widgetListHolder, self.config[0], self.dirty_flag_verification)
+        self.fileSelectionList = FileSelectionList(self.widgetListHolder, self._cfg, self.dirty_flag_verification)
         grid_layout = QtWidgets.QGridLayout(self.widgetListHolder)
         grid_layout.addWidget(self.fileSelectionList)
 
         self.fileSelectionList.selectionChanged.connect(self.file_list_selection_changed)
         self.fileSelectionList.listCleared.connect(self.file_list_cleared)
         self.fileSelectionList.set_sorting(
-            self.config[0].internal__sort_column, QtCore.Qt.SortOrder(self.config[0].internal__sort_direction)
+            self._cfg.internal__sort_column, QtCore.Qt.SortOrder(self._cfg.internal__sort_direction)
         )
 
         # we can't specify relative font sizes in the UI designer, so
-        # walk through all the labels in the main form, and make them
-        # a smidge smaller TODO: there has to be a better way to do this
-        for child in self.scrollAreaWidgetContents.children():
-            if isinstance(child, QtWidgets.QLabel):
-                f = child.font()
-                if f.pointSize() > 10:
-                    f.setPointSize(f.pointSize() - 2)
-                f.setItalic(True)
-                child.setFont(f)
+        # make all the labels in the main form italic and a smidge smaller with one style sheet
+        label_style = "font-style: italic;"
+        point_size = self.scrollAreaWidgetContents.font().pointSize()
+        if point_size > 10:
+            label_style += f" font-size: {point_size - 2}pt;"
+        self.scrollAreaWidgetContents.setStyleSheet(f"#scrollAreaWidgetContents > QLabel {{ {label_style} }}")
 
         self.scrollAreaWidgetContents.adjustSize()
 
-        self.setWindowIcon(QtGui.QIcon(str(graphics_path / "app.png")))
+        self.setWindowIcon(get_icon("app.png"))
 
         if config[0].Runtime_Options__type and isinstance(config[0].Runtime_Options__type[0], int):
             # respect the command line option tag type
@@ -172,26 +412,48 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
         self.page_browser: PageBrowserWindow | None = None
         self.comic_archive: ComicArchive | None = None
+        self.archive_writable = False
+        self.info_box_state: tuple[ComicArchive, pathlib.Path, bool, bool] | None = None
+        # The formatted CBL tags of the last archive viewed, keyed by its path and modification time
+        self.raw_cbl_view: tuple[tuple[pathlib.Path, int], str] | None = None
+        # fix_spaces doesn't touch the parser state so a single instance can be shared
+        self.filename_parser = FileNameParser()
         self.dirty_flag = False
         self.droppedFile = None
         self.page_loader = None
         self.droppedFiles: list[str] = []
         self.metadata = GenericMetadata()
         self.atprogdialog: AutoTagProgressWindow | None = None
+        self.version_check_task: VersionCheckTask | None = None
+        # Filled in by connect_dirty_flag_signals
+        self.dirty_flag_widgets: list[QtWidgets.QWidget] = []
+        self.dirty_flag_signals: list[QtCore.pyqtBoundSignal] = []
+        self.dirty_flag_signals_connected = False
+        self.cover_changed = False
+        self.page_list_timer = QtCore.QTimer(self)
+        self.page_list_timer.setSingleShot(True)
+        self.page_list_timer.setInterval(0)
+        self.page_list_timer.timeout.connect(self.page_list_changed)
+        # A window drag sends a burst of resize events, the form only needs to be laid out for the last one
+        self.form_resize_timer = QtCore.QTimer(self)
+        self.form_resize_timer.setSingleShot(True)
+        self.form_resize_timer.setInterval(16)
+        self.form_resize_timer.timeout.connect(lambda: self.splitter_moved_event(0, 0))
+        # The width the form's vertical scroll bar takes up, kept up to date by form_scroll_range_changed
+        self.form_scrollbar_width = 0
+        form_scrollbar = self.scrollArea.verticalScrollBar()
+        form_scrollbar.rangeChanged.connect(self.form_scroll_range_changed)
+        self.form_scroll_range_changed(form_scrollbar.minimum(), form_scrollbar.maximum())
         self.reset_app()
 
         # set up some basic field validators
-        validator = QtGui.QIntValidator(1900, 2099, self)
-        self.lePubYear.setValidator(validator)
-
-        validator = QtGui.QIntValidator(1, 12, self)
-        self.lePubMonth.setValidator(validator)
+        self.lePubYear.setValidator(get_int_validator(1900, 2099))
+        self.lePubMonth.setValidator(get_int_validator(1, 12))
 
         # TODO: for now keep it simple, ideally we should check the full date
-        validator = QtGui.QIntValidator(1, 31, self)
-        self.lePubDay.setValidator(validator)
+        self.lePubDay.setValidator(get_int_validator(1, 31))
 
-        validator = QtGui.QIntValidator(1, 99999, self)
+        validator = get_int_validator(1, 99999)
         self.leIssueCount.setValidator(validator)
         self.leVolumeNum.setValidator(validator)
         self.leVolumeCount.setValidator(validator)
@@ -221,16 +483,17 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.btnOpenWebLink.clicked.connect(self.open_web_link)
         self.connect_dirty_flag_signals()
         self.page_list_editor.modified.connect(self.set_dirty_flag)
+        # A single page move emits both of these, read the page list back once for the whole change
         self.page_list_editor.firstFrontCoverChanged.connect(self.front_cover_changed)
-        self.page_list_editor.listOrderChanged.connect(self.page_list_order_changed)
+        self.page_list_editor.listOrderChanged.connect(self.page_list_timer.start)
         self.tabWidget.currentChanged.connect(self.tab_changed)
 
         self.update_style_tweaks()
 
         self.show()
         self.set_app_position()
-        if self.config[0].internal__form_width != -1:
-            self.splitter.setSizes([self.config[0].internal__form_width, self.config[0].internal__list_width])
+        if self._cfg.internal__form_width != -1:
+            self.splitter.setSizes([self._cfg.internal__form_width, self._cfg.internal__list_width])
         self.raise_()
         QtCore.QCoreApplication.processEvents()
         self.resizeEvent(None)
@@ -247,7 +510,9 @@ class TaggerWindow(QtWidgets.QMainWindow):
         if len(file_list) != 0:
             self.fileSelectionList.add_path_list(file_list)
 
-        if self.config[0].Dialog_Flags__show_disclaimer:
+        if self._cfg.Dialog_Flags__show_disclaimer:
+            from comictaggerlib.optionalmsgdialog import OptionalMessageDialog
+
             checked = OptionalMessageDialog.msg(
                 self,
                 "Welcome!",
@@ -266,16 +531,28 @@ class TaggerWindow(QtWidgets.QMainWindow):
                 Have fun!
                 """,
             )
-            self.config[0].Dialog_Flags__show_disclaimer = not checked
+            self._cfg.Dialog_Flags__show_disclaimer = not checked
 
-        if self.config[0].General__check_for_new_version:
+        if self._cfg.General__check_for_new_version:
             self.check_latest_version_online()
 
+    @property
+    def config(self) -> settngs.Config[ct_ns]:
+        return self._config
+
+    @config.setter
+    def config(self, config: settngs.Config[ct_ns]) -> None:
+        # The settings window replaces the whole config, keep the namespace used everywhere else in sync
+        self._config = config
+        self._cfg = config[0]
+
     def current_talker(self) -> ComicTalker:
-        if self.config[0].Sources__source in self.talkers:
-            return self.talkers[self.config[0].Sources__source]
-        logger.error("Could not find the '%s' talker", self.config[0].Sources__source)
-        raise SystemExit(2)
+        source = self._cfg.Sources__source
+        talker = self.talkers.get(source)
+        if talker is None:
+            logger.error("Could not find the '%s' talker", source)
+            raise SystemExit(2)
+        return talker
 
     def open_file_event(self, url: QtCore.QUrl) -> None:
         logger.info(url.toLocalFile())
@@ -287,7 +564,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
     def setup_logger(self) -> ApplicationLogWindow:
         try:
-            current_logs = (self.config[0].Runtime_Options__config.user_log_dir / "ComicTagger.log").read_text("utf-8")
+            current_logs = read_log_tail(self._cfg.Runtime_Options__config.user_log_dir / "ComicTagger.log")
         except Exception:
             current_logs = ""
         root_logger = logging.getLogger()
@@ -295,13 +572,16 @@ class TaggerWindow(QtWidgets.QMainWindow):
             QTextEditLogger(logging.Formatter("%(asctime)s | %(name)s | %(levelname)s | %(message)s"), logging.DEBUG),
             parent=self,
         )
-        qapplogwindow.textEdit.append(current_logs.strip())
+        qapplogwindow.textEdit.setPlainText(current_logs.strip())
         root_logger.addHandler(qapplogwindow.log_handler)
         return qapplogwindow
 
     def reset_app(self) -> None:
+        self.page_list_timer.stop()
+        self.cover_changed = False
         self.archiveCoverWidget.clear()
         self.comic_archive = None
+        self.archive_writable = False
         self.dirty_flag = False
         self.clear_form()
         self.page_list_editor.reset_page()
@@ -315,10 +595,8 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.page_loader = None
 
     def update_app_title(self) -> None:
-        self.setWindowIcon(QtGui.QIcon(str(graphics_path / "app.png")))
-
         if self.comic_archive is None:
-            self.setWindowTitle(self.appName)
+            title = self.appName
         else:
             mod_str = ""
             ro_str = ""
@@ -326,10 +604,14 @@ class TaggerWindow(QtWidgets.QMainWindow):
             if self.dirty_flag:
                 mod_str = " [modified]"
 
-            if not self.comic_archive.is_writable():
+            if not self.archive_writable:
                 ro_str = " [read only]"
 
-            self.setWindowTitle(f"{self.appName} - {self.comic_archive.path}{mod_str}{ro_str}")
+            title = f"{self.appName} - {self.comic_archive.path}{mod_str}{ro_str}"
+
+        # The window icon is set once in __init__, only the title changes
+        if title != self.windowTitle():
+            self.setWindowTitle(title)
 
     def config_menus(self) -> None:
         # File Menu
@@ -439,22 +721,22 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.actionComicTaggerForum.triggered.connect(self.show_forum)
 
         # Notes Menu
-        self.btnOpenWebLink.setIcon(QtGui.QIcon(str(graphics_path / "open.png")))
+        self.btnOpenWebLink.setIcon(get_icon("open.png"))
 
         # ToolBar
-        self.actionLoad.setIcon(QtGui.QIcon(str(graphics_path / "open.png")))
-        self.actionLoadFolder.setIcon(QtGui.QIcon(str(graphics_path / "longbox.png")))
-        self.actionOpenFolderAsComic.setIcon(QtGui.QIcon(str(graphics_path / "open.png")))
-        self.actionWrite_Tags.setIcon(QtGui.QIcon(str(graphics_path / "save.png")))
-        self.actionParse_Filename.setIcon(QtGui.QIcon(str(graphics_path / "parse.png")))
-        self.actionParse_Filename_split_words.setIcon(QtGui.QIcon(str(graphics_path / "parse.png")))
-        self.actionSearchOnline.setIcon(QtGui.QIcon(str(graphics_path / "search.png")))
-        self.actionLiteralSearch.setIcon(QtGui.QIcon(str(graphics_path / "search.png")))
-        self.actionAutoIdentify.setIcon(QtGui.QIcon(str(graphics_path / "auto.png")))
-        self.actionAutoTag.setIcon(QtGui.QIcon(str(graphics_path / "autotag.png")))
-        self.actionAutoImprint.setIcon(QtGui.QIcon(str(graphics_path / "autotag.png")))
-        self.actionClearEntryForm.setIcon(QtGui.QIcon(str(graphics_path / "clear.png")))
-        self.actionPageBrowser.setIcon(QtGui.QIcon(str(graphics_path / "browse.png")))
+        self.actionLoad.setIcon(get_icon("open.png"))
+        self.actionLoadFolder.setIcon(get_icon("longbox.png"))
+        self.actionOpenFolderAsComic.setIcon(get_icon("open.png"))
+        self.actionWrite_Tags.setIcon(get_icon("save.png"))
+        self.actionParse_Filename.setIcon(get_icon("parse.png"))
+        self.actionParse_Filename_split_words.setIcon(get_icon("parse.png"))
+        self.actionSearchOnline.setIcon(get_icon("search.png"))
+        self.actionLiteralSearch.setIcon(get_icon("search.png"))
+        self.actionAutoIdentify.setIcon(get_icon("auto.png"))
+        self.actionAutoTag.setIcon(get_icon("autotag.png"))
+        self.actionAutoImprint.setIcon(get_icon("autotag.png"))
+        self.actionClearEntryForm.setIcon(get_icon("clear.png"))
+        self.actionPageBrowser.setIcon(get_icon("browse.png"))
 
         self.toolBar.addAction(self.actionLoad)
         self.toolBar.addAction(self.actionLoadFolder)
@@ -468,14 +750,15 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.toolBar.addAction(self.actionAutoImprint)
 
     def repackage_archive(self) -> None:
+        from comictaggerlib.exportwindow import ExportConflictOpts, ExportWindow
+
         ca_list = self.fileSelectionList.get_selected_archive_list()
         non_zip_count = 0
-        zip_list = []
+        non_zip_list = []
         for ca in ca_list:
             if not ca.is_zip():
                 non_zip_count += 1
-            else:
-                zip_list.append(ca)
+                non_zip_list.append(ca)
 
         if non_zip_count == 0:
             QtWidgets.QMessageBox.information(
@@ -506,70 +789,60 @@ class TaggerWindow(QtWidgets.QMainWindow):
             if not EW.exec():
                 return
 
-            prog_dialog = QtWidgets.QProgressDialog("", "Cancel", 0, non_zip_count, self)
-            prog_dialog.setWindowTitle("Exporting as ZIP")
-            prog_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
-            prog_dialog.setMinimumDuration(300)
-            center_window_on_parent(prog_dialog)
-            QtCore.QCoreApplication.processEvents()
-
-            new_archives_to_add = []
-            archives_to_remove = []
+            # Conflicts are resolved up front so that every export task writes to its own file
+            tasks = []
+            export_names: set[pathlib.Path] = set()
             skipped_list = []
-            failed_list = []
-            success_count = 0
-
-            for prog_idx, ca in enumerate(zip_list, 1):
-                QtCore.QCoreApplication.processEvents()
-                if prog_dialog.wasCanceled():
-                    break
-                prog_dialog.setValue(prog_idx)
-                prog_dialog.setLabelText(str(ca.path))
-                QtCore.QCoreApplication.processEvents()
-
+            for ca in non_zip_list:
                 export_name = ca.path.with_suffix(".cbz")
-                export = True
 
-                if export_name.exists():
+                if export_name.exists() or export_name in export_names:
                     if EW.fileConflictBehavior == ExportConflictOpts.dontCreate:
-                        export = False
                         skipped_list.append(ca.path)
-                    elif EW.fileConflictBehavior == ExportConflictOpts.createUnique:
-                        export_name = utils.unique_file(export_name)
-
-                if export:
-                    if ca.export_as_zip(export_name):
-                        success_count += 1
-                        if EW.addToList:
-                            new_archives_to_add.append(str(export_name))
-                        if EW.deleteOriginal:
-                            archives_to_remove.append(ca)
-                            ca.path.unlink(missing_ok=True)
+                        continue
+                    # Two archives exporting to the same name in this batch always get unique names
+                    if EW.fileConflictBehavior == ExportConflictOpts.createUnique or export_name in export_names:
+                        export_name = utils.unique_file(export_name, export_names)
 
-                    else:
-                        # last export failed, so remove the zip, if it exists
-                        failed_list.append(ca.path)
-                        if export_name.exists():
-                            export_name.unlink(missing_ok=True)
+                export_names.add(export_name)
+                tasks.append(ExportTask(ca, export_name))
 
-            prog_dialog.hide()
-            QtCore.QCoreApplication.processEvents()
-            self.fileSelectionList.add_path_list(new_archives_to_add)
+            new_archives_to_add = []
+            archives_to_remove = []
+
+            def export_finished(task: ExportTask) -> None:
+                if task.success:
+                    if EW.addToList:
+                        new_archives_to_add.append(str(task.export_name))
+                    if EW.deleteOriginal:
+                        archives_to_remove.append(task.ca)
+                        task.ca.path.unlink(missing_ok=True)
+
+                elif task.success is not None:
+                    # last export failed, so remove the zip, if it exists
+                    task.export_name.unlink(missing_ok=True)
+
+            # Exports take long enough that even a single one gets a progress dialog
+            failed_list, success_count = self.run_archive_tasks(
+                tasks, "Exporting as ZIP", export_finished, min_progress_tasks=1
+            )
+
+            if new_archives_to_add:
+                self.fileSelectionList.add_path_list(new_archives_to_add)
             self.fileSelectionList.remove_archive_list(archives_to_remove)
 
-            summary = f"Successfully created {success_count} Zip archive(s)."
+            summary_parts = [f"Successfully created {success_count} Zip archive(s)."]
             if len(skipped_list) > 0:
-                summary += (
+                summary_parts.append(
                     f"\n\nThe following {len(skipped_list)} archive(s) were skipped due to file name conflicts:\n"
                 )
-                for f in skipped_list:
-                    summary += f"\t{f}\n"
+                summary_parts.extend(f"\t{f}\n" for f in skipped_list)
             if len(failed_list) > 0:
-                summary += (
+                summary_parts.append(
                     f"\n\nThe following {len(failed_list)} archive(s) failed to export due to read/write errors:\n"
                 )
-                for f in failed_list:
-                    summary += f"\t{f}\n"
+                summary_parts.extend(f"\t{f}\n" for f in failed_list)
+            summary = "".join(summary_parts)
 
             logger.info(summary)
             dlg = LogWindow(self)
@@ -578,7 +851,6 @@ class TaggerWindow(QtWidgets.QMainWindow):
             dlg.exec()
 
     def about_app(self) -> None:
-        website = "https://github.com/comictagger/comictagger"
         email = "comictagger@gmail.com"
         license_link = "http://www.apache.org/licenses/LICENSE-2.0"
         license_name = "Apache License 2.0"
@@ -586,7 +858,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
         msg_box = QtWidgets.QMessageBox()
         msg_box.setWindowTitle("About " + self.appName)
         msg_box.setTextFormat(QtCore.Qt.TextFormat.RichText)
-        msg_box.setIconPixmap(QtGui.QPixmap(str(graphics_path / "about.png")))
+        msg_box.setIconPixmap(get_pixmap("about.png"))
         msg_box.setText(
             "<br><br><br>"
             + self.appName
@@ -617,12 +889,14 @@ class TaggerWindow(QtWidgets.QMainWindow):
         event.accept()
 
     def actual_load_current_archive(self) -> None:
+        # is_writable hits the filesystem, check it once per load instead of on every title update
+        self.archive_writable = self.comic_archive is not None and self.comic_archive.is_writable()
         if self.metadata.is_empty and self.comic_archive is not None:
             self.metadata = self.comic_archive.metadata_from_filename(
-                self.config[0].Filename_Parsing__complicated_parser,
-                self.config[0].Filename_Parsing__remove_c2c,
-                self.config[0].Filename_Parsing__remove_fcbd,
-                self.config[0].Filename_Parsing__remove_publisher,
+                self._cfg.Filename_Parsing__complicated_parser,
+                self._cfg.Filename_Parsing__remove_c2c,
+                self._cfg.Filename_Parsing__remove_fcbd,
+                self._cfg.Filename_Parsing__remove_publisher,
             )
         if len(self.metadata.pages) == 0 and self.comic_archive is not None:
             self.metadata.set_default_page_list(self.comic_archive.get_number_of_pages())
@@ -642,67 +916,51 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.update_app_title()
 
     def update_cover_image(self) -> None:
-        cover_idx = self.metadata.get_cover_page_index_list()[0]
+        cover_idx = self.metadata.get_cover_page_index()
         if self.comic_archive is not None:
             self.archiveCoverWidget.set_archive(self.comic_archive, cover_idx)
 
     def update_menus(self) -> None:
-        # First just disable all the questionable items
-        self.actionAutoTag.setEnabled(False)
-        self.actionCopyTags.setEnabled(False)
-        self.actionRemoveAuto.setEnabled(False)
-        self.actionRemoveCRTags.setEnabled(False)
-        self.actionRemoveCBLTags.setEnabled(False)
-        self.actionWrite_Tags.setEnabled(False)
-        self.actionRepackage.setEnabled(False)
-        self.actionViewRawCBLTags.setEnabled(False)
-        self.actionViewRawCRTags.setEnabled(False)
-        self.actionParse_Filename.setEnabled(False)
-        self.actionParse_Filename_split_words.setEnabled(False)
-        self.actionAutoIdentify.setEnabled(False)
-        self.actionRename.setEnabled(False)
-        self.actionApplyCBLTransform.setEnabled(False)
-        self.actionReCalcPageDims.setEnabled(False)
-
-        # now, selectively re-enable
-        if self.comic_archive is not None:
-            has_cix = self.comic_archive.has_cix()
-            has_cbi = self.comic_archive.has_cbi()
-
-            self.actionParse_Filename.setEnabled(True)
-            self.actionParse_Filename_split_words.setEnabled(True)
-            self.actionAutoIdentify.setEnabled(True)
-            self.actionAutoTag.setEnabled(True)
-            self.actionRename.setEnabled(True)
-            self.actionApplyCBLTransform.setEnabled(True)
-            self.actionReCalcPageDims.setEnabled(True)
-            self.actionRepackage.setEnabled(True)
-            self.actionRemoveAuto.setEnabled(True)
-            self.actionRemoveCRTags.setEnabled(True)
-            self.actionRemoveCBLTags.setEnabled(True)
-            self.actionCopyTags.setEnabled(True)
-
-            if has_cix:
-                self.actionViewRawCRTags.setEnabled(True)
-            if has_cbi:
-                self.actionViewRawCBLTags.setEnabled(True)
-
-            if self.comic_archive.is_writable():
-                self.actionWrite_Tags.setEnabled(True)
+        ca = self.comic_archive
+        has_archive = ca is not None
+        has_cix = ca is not None and ca.has_cix()
+        has_cbi = ca is not None and ca.has_cbi()
+        writable = has_archive and self.archive_writable
+
+        # Each setEnabled notifies the menus, only touch the actions when something changed
+        menu_state = (has_archive, has_cix, has_cbi, writable)
+        if menu_state == self.menu_state:
+            return
+        self.menu_state = menu_state
+
+        for action in self.archive_actions:
+            action.setEnabled(has_archive)
+        self.actionViewRawCRTags.setEnabled(has_cix)
+        self.actionViewRawCBLTags.setEnabled(has_cbi)
+        self.actionWrite_Tags.setEnabled(writable)
 
     def update_info_box(self) -> None:
         ca = self.comic_archive
 
         if ca is None:
+            self.info_box_state = None
             self.lblFilename.setText("")
             self.lblArchiveType.setText("")
             self.lblTagList.setText("")
             self.lblPageCount.setText("")
             return
 
+        # The archive type and page count don't change for an archive, has_cix/has_cbi are cached by ComicArchive
+        has_cix = ca.has_cix()
+        has_cbi = ca.has_cbi()
+        info_box_state = (ca, ca.path, has_cix, has_cbi)
+        if info_box_state == self.info_box_state:
+            return
+        self.info_box_state = info_box_state
+
         filename = os.path.basename(ca.path)
         filename = os.path.splitext(filename)[0]
-        filename = FileNameParser().fix_spaces(filename, False)
+        filename = self.filename_parser.fix_spaces(filename, False)
 
         self.lblFilename.setText(filename)
 
@@ -712,9 +970,9 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.lblPageCount.setText(page_count)
 
         tag_info = ""
-        if ca.has_cix():
+        if has_cix:
             tag_info = "• ComicRack tags"
-        if ca.has_cbi():
+        if has_cbi:
             if tag_info != "":
                 tag_info += "\n"
             tag_info += "• ComicBookLover tags"
@@ -726,31 +984,39 @@ class TaggerWindow(QtWidgets.QMainWindow):
             self.dirty_flag = True
             self.fileSelectionList.set_modified_flag(True)
             self.update_app_title()
+            self.update_dirty_flag_connections()
 
     def clear_dirty_flag(self) -> None:
         if self.dirty_flag:
             self.dirty_flag = False
             self.fileSelectionList.set_modified_flag(False)
             self.update_app_title()
+            self.update_dirty_flag_connections()
 
     def connect_dirty_flag_signals(self) -> None:
-        # recursively connect the tab form child slots
-        self.connect_child_dirty_flag_signals(self.tabWidget)
-
-    def connect_child_dirty_flag_signals(self, widget: QtCore.QObject) -> None:
-        if isinstance(widget, QtWidgets.QLineEdit):
-            widget.textEdited.connect(self.set_dirty_flag)
-        if isinstance(widget, QtWidgets.QTextEdit):
-            widget.textChanged.connect(self.set_dirty_flag)
-        if isinstance(widget, QtWidgets.QComboBox):
-            widget.currentIndexChanged.connect(self.set_dirty_flag)
-        if isinstance(widget, QtWidgets.QCheckBox):
-            widget.stateChanged.connect(self.set_dirty_flag)
-
-        # recursive call on children
-        for child in widget.children():
-            if child != self.page_list_editor:
-                self.connect_child_dirty_flag_signals(child)
+        # collect the tab form child signals, the page list editor has its own modified signal
+        for widget, signal in (
+            (QtWidgets.QLineEdit, "textEdited"),
+            (QtWidgets.QTextEdit, "textChanged"),
+            (QtWidgets.QComboBox, "currentIndexChanged"),
+            (QtWidgets.QCheckBox, "stateChanged"),
+        ):
+            for child in self.tabWidget.findChildren(widget):
+                if not self.page_list_editor.isAncestorOf(child):
+                    self.dirty_flag_signals.append(getattr(child, signal))
+                    self.dirty_flag_widgets.append(child)
+        self.update_dirty_flag_connections()
+
+    def update_dirty_flag_connections(self) -> None:
+        # Once the form is dirty another edit changes nothing, so stop Qt calling set_dirty_flag on every keystroke
+        connect = not self.dirty_flag
+        if connect != self.dirty_flag_signals_connected:
+            for signal in self.dirty_flag_signals:
+                if connect:
+                    signal.connect(self.set_dirty_flag)
+                else:
+                    signal.disconnect(self.set_dirty_flag)
+            self.dirty_flag_signals_connected = connect
 
     def clear_form(self) -> None:
         # get a minty fresh metadata object
@@ -766,26 +1032,30 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.clear_dirty_flag()
 
     def clear_children(self, widget: QtCore.QObject) -> None:
-        if isinstance(widget, (QtWidgets.QLineEdit, QtWidgets.QTextEdit)):
-            widget.setText("")
-        if isinstance(widget, QtWidgets.QComboBox):
-            widget.setCurrentIndex(0)
-        if isinstance(widget, QtWidgets.QCheckBox):
-            widget.setChecked(False)
-        if isinstance(widget, QtWidgets.QTableWidget):
-            widget.setRowCount(0)
-
-        # recursive call on children
-        for child in widget.children():
-            self.clear_children(child)
+        # Combo boxes first, resetting an editable combo box would refill the line edit inside it
+        for combo_box in widget.findChildren(QtWidgets.QComboBox):
+            combo_box.setCurrentIndex(0)
+        for text_edit in widget.findChildren((QtWidgets.QLineEdit, QtWidgets.QTextEdit)):
+            text_edit.setText("")
+        for check_box in widget.findChildren(QtWidgets.QCheckBox):
+            check_box.setChecked(False)
+        for table in widget.findChildren(QtWidgets.QTableWidget):
+            table.setRowCount(0)
 
     # Copy all of the metadata object into the form.
     # Merging of metadata should be done via the overlay function
+    # The dirty flag isn't touched, callers that changed the metadata set it themselves
     def metadata_to_form(self) -> None:
         def assign_text(field: QtWidgets.QLineEdit | QtWidgets.QTextEdit, value: Any) -> None:
             if value is not None:
-                field.setText(str(value))
-
+                text = str(value)
+                # Most fields are unchanged when metadata is overlaid, skip re-laying out the same text
+                current = field.toPlainText() if isinstance(field, QtWidgets.QTextEdit) else field.text()
+                if current != text:
+                    field.setText(text)
+
+        # Filling in the form would otherwise call set_dirty_flag once for every changed widget
+        blockers = [QtCore.QSignalBlocker(widget) for widget in (*self.dirty_flag_widgets, self.twCredits)]
         md = self.metadata
 
         assign_text(self.leSeries, md.series)
@@ -798,7 +1068,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
         assign_text(self.lePubMonth, md.month)
         assign_text(self.lePubYear, md.year)
         assign_text(self.lePubDay, md.day)
-        assign_text(self.leGenre, ",".join(md.genres))
+        assign_text(self.leGenre, ",".join(sorted(md.genres)))
         assign_text(self.leImprint, md.imprint)
         assign_text(self.teComments, md.description)
         assign_text(self.teNotes, md.notes)
@@ -809,9 +1079,9 @@ class TaggerWindow(QtWidgets.QMainWindow):
         assign_text(self.leAltIssueNum, md.alternate_number)
         assign_text(self.leAltIssueCount, md.alternate_count)
         assign_text(self.leWebLink, md.web_link)
-        assign_text(self.teCharacters, "\n".join(md.characters))
-        assign_text(self.teTeams, "\n".join(md.teams))
-        assign_text(self.teLocations, "\n".join(md.locations))
+        assign_text(self.teCharacters, "\n".join(sorted(md.characters)))
+        assign_text(self.teTeams, "\n".join(sorted(md.teams)))
+        assign_text(self.teLocations, "\n".join(sorted(md.locations)))
 
         self.dsbCriticalRating.setValue(md.critical_rating or 0.0)
 
@@ -832,19 +1102,19 @@ class TaggerWindow(QtWidgets.QMainWindow):
             self.cbMaturityRating.setCurrentIndex(0)
 
         if md.language is not None:
-            i = self.cbLanguage.findData(md.language)
+            i = self.language_indexes.get(md.language, -1)
             self.cbLanguage.setCurrentIndex(i)
         else:
             self.cbLanguage.setCurrentIndex(0)
 
         if md.country is not None:
-            i = self.cbCountry.findText(md.country)
+            i = self.country_indexes.get(md.country, -1)
             self.cbCountry.setCurrentIndex(i)
         else:
             self.cbCountry.setCurrentIndex(0)
 
         if md.manga is not None:
-            i = self.cbManga.findData(md.manga)
+            i = self.manga_indexes.get(md.manga, -1)
             self.cbManga.setCurrentIndex(i)
         else:
             self.cbManga.setCurrentIndex(0)
@@ -854,48 +1124,65 @@ class TaggerWindow(QtWidgets.QMainWindow):
         else:
             self.cbBW.setChecked(False)
 
-        self.teTags.setText(", ".join(md.tags))
+        assign_text(self.teTags, ", ".join(sorted(md.tags)))
 
+        self.twCredits.setUpdatesEnabled(False)
         self.twCredits.setRowCount(0)
 
         if md.credits is not None and len(md.credits) != 0:
             self.twCredits.setSortingEnabled(False)
 
-            for row, credit in enumerate(md.credits):
-                # if the role-person pair already exists, just skip adding it to the list
-                if self.is_dupe_credit(credit["role"].title(), credit["person"]):
-                    continue
-
-                self.add_new_credit_entry(
-                    row, credit["role"].title(), credit["person"], (credit["primary"] if "primary" in credit else False)
+            # if the role-person pair already exists, just skip adding it to the list
+            credits: dict[tuple[str, str], bool] = {}
+            for credit in md.credits:
+                credits.setdefault(
+                    (credit["role"].title(), credit["person"]), (credit["primary"] if "primary" in credit else False)
                 )
 
+            # Only the last primary credit of each role stays primary, same as update_credit_primary_flag
+            primary_rows = {
+                role.casefold(): row for row, ((role, _), primary_flag) in enumerate(credits.items()) if primary_flag
+            }
+
+            # Size the table once instead of inserting a row per credit
+            self.twCredits.setRowCount(len(credits))
+            for row, (role, name) in enumerate(credits):
+                self.set_credit_entry(row, role, name, primary_rows.get(role.casefold()) == row)
+
         self.twCredits.setSortingEnabled(True)
         self.update_credit_colors()
+        self.twCredits.setUpdatesEnabled(True)
+
+        for blocker in blockers:
+            blocker.unblock()
 
     def add_new_credit_entry(self, row: int, role: str, name: str, primary_flag: bool = False) -> None:
         self.twCredits.insertRow(row)
+        self.set_credit_entry(row, role, name)
+        self.update_credit_primary_flag(row, primary_flag)
 
-        item_text = role
-        item = QtWidgets.QTableWidgetItem(item_text)
-        item.setFlags(QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsEnabled)
-        item.setData(QtCore.Qt.ItemDataRole.ToolTipRole, item_text)
+    def set_credit_entry(self, row: int, role: str, name: str, primary_flag: bool = False) -> None:
+        # Fills in a row without checking the other rows for a primary credit with the same role
+        # Copies of credit_item already have the read-only flags set
+        self.credits_version += 1
+        item = QtWidgets.QTableWidgetItem(self.credit_item)
+        item.setText(role)
+        item.setToolTip(role)
         self.twCredits.setItem(row, 1, item)
 
-        item_text = name
-        item = QtWidgets.QTableWidgetItem(item_text)
-        item.setData(QtCore.Qt.ItemDataRole.ToolTipRole, item_text)
-        item.setFlags(QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsEnabled)
+        item = QtWidgets.QTableWidgetItem(self.credit_item)
+        item.setText(name)
+        item.setToolTip(name)
         self.twCredits.setItem(row, 2, item)
 
-        item = QtWidgets.QTableWidgetItem("")
-        item.setFlags(QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsEnabled)
+        item = QtWidgets.QTableWidgetItem(self.credit_item)
+        item.setText("Yes" if primary_flag else "")
         self.twCredits.setItem(row, 0, item)
-        self.update_credit_primary_flag(row, primary_flag)
 
     def is_dupe_credit(self, role: str, name: str) -> bool:
+        item = self.twCredits.item
         for r in range(self.twCredits.rowCount()):
-            if self.twCredits.item(r, 1).text() == role and self.twCredits.item(r, 2).text() == name:
+            if item(r, 2).text() == name and item(r, 1).text() == role:
                 return True
 
         return False
@@ -948,14 +1235,15 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
         md.black_and_white = self.cbBW.isChecked()
 
-        # get the credits from the table
+        # get the credits from the table, reading every row in one pass before building the credits
+        item = self.twCredits.item
+        credit_rows = [
+            (item(row, 0).text() != "", item(row, 1).text(), item(row, 2).text())
+            for row in range(self.twCredits.rowCount())
+        ]
         md.credits = []
-        for row in range(self.twCredits.rowCount()):
-            role = self.twCredits.item(row, 1).text()
-            name = self.twCredits.item(row, 2).text()
-            primary_flag = self.twCredits.item(row, 0).text() != ""
-
-            md.add_credit(name, role, bool(primary_flag))
+        for primary_flag, role, name in credit_rows:
+            md.add_credit(name, role, primary_flag)
 
         md.pages = self.page_list_editor.get_page_list()
         self.metadata = md
@@ -968,15 +1256,19 @@ class TaggerWindow(QtWidgets.QMainWindow):
             # copy the form onto metadata object
             self.form_to_metadata()
             new_metadata = self.comic_archive.metadata_from_filename(
-                self.config[0].Filename_Parsing__complicated_parser,
-                self.config[0].Filename_Parsing__remove_c2c,
-                self.config[0].Filename_Parsing__remove_fcbd,
-                self.config[0].Filename_Parsing__remove_publisher,
+                self._cfg.Filename_Parsing__complicated_parser,
+                self._cfg.Filename_Parsing__remove_c2c,
+                self._cfg.Filename_Parsing__remove_fcbd,
+                self._cfg.Filename_Parsing__remove_publisher,
                 split_words,
             )
             if new_metadata is not None:
+                # Filename metadata has no credits and overlay replaces the other attributes, a shallow copy is enough
+                old_metadata = copy.copy(self.metadata)
                 self.metadata.overlay(new_metadata)
-                self.metadata_to_form()
+                if self.metadata != old_metadata:
+                    self.metadata_to_form()
+                    self.set_dirty_flag()
 
     def use_filename_split(self) -> None:
         self._use_filename(True)
@@ -1007,8 +1299,8 @@ class TaggerWindow(QtWidgets.QMainWindow):
             dialog.setNameFilters(filters)
             dialog.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFiles)
 
-        if self.config[0].internal__last_opened_folder is not None:
-            dialog.setDirectory(self.config[0].internal__last_opened_folder)
+        if self._cfg.internal__last_opened_folder is not None:
+            dialog.setDirectory(self._cfg.internal__last_opened_folder)
         return dialog
 
     def auto_identify_search(self) -> None:
@@ -1022,6 +1314,8 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.query_online(autoselect=False, literal=True)
 
     def query_online(self, autoselect: bool = False, literal: bool = False) -> None:
+        from comictaggerlib.seriesselectionwindow import SeriesSelectionWindow
+
         issue_number = str(self.leIssueNum.text()).strip()
 
         # Only need this check is the source has issue level data.
@@ -1044,6 +1338,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
         issue_count = utils.xlate_int(self.leIssueCount.text())
 
         cover_index_list = self.metadata.get_cover_page_index_list()
+        talker = self.current_talker()
         selector = SeriesSelectionWindow(
             self,
             series_name,
@@ -1052,8 +1347,8 @@ class TaggerWindow(QtWidgets.QMainWindow):
             issue_count,
             cover_index_list,
             self.comic_archive,
-            self.config[0],
-            self.current_talker(),
+            self._cfg,
+            talker,
             autoselect,
             literal,
         )
@@ -1071,7 +1366,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
             self.form_to_metadata()
 
             try:
-                new_metadata = self.current_talker().fetch_comic_data(
+                new_metadata = talker.fetch_comic_data(
                     issue_id=selector.issue_id, series_id=selector.series_id, issue_number=selector.issue_number
                 )
             except TalkerError as e:
@@ -1080,26 +1375,25 @@ class TaggerWindow(QtWidgets.QMainWindow):
             else:
                 QtWidgets.QApplication.restoreOverrideCursor()
                 if new_metadata is not None:
-                    if self.config[0].Comic_Book_Lover__apply_transform_on_import:
-                        new_metadata = CBLTransformer(new_metadata, self.config[0]).apply()
+                    if self._cfg.Comic_Book_Lover__apply_transform_on_import:
+                        new_metadata = CBLTransformer(new_metadata, self._cfg).apply()
 
-                    if self.config[0].Issue_Identifier__clear_form_before_populating:
+                    if self._cfg.Issue_Identifier__clear_form_before_populating:
                         self.clear_form()
 
                     notes = (
-                        f"Tagged with ComicTagger {ctversion.version} using info from {self.current_talker().name} on"
+                        f"Tagged with ComicTagger {ctversion.version} using info from {talker.name} on"
                         f" {datetime.now():%Y-%m-%d %H:%M:%S}.  [Issue ID {new_metadata.issue_id}]"
                     )
                     self.metadata.overlay(
                         new_metadata.replace(
                             notes=utils.combine_notes(self.metadata.notes, notes, "Tagged with ComicTagger"),
-                            description=cleanup_html(
-                                new_metadata.description, self.config[0].Sources__remove_html_tables
-                            ),
+                            description=cleanup_html(new_metadata.description, self._cfg.Sources__remove_html_tables),
                         )
                     )
                     # Now push the new combined data into the edit controls
                     self.metadata_to_form()
+                    self.set_dirty_flag()
                 else:
                     QtWidgets.QMessageBox.critical(
                         self, "Search", f"Could not find an issue {selector.issue_number} for that series"
@@ -1141,39 +1435,36 @@ class TaggerWindow(QtWidgets.QMainWindow):
             "Change Tag Read Style", "If you change read tag style now, data in the form will be lost.  Are you sure?"
         ):
             self.load_data_style = self.cbLoadDataStyle.itemData(s)
-            self.config[0].internal__load_data_style = self.load_data_style
+            self._cfg.internal__load_data_style = self.load_data_style
             self.update_menus()
             if self.comic_archive is not None:
                 self.load_archive(self.comic_archive)
         else:
-            self.cbLoadDataStyle.currentIndexChanged.disconnect(self.set_load_data_style)
             self.adjust_load_style_combo()
-            self.cbLoadDataStyle.currentIndexChanged.connect(self.set_load_data_style)
 
     def set_save_data_style(self, s: int) -> None:
         self.save_data_style = self.cbSaveDataStyle.itemData(s)
-        self.config[0].internal__save_data_style = self.save_data_style
+        self._cfg.internal__save_data_style = self.save_data_style
         self.update_style_tweaks()
         self.update_menus()
 
     def set_source(self, s: int) -> None:
-        self.config[0].Sources__source = self.cbx_sources.itemData(s)
+        self._cfg.Sources__source = self.cbx_sources.itemData(s)
 
     def update_credit_colors(self) -> None:
         # !!!ATB qt5 porting TODO
-        inactive_color = QtGui.QColor(255, 170, 150)
-        active_palette = self.leSeries.palette()
-        active_color = active_palette.color(QtGui.QPalette.ColorRole.Base)
-
-        inactive_brush = QtGui.QBrush(inactive_color)
-        active_brush = QtGui.QBrush(active_color)
+        credit_colors_state = (self.save_data_style, self.credits_version)
+        if credit_colors_state == self.credit_colors_state:
+            return
+        self.credit_colors_state = credit_colors_state
 
-        cix_credits = ComicInfoXml().get_parseable_credits()
+        inactive_brush = self.inactive_brush
+        active_brush = self.active_brush
 
         if self.save_data_style == MetaDataStyle.CIX:
             # loop over credit table, mark selected rows
             for r in range(self.twCredits.rowCount()):
-                if str(self.twCredits.item(r, 1).text()).casefold() not in cix_credits:
+                if str(self.twCredits.item(r, 1).text()).casefold() not in self.cix_credits:
                     self.twCredits.item(r, 1).setBackground(inactive_brush)
                 else:
                     self.twCredits.item(r, 1).setBackground(active_brush)
@@ -1188,82 +1479,43 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
     def update_style_tweaks(self) -> None:
         # depending on the current data style, certain fields are disabled
-
-        inactive_color = QtGui.QColor(255, 170, 150)
-        active_palette = self.leSeries.palette()
-
-        inactive_palette1 = self.leSeries.palette()
-        inactive_palette1.setColor(QtGui.QPalette.ColorRole.Base, inactive_color)
-
-        inactive_palette2 = self.leSeries.palette()
-
-        inactive_palette3 = self.leSeries.palette()
-        inactive_palette3.setColor(QtGui.QPalette.ColorRole.Base, inactive_color)
-
-        inactive_palette3.setColor(QtGui.QPalette.ColorRole.Base, inactive_color)
-
-        # helper func
-        def enable_widget(widget: QtWidgets.QWidget, enable: bool) -> None:
-            inactive_palette3.setColor(widget.backgroundRole(), inactive_color)
-            inactive_palette2.setColor(widget.backgroundRole(), inactive_color)
-            inactive_palette3.setColor(widget.foregroundRole(), inactive_color)
-
-            if enable:
-                widget.setPalette(active_palette)
-                widget.setAutoFillBackground(False)
-                if isinstance(widget, QtWidgets.QCheckBox):
-                    widget.setEnabled(True)
-                elif isinstance(widget, QtWidgets.QComboBox):
-                    widget.setEnabled(True)
-                elif isinstance(widget, (QtWidgets.QTextEdit, QtWidgets.QLineEdit, QtWidgets.QAbstractSpinBox)):
-                    widget.setReadOnly(False)
-            else:
-                widget.setAutoFillBackground(True)
-                if isinstance(widget, QtWidgets.QCheckBox):
-                    widget.setPalette(inactive_palette2)
-                    widget.setEnabled(False)
-                elif isinstance(widget, QtWidgets.QComboBox):
-                    widget.setPalette(inactive_palette3)
-                    widget.setEnabled(False)
-                elif isinstance(widget, (QtWidgets.QTextEdit, QtWidgets.QLineEdit, QtWidgets.QAbstractSpinBox)):
-                    widget.setReadOnly(True)
-                    widget.setPalette(inactive_palette1)
-
-        cbi_only = [self.leVolumeCount, self.cbCountry, self.teTags]
-        cix_only = [
-            self.leImprint,
-            self.teNotes,
-            self.cbBW,
-            self.cbManga,
-            self.leStoryArc,
-            self.leScanInfo,
-            self.leSeriesGroup,
-            self.leAltSeries,
-            self.leAltIssueNum,
-            self.leAltIssueCount,
-            self.leWebLink,
-            self.teCharacters,
-            self.teTeams,
-            self.teLocations,
-            self.cbMaturityRating,
-            self.cbFormat,
-        ]
-
         if self.save_data_style == MetaDataStyle.CIX:
-            for item in cix_only:
-                enable_widget(item, True)
-            for item in cbi_only:
-                enable_widget(item, False)
+            for item in self.cix_only:
+                self.enable_widget(item, True)
+            for item in self.cbi_only:
+                self.enable_widget(item, False)
 
         if self.save_data_style == MetaDataStyle.CBI:
-            for item in cbi_only:
-                enable_widget(item, True)
-            for item in cix_only:
-                enable_widget(item, False)
+            for item in self.cbi_only:
+                self.enable_widget(item, True)
+            for item in self.cix_only:
+                self.enable_widget(item, False)
 
         self.update_credit_colors()
         self.page_list_editor.set_metadata_style(self.save_data_style)
 
+    def enable_widget(self, widget: QtWidgets.QWidget, enable: bool) -> None:
+        if enable:
+            widget.setPalette(self.active_palette)
+            widget.setAutoFillBackground(False)
+            if isinstance(widget, QtWidgets.QCheckBox):
+                widget.setEnabled(True)
+            elif isinstance(widget, QtWidgets.QComboBox):
+                widget.setEnabled(True)
+            elif isinstance(widget, (QtWidgets.QTextEdit, QtWidgets.QLineEdit, QtWidgets.QAbstractSpinBox)):
+                widget.setReadOnly(False)
+        else:
+            widget.setAutoFillBackground(True)
+            if isinstance(widget, QtWidgets.QCheckBox):
+                widget.setPalette(self.inactive_check_box_palette)
+                widget.setEnabled(False)
+            elif isinstance(widget, QtWidgets.QComboBox):
+                widget.setPalette(self.inactive_combo_box_palette)
+                widget.setEnabled(False)
+            elif isinstance(widget, (QtWidgets.QTextEdit, QtWidgets.QLineEdit, QtWidgets.QAbstractSpinBox)):
+                widget.setReadOnly(True)
+                widget.setPalette(self.inactive_text_palette)
+
     def cell_double_clicked(self, r: int, c: int) -> None:
         self.edit_credit()
 
@@ -1294,6 +1546,8 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.twCredits.item(row, 0).setText("Yes")
 
     def modify_credits(self, edit: bool) -> None:
+        from comictaggerlib.crediteditorwindow import CreditEditorWindow
+
         if edit:
             row = self.twCredits.currentRow()
             role = self.twCredits.item(row, 1).text()
@@ -1344,6 +1598,8 @@ class TaggerWindow(QtWidgets.QMainWindow):
             if ok_to_mod:
                 # modify it
                 if edit:
+                    if new_role != role:
+                        self.credits_version += 1
                     self.twCredits.item(row, 1).setText(new_role)
                     self.twCredits.item(row, 2).setText(new_name)
                     self.update_credit_primary_flag(row, new_primary)
@@ -1366,12 +1622,17 @@ class TaggerWindow(QtWidgets.QMainWindow):
             web_link = self.leWebLink.text().strip()
             try:
                 result = urlparse(web_link)
-                all([result.scheme in ["http", "https"], result.netloc])
-                webbrowser.open_new_tab(web_link)
+                valid = result.scheme in ("http", "https") and bool(result.netloc)
             except ValueError:
+                valid = False
+            if valid:
+                webbrowser.open_new_tab(web_link)
+            else:
                 QtWidgets.QMessageBox.warning(self, self.tr("Web Link"), self.tr("Web Link is invalid."))
 
     def show_settings(self) -> None:
+        from comictaggerlib.settingswindow import SettingsWindow
+
         settingswin = SettingsWindow(self, self.config, self.talkers)
         settingswin.setModal(True)
         settingswin.exec()
@@ -1379,30 +1640,32 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.adjust_source_combo()
 
     def set_app_position(self) -> None:
-        if self.config[0].internal__window_width != 0:
-            self.move(self.config[0].internal__window_x, self.config[0].internal__window_y)
-            self.resize(self.config[0].internal__window_width, self.config[0].internal__window_height)
+        if self._cfg.internal__window_width != 0:
+            self.move(self._cfg.internal__window_x, self._cfg.internal__window_y)
+            self.resize(self._cfg.internal__window_width, self._cfg.internal__window_height)
         else:
             screen = QtGui.QGuiApplication.primaryScreen().geometry()
             size = self.frameGeometry()
             self.move(int((screen.width() - size.width()) / 2), int((screen.height() - size.height()) / 2))
 
     def adjust_source_combo(self) -> None:
-        self.cbx_sources.setCurrentIndex(self.cbx_sources.findData(self.config[0].Sources__source))
+        # The adjust methods only sync the combo boxes with the current state, the slots have nothing to do
+        with QtCore.QSignalBlocker(self.cbx_sources):
+            self.cbx_sources.setCurrentIndex(self.cbx_sources.findData(self._cfg.Sources__source))
 
     def adjust_load_style_combo(self) -> None:
-        # select the current style
-        if self.load_data_style == MetaDataStyle.CBI:
-            self.cbLoadDataStyle.setCurrentIndex(0)
-        elif self.load_data_style == MetaDataStyle.CIX:
-            self.cbLoadDataStyle.setCurrentIndex(1)
+        # select the current style, styles without an entry leave the selection alone
+        i = self.cbLoadDataStyle.findData(self.load_data_style)
+        if i != -1:
+            with QtCore.QSignalBlocker(self.cbLoadDataStyle):
+                self.cbLoadDataStyle.setCurrentIndex(i)
 
     def adjust_save_style_combo(self) -> None:
-        # select the current style
-        if self.save_data_style == MetaDataStyle.CBI:
-            self.cbSaveDataStyle.setCurrentIndex(0)
-        elif self.save_data_style == MetaDataStyle.CIX:
-            self.cbSaveDataStyle.setCurrentIndex(1)
+        # select the current style, styles without an entry leave the selection alone
+        i = self.cbSaveDataStyle.findData(self.save_data_style)
+        if i != -1:
+            with QtCore.QSignalBlocker(self.cbSaveDataStyle):
+                self.cbSaveDataStyle.setCurrentIndex(i)
         self.update_style_tweaks()
 
     def populate_combo_boxes(self) -> None:
@@ -1422,13 +1685,13 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
         # Add the entries to the country combobox
         self.cbCountry.addItem("", "")
-        for f in natsort.humansorted(utils.countries().items(), operator.itemgetter(1)):
+        for f in sorted_countries():
             self.cbCountry.addItem(f[1], f[0])
 
         # Add the entries to the language combobox
         self.cbLanguage.addItem("", "")
 
-        for f in natsort.humansorted(utils.languages().items(), operator.itemgetter(1)):
+        for f in sorted_languages():
             self.cbLanguage.addItem(f[1], f[0])
 
         # Add the entries to the manga combobox
@@ -1437,78 +1700,92 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.cbManga.addItem("Yes (Right to Left)", "YesAndRightToLeft")
         self.cbManga.addItem("No", "No")
 
+        # These lists never change, map the values to their index instead of searching them in metadata_to_form
+        # Iterated in reverse so that a repeated value maps to its first index like findText/findData
+        self.country_indexes = {self.cbCountry.itemText(i): i for i in reversed(range(self.cbCountry.count()))}
+        self.language_indexes = {self.cbLanguage.itemData(i): i for i in reversed(range(self.cbLanguage.count()))}
+        self.manga_indexes = {self.cbManga.itemData(i): i for i in reversed(range(self.cbManga.count()))}
+
         # Add the entries to the maturity combobox
-        self.cbMaturityRating.addItem("", "")
-        self.cbMaturityRating.addItem("Everyone", "")
-        self.cbMaturityRating.addItem("G", "")
-        self.cbMaturityRating.addItem("Early Childhood", "")
-        self.cbMaturityRating.addItem("Everyone 10+", "")
-        self.cbMaturityRating.addItem("PG", "")
-        self.cbMaturityRating.addItem("Kids to Adults", "")
-        self.cbMaturityRating.addItem("Teen", "")
-        self.cbMaturityRating.addItem("M", "")
-        self.cbMaturityRating.addItem("MA15+", "")
-        self.cbMaturityRating.addItem("Mature 17+", "")
-        self.cbMaturityRating.addItem("R18+", "")
-        self.cbMaturityRating.addItem("X18+", "")
-        self.cbMaturityRating.addItem("Adults Only 18+", "")
-        self.cbMaturityRating.addItem("Rating Pending", "")
+        self.cbMaturityRating.addItems(
+            [
+                "",
+                "Everyone",
+                "G",
+                "Early Childhood",
+                "Everyone 10+",
+                "PG",
+                "Kids to Adults",
+                "Teen",
+                "M",
+                "MA15+",
+                "Mature 17+",
+                "R18+",
+                "X18+",
+                "Adults Only 18+",
+                "Rating Pending",
+            ]
+        )
 
         # Add entries to the format combobox
-        self.cbFormat.addItem("")
-        self.cbFormat.addItem(".1")
-        self.cbFormat.addItem("-1")
-        self.cbFormat.addItem("1 Shot")
-        self.cbFormat.addItem("1/2")
-        self.cbFormat.addItem("1-Shot")
-        self.cbFormat.addItem("Annotation")
-        self.cbFormat.addItem("Annotations")
-        self.cbFormat.addItem("Annual")
-        self.cbFormat.addItem("Anthology")
-        self.cbFormat.addItem("B&W")
-        self.cbFormat.addItem("B/W")
-        self.cbFormat.addItem("B&&W")
-        self.cbFormat.addItem("Black & White")
-        self.cbFormat.addItem("Box Set")
-        self.cbFormat.addItem("Box-Set")
-        self.cbFormat.addItem("Crossover")
-        self.cbFormat.addItem("Director's Cut")
-        self.cbFormat.addItem("Epilogue")
-        self.cbFormat.addItem("Event")
-        self.cbFormat.addItem("FCBD")
-        self.cbFormat.addItem("Flyer")
-        self.cbFormat.addItem("Giant")
-        self.cbFormat.addItem("Giant Size")
-        self.cbFormat.addItem("Giant-Size")
-        self.cbFormat.addItem("Graphic Novel")
-        self.cbFormat.addItem("Hardcover")
-        self.cbFormat.addItem("Hard-Cover")
-        self.cbFormat.addItem("King")
-        self.cbFormat.addItem("King Size")
-        self.cbFormat.addItem("King-Size")
-        self.cbFormat.addItem("Limited Series")
-        self.cbFormat.addItem("Magazine")
-        self.cbFormat.addItem("-1")
-        self.cbFormat.addItem("NSFW")
-        self.cbFormat.addItem("One Shot")
-        self.cbFormat.addItem("One-Shot")
-        self.cbFormat.addItem("Point 1")
-        self.cbFormat.addItem("Preview")
-        self.cbFormat.addItem("Prologue")
-        self.cbFormat.addItem("Reference")
-        self.cbFormat.addItem("Review")
-        self.cbFormat.addItem("Reviewed")
-        self.cbFormat.addItem("Scanlation")
-        self.cbFormat.addItem("Script")
-        self.cbFormat.addItem("Series")
-        self.cbFormat.addItem("Sketch")
-        self.cbFormat.addItem("Special")
-        self.cbFormat.addItem("TPB")
-        self.cbFormat.addItem("Trade Paper Back")
-        self.cbFormat.addItem("WebComic")
-        self.cbFormat.addItem("Web Comic")
-        self.cbFormat.addItem("Year 1")
-        self.cbFormat.addItem("Year One")
+        self.cbFormat.addItems(
+            [
+                "",
+                ".1",
+                "-1",
+                "1 Shot",
+                "1/2",
+                "1-Shot",
+                "Annotation",
+                "Annotations",
+                "Annual",
+                "Anthology",
+                "B&W",
+                "B/W",
+                "B&&W",
+                "Black & White",
+                "Box Set",
+                "Box-Set",
+                "Crossover",
+                "Director's Cut",
+                "Epilogue",
+                "Event",
+                "FCBD",
+                "Flyer",
+                "Giant",
+                "Giant Size",
+                "Giant-Size",
+                "Graphic Novel",
+                "Hardcover",
+                "Hard-Cover",
+                "King",
+                "King Size",
+                "King-Size",
+                "Limited Series",
+                "Magazine",
+                "-1",
+                "NSFW",
+                "One Shot",
+                "One-Shot",
+                "Point 1",
+                "Preview",
+                "Prologue",
+                "Reference",
+                "Review",
+                "Reviewed",
+                "Scanlation",
+                "Script",
+                "Series",
+                "Sketch",
+                "Special",
+                "TPB",
+                "Trade Paper Back",
+                "WebComic",
+                "Web Comic",
+                "Year 1",
+                "Year One",
+            ]
+        )
 
     def remove_auto(self) -> None:
         self.remove_tags(self.save_data_style)
@@ -1521,16 +1798,12 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
     def remove_tags(self, style: int) -> None:
         # remove the indicated tags from the archive
-        ca_list = self.fileSelectionList.get_selected_archive_list()
-        has_md_count = 0
-        for ca in ca_list:
-            if ca.has_metadata(style):
-                has_md_count += 1
+        style_name = MetaDataStyle.name[style]
+        ca_list = [ca for ca in self.fileSelectionList.get_selected_archive_list() if ca.has_metadata(style)]
+        has_md_count = len(ca_list)
 
         if has_md_count == 0:
-            QtWidgets.QMessageBox.information(
-                self, "Remove Tags", f"No archives with {MetaDataStyle.name[style]} tags selected!"
-            )
+            QtWidgets.QMessageBox.information(self, "Remove Tags", f"No archives with {style_name} tags selected!")
             return
 
         if has_md_count != 0 and not self.dirty_flag_verification(
@@ -1542,60 +1815,108 @@ class TaggerWindow(QtWidgets.QMainWindow):
             reply = QtWidgets.QMessageBox.question(
                 self,
                 "Remove Tags",
-                f"Are you sure you wish to remove the {MetaDataStyle.name[style]} tags from {has_md_count} archive(s)?",
+                f"Are you sure you wish to remove the {style_name} tags from {has_md_count} archive(s)?",
                 QtWidgets.QMessageBox.StandardButton.Yes,
                 QtWidgets.QMessageBox.StandardButton.No,
             )
 
             if reply == QtWidgets.QMessageBox.StandardButton.Yes:
-                progdialog = QtWidgets.QProgressDialog("", "Cancel", 0, has_md_count, self)
-                progdialog.setWindowTitle("Removing Tags")
-                progdialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
-                progdialog.setMinimumDuration(300)
-                center_window_on_parent(progdialog)
-                QtCore.QCoreApplication.processEvents()
-
-                failed_list = []
-                success_count = 0
-                for prog_idx, ca in enumerate(ca_list, 1):
-                    QtCore.QCoreApplication.processEvents()
-                    if progdialog.wasCanceled():
-                        break
-                    progdialog.setValue(prog_idx)
-                    progdialog.setLabelText(str(ca.path))
-                    QtCore.QCoreApplication.processEvents()
-                    if ca.has_metadata(style):
-                        if ca.is_writable():
-                            if not ca.remove_metadata(style):
-                                failed_list.append(ca.path)
-                            else:
-                                success_count += 1
-                            ca.load_cache([MetaDataStyle.CBI, MetaDataStyle.CIX])
-
-                progdialog.hide()
-                QtCore.QCoreApplication.processEvents()
+
+                def remove(ca: ComicArchive) -> bool:
+                    return ca.remove_metadata(style)
+
+                tasks = [TagTask(ca, remove) for ca in ca_list if ca.is_writable()]
+                failed_list, success_count = self.run_archive_tasks(tasks, "Removing Tags")
                 self.fileSelectionList.update_selected_rows()
                 self.update_info_box()
                 self.update_menus()
 
-                summary = f"Successfully removed tags in {success_count} archive(s)."
+                summary_parts = [f"Successfully removed tags in {success_count} archive(s)."]
                 if len(failed_list) > 0:
-                    summary += f"\n\nThe remove operation failed in the following {len(failed_list)} archive(s):\n"
-                    for f in failed_list:
-                        summary += f"\t{f}\n"
+                    summary_parts.append(
+                        f"\n\nThe remove operation failed in the following {len(failed_list)} archive(s):\n"
+                    )
+                    summary_parts.extend(f"\t{f}\n" for f in failed_list)
+                summary = "".join(summary_parts)
 
                 dlg = LogWindow(self)
                 dlg.set_text(summary)
                 dlg.setWindowTitle("Tag Remove Summary")
                 dlg.exec()
 
+    def run_archive_tasks(
+        self,
+        tasks: list[T],
+        title: str,
+        on_finished: Callable[[T], None] | None = None,
+        min_progress_tasks: int = 3,
+    ) -> tuple[list[pathlib.Path], int]:
+        # Runs the tasks on the task thread pool behind a progress dialog, returns the failed paths and success count
+        # on_finished is called on this thread as each task finishes.
+        # Tag updates on one or two archives finish before the dialog would be shown, so it isn't built for them.
+        # The window is still disabled for them below, the dialog is only the progress display and not the guard
+        prog_dialog: QtWidgets.QProgressDialog | None = None
+        if len(tasks) >= min_progress_tasks:
+            prog_dialog = QtWidgets.QProgressDialog("", "Cancel", 0, len(tasks), self)
+            prog_dialog.setWindowTitle(title)
+            prog_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+            prog_dialog.setMinimumDuration(300)
+            center_window_on_parent(prog_dialog)
+
+        failed_list = []
+        success_count = 0
+        finished_count = 0
+        task_loop = QtCore.QEventLoop(self)
+
+        def task_finished(task: T) -> None:
+            nonlocal success_count, finished_count
+            finished_count += 1
+            if prog_dialog is not None and not prog_dialog.wasCanceled():
+                prog_dialog.setValue(finished_count)
+                prog_dialog.setLabelText(str(task.ca.path))
+
+            if task.success:
+                success_count += 1
+            elif task.success is not None:
+                failed_list.append(task.ca.path)
+            if on_finished is not None:
+                on_finished(task)
+
+            if finished_count == len(tasks):
+                task_loop.quit()
+
+        def cancel_tasks() -> None:
+            for task in tasks:
+                task.canceled = True
+
+        if prog_dialog is not None:
+            prog_dialog.canceled.connect(cancel_tasks)
+
+        # The tasks use archives that the form and the file list share, nothing else may touch them until the
+        # tasks are done. The window's parts are disabled instead of the window so the progress dialog stays usable
+        input_widgets = (self.centralWidget, self.menuBar, self.toolBar)
+        for widget in input_widgets:
+            widget.setEnabled(False)
+        try:
+            if tasks:
+                for task in tasks:
+                    task.signals.finished.connect(task_finished)
+                    self.task_pool.start(task)
+                task_loop.exec()
+        finally:
+            for widget in input_widgets:
+                widget.setEnabled(True)
+
+        if prog_dialog is not None:
+            prog_dialog.hide()
+        return failed_list, success_count
+
     def copy_tags(self) -> None:
         # copy the indicated tags in the archive
-        ca_list = self.fileSelectionList.get_selected_archive_list()
-        has_src_count = 0
-
         src_style = self.load_data_style
         dest_style = self.save_data_style
+        src_name = MetaDataStyle.name[src_style]
+        dest_name = MetaDataStyle.name[dest_style]
 
         if src_style == dest_style:
             QtWidgets.QMessageBox.information(
@@ -1603,12 +1924,11 @@ class TaggerWindow(QtWidgets.QMainWindow):
             )
             return
 
-        for ca in ca_list:
-            if ca.has_metadata(src_style):
-                has_src_count += 1
+        ca_list = [ca for ca in self.fileSelectionList.get_selected_archive_list() if ca.has_metadata(src_style)]
+        has_src_count = len(ca_list)
 
         if has_src_count == 0:
-            QtWidgets.QMessageBox.information(self, "Copy Tags", f"No archives with {src_style} tags selected!")
+            QtWidgets.QMessageBox.information(self, "Copy Tags", f"No archives with {src_name} tags selected!")
             return
 
         if has_src_count != 0 and not self.dirty_flag_verification(
@@ -1620,114 +1940,102 @@ class TaggerWindow(QtWidgets.QMainWindow):
             reply = QtWidgets.QMessageBox.question(
                 self,
                 "Copy Tags",
-                f"Are you sure you wish to copy the {MetaDataStyle.name[src_style]}"
-                + f" tags to {MetaDataStyle.name[dest_style]} tags in {has_src_count} archive(s)?",
+                f"Are you sure you wish to copy the {src_name} tags to {dest_name} tags in {has_src_count} archive(s)?",
                 QtWidgets.QMessageBox.StandardButton.Yes,
                 QtWidgets.QMessageBox.StandardButton.No,
             )
 
             if reply == QtWidgets.QMessageBox.StandardButton.Yes:
-                prog_dialog = QtWidgets.QProgressDialog("", "Cancel", 0, has_src_count, self)
-                prog_dialog.setWindowTitle("Copying Tags")
-                prog_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
-                prog_dialog.setMinimumDuration(300)
-                center_window_on_parent(prog_dialog)
-                QtCore.QCoreApplication.processEvents()
-
-                failed_list = []
-                success_count = 0
-                for prog_idx, ca in enumerate(ca_list, 1):
-                    QtCore.QCoreApplication.processEvents()
-                    if prog_dialog.wasCanceled():
-                        break
-
-                    prog_dialog.setValue(prog_idx)
-                    prog_dialog.setLabelText(str(ca.path))
-                    QtCore.QCoreApplication.processEvents()
-
-                    if ca.has_metadata(src_style) and ca.is_writable():
-                        md = ca.read_metadata(src_style)
-
-                        if (
-                            dest_style == MetaDataStyle.CBI
-                            and self.config[0].Comic_Book_Lover__apply_transform_on_bulk_operation
-                        ):
-                            md = CBLTransformer(md, self.config[0]).apply()
-
-                        if not ca.write_metadata(md, dest_style):
-                            failed_list.append(ca.path)
-                        else:
-                            success_count += 1
+                apply_transform = (
+                    dest_style == MetaDataStyle.CBI and self._cfg.Comic_Book_Lover__apply_transform_on_bulk_operation
+                )
 
-                        ca.load_cache([MetaDataStyle.CBI, MetaDataStyle.CIX])
+                def copy_to_dest(ca: ComicArchive) -> bool:
+                    md = ca.read_metadata(src_style)
+                    if apply_transform:
+                        md = CBLTransformer(md, self._cfg).apply()
+                    return ca.write_metadata(md, dest_style)
 
-                prog_dialog.hide()
-                QtCore.QCoreApplication.processEvents()
+                tasks = [TagTask(ca, copy_to_dest) for ca in ca_list if ca.is_writable()]
+                failed_list, success_count = self.run_archive_tasks(tasks, "Copying Tags")
                 self.fileSelectionList.update_selected_rows()
                 self.update_info_box()
                 self.update_menus()
 
-                summary = f"Successfully copied tags in {success_count} archive(s)."
+                summary_parts = [f"Successfully copied tags in {success_count} archive(s)."]
                 if len(failed_list) > 0:
-                    summary += f"\n\nThe copy operation failed in the following {len(failed_list)} archive(s):\n"
-                    for f in failed_list:
-                        summary += f"\t{f}\n"
+                    summary_parts.append(
+                        f"\n\nThe copy operation failed in the following {len(failed_list)} archive(s):\n"
+                    )
+                    summary_parts.extend(f"\t{f}\n" for f in failed_list)
+                summary = "".join(summary_parts)
 
                 dlg = LogWindow(self)
                 dlg.set_text(summary)
                 dlg.setWindowTitle("Tag Copy Summary")
                 dlg.exec()
 
-    def actual_issue_data_fetch(self, match: IssueResult) -> GenericMetadata:
+    def actual_issue_data_fetch(self, match: IssueResult, talker: ComicTalker) -> GenericMetadata:
         # now get the particular issue data OR series data
         ct_md = GenericMetadata()
         QtWidgets.QApplication.setOverrideCursor(QtGui.QCursor(QtCore.Qt.CursorShape.WaitCursor))
 
         try:
-            ct_md = self.current_talker().fetch_comic_data(match["issue_id"])
+            ct_md = talker.fetch_comic_data(match["issue_id"])
         except TalkerError:
             logger.exception("Save aborted.")
 
         if not ct_md.is_empty:
-            if self.config[0].Comic_Book_Lover__apply_transform_on_import:
-                ct_md = CBLTransformer(ct_md, self.config[0]).apply()
+            if self._cfg.Comic_Book_Lover__apply_transform_on_import:
+                ct_md = CBLTransformer(ct_md, self._cfg).apply()
 
         QtWidgets.QApplication.restoreOverrideCursor()
 
         return ct_md
 
+    def pump_events(self) -> None:
+        # Keeps the progress dialogs responsive during long loops on the GUI thread
+        # Draining the event queue is expensive, so do it at most every 50ms
+        now = time.monotonic()
+        if now - self.last_event_pump > 0.05:
+            QtCore.QCoreApplication.processEvents()
+            self.last_event_pump = now
+
     def auto_tag_log(self, text: str) -> None:
+        from comictaggerlib.issueidentifier import IssueIdentifier
+
         IssueIdentifier.default_write_output(text)
         if self.atprogdialog is not None:
             self.atprogdialog.textEdit.append(text.rstrip())
             self.atprogdialog.textEdit.ensureCursorVisible()
-            QtCore.QCoreApplication.processEvents()
-            QtCore.QCoreApplication.processEvents()
-            QtCore.QCoreApplication.processEvents()
+            self.pump_events()
 
-    def identify_and_tag_single_archive(
-        self, ca: ComicArchive, match_results: OnlineMatchResults, dlg: AutoTagStartWindow
-    ) -> tuple[bool, OnlineMatchResults]:
-        success = False
-        ii = IssueIdentifier(ca, self.config[0], self.current_talker())
-
-        # read in metadata, and parse file name if not there
-        try:
-            md = ca.read_metadata(self.save_data_style)
-        except Exception as e:
-            md = GenericMetadata()
-            logger.error("Failed to load metadata for %s: %s", ca.path, e)
+    def identify_single_archive(
+        self,
+        ca: ComicArchive,
+        md: GenericMetadata,
+        talker: ComicTalker,
+        match_results: OnlineMatchResults,
+        dlg: AutoTagStartWindow,
+    ) -> tuple[GenericMetadata, IssueResult] | None:
+        # md is the archive's metadata in the save style, already read by auto_tag for the cover
+        # Returns the archive's metadata and the match to save, the other outcomes are recorded in match_results
+        from comictaggerlib.issueidentifier import IssueIdentifier
+
+        ii = IssueIdentifier(ca, self._cfg, talker)
+
+        # parse file name if there is no metadata
         if md.is_empty:
             md = ca.metadata_from_filename(
-                self.config[0].Filename_Parsing__complicated_parser,
-                self.config[0].Filename_Parsing__remove_c2c,
-                self.config[0].Filename_Parsing__remove_fcbd,
-                self.config[0].Filename_Parsing__remove_publisher,
+                self._cfg.Filename_Parsing__complicated_parser,
+                self._cfg.Filename_Parsing__remove_c2c,
+                self._cfg.Filename_Parsing__remove_fcbd,
+                self._cfg.Filename_Parsing__remove_publisher,
                 dlg.split_words,
             )
             if dlg.ignore_leading_digits_in_filename and md.series is not None:
                 # remove all leading numbers
-                md.series = re.sub(r"([\d.]*)(.*)", r"\2", md.series)
+                md.series = leading_numbers.sub("", md.series)
 
         # use the dialog specified search string
         if dlg.search_string:
@@ -1735,7 +2043,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
         if md is None or md.is_empty:
             logger.error("No metadata given to search online with!")
-            return False, match_results
+            return None
 
         if dlg.dont_use_year:
             md.year = None
@@ -1747,7 +2055,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
         ii.set_additional_metadata(md)
         ii.only_use_additional_meta_data = True
         ii.set_output_function(self.auto_tag_log)
-        ii.cover_page_index = md.get_cover_page_index_list()[0]
+        ii.cover_page_index = md.get_cover_page_index()
         if self.atprogdialog is not None:
             ii.set_cover_url_callback(self.atprogdialog.set_test_image)
         ii.set_name_series_match_threshold(dlg.name_length_match_tolerance)
@@ -1792,37 +2100,46 @@ class TaggerWindow(QtWidgets.QMainWindow):
             # a single match!
             if low_confidence:
                 self.auto_tag_log("Online search: Low confidence match, but saving anyways, as indicated...\n")
+            return md, matches[0]
 
-            # now get the particular issue data
-            ct_md = self.actual_issue_data_fetch(matches[0])
-            if ct_md is None:
-                match_results.fetch_data_failures.append(str(ca.path.absolute()))
-
-            if ct_md is not None:
-                if dlg.cbxRemoveMetadata.isChecked():
-                    md = ct_md
-                else:
-                    notes = (
-                        f"Tagged with ComicTagger {ctversion.version} using info from {self.current_talker().name} on"
-                        f" {datetime.now():%Y-%m-%d %H:%M:%S}.  [Issue ID {ct_md.issue_id}]"
-                    )
-                    md.overlay(ct_md.replace(notes=utils.combine_notes(md.notes, notes, "Tagged with ComicTagger")))
+        return None
 
-                if self.config[0].Issue_Identifier__auto_imprint:
-                    md.fix_publisher()
+    def tag_single_archive(
+        self,
+        ca: ComicArchive,
+        md: GenericMetadata,
+        ct_md: GenericMetadata,
+        talker: ComicTalker,
+        match_results: OnlineMatchResults,
+        dlg: AutoTagStartWindow,
+    ) -> bool:
+        success = False
+        if dlg.cbxRemoveMetadata.isChecked():
+            md = ct_md
+        else:
+            notes = (
+                f"Tagged with ComicTagger {ctversion.version} using info from {talker.name} on"
+                f" {datetime.now():%Y-%m-%d %H:%M:%S}.  [Issue ID {ct_md.issue_id}]"
+            )
+            md.overlay(ct_md.replace(notes=utils.combine_notes(md.notes, notes, "Tagged with ComicTagger")))
 
-                if not ca.write_metadata(md, self.save_data_style):
-                    match_results.write_failures.append(str(ca.path.absolute()))
-                    self.auto_tag_log("Save failed ;-(\n")
-                else:
-                    match_results.good_matches.append(str(ca.path.absolute()))
-                    success = True
-                    self.auto_tag_log("Save complete!\n")
-                ca.load_cache([MetaDataStyle.CBI, MetaDataStyle.CIX])
+        if self._cfg.Issue_Identifier__auto_imprint:
+            md.fix_publisher()
 
-        return success, match_results
+        if not ca.write_metadata(md, self.save_data_style):
+            match_results.write_failures.append(str(ca.path.absolute()))
+            self.auto_tag_log("Save failed ;-(\n")
+        else:
+            match_results.good_matches.append(str(ca.path.absolute()))
+            success = True
+            self.auto_tag_log("Save complete!\n")
+        return success
 
     def auto_tag(self) -> None:
+        from comictaggerlib.autotagmatchwindow import AutoTagMatchWindow
+        from comictaggerlib.autotagprogresswindow import AutoTagProgressWindow
+        from comictaggerlib.autotagstartwindow import AutoTagStartWindow
+
         ca_list = self.fileSelectionList.get_selected_archive_list()
         style = self.save_data_style
 
@@ -1837,7 +2154,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
         atstartdlg = AutoTagStartWindow(
             self,
-            self.config[0],
+            self._cfg,
             (
                 f"You have selected {len(ca_list)} archive(s) to automatically identify and write "
                 + MetaDataStyle.name[style]
@@ -1850,7 +2167,9 @@ class TaggerWindow(QtWidgets.QMainWindow):
         if not atstartdlg.exec():
             return
 
-        self.atprogdialog = AutoTagProgressWindow(self, self.current_talker())
+        # The source is looked up once, every archive in the batch is tagged from the same one
+        talker = self.current_talker()
+        self.atprogdialog = AutoTagProgressWindow(self, talker)
         self.atprogdialog.setModal(True)
         self.atprogdialog.show()
         self.atprogdialog.progressBar.setMaximum(len(ca_list))
@@ -1862,32 +2181,57 @@ class TaggerWindow(QtWidgets.QMainWindow):
 
         match_results = OnlineMatchResults()
         archives_to_remove = []
+
+        # The metadata and cover of the next archive are read on the task pool while the current one is identified
+        cover_loop = QtCore.QEventLoop(self)
+
+        def cover_loaded(task: CoverLoadTask) -> None:
+            task.loaded = True
+            cover_loop.quit()
+
+        def load_cover(ca: ComicArchive) -> CoverLoadTask:
+            task = CoverLoadTask(ca, style)
+            task.signals.finished.connect(cover_loaded)
+            self.task_pool.start(task)
+            return task
+
+        def wait_for_cover(task: CoverLoadTask) -> None:
+            while not task.loaded:
+                cover_loop.exec()
+
+        next_cover = load_cover(ca_list[0])
         for prog_idx, ca in enumerate(ca_list):
             self.auto_tag_log("==========================================================================\n")
             self.auto_tag_log(f"Auto-Tagging {prog_idx} of {len(ca_list)}\n")
             self.auto_tag_log(f"{ca.path}\n")
-            try:
-                cover_idx = ca.read_metadata(style).get_cover_page_index_list()[0]
-            except Exception as e:
-                cover_idx = 0
-                logger.error("Failed to load metadata for %s: %s", ca.path, e)
-            image_data = ca.get_page(cover_idx)
-            self.atprogdialog.set_archive_image(image_data)
+            cover = next_cover
+            wait_for_cover(cover)
+            if prog_idx + 1 < len(ca_list):
+                next_cover = load_cover(ca_list[prog_idx + 1])
+            # the metadata is used for the cover and to identify the archive
+            md = cover.md
+            self.atprogdialog.set_archive_image(cover.image_data)
             self.atprogdialog.set_test_image(b"")
 
-            QtCore.QCoreApplication.processEvents()
+            self.pump_events()
             if self.atprogdialog.isdone:
                 break
             self.atprogdialog.progressBar.setValue(prog_idx)
 
             self.atprogdialog.label.setText(str(ca.path))
-            QtCore.QCoreApplication.processEvents()
 
             if ca.is_writable():
-                success, match_results = self.identify_and_tag_single_archive(ca, match_results, atstartdlg)
+                found = self.identify_single_archive(ca, md, talker, match_results, atstartdlg)
+                if found is not None:
+                    md, match = found
+                    # now get the particular issue data
+                    ct_md = self.actual_issue_data_fetch(match, talker)
+                    if self.tag_single_archive(ca, md, ct_md, talker, match_results, atstartdlg):
+                        if atstartdlg.remove_after_success:
+                            archives_to_remove.append(ca)
 
-                if success and atstartdlg.remove_after_success:
-                    archives_to_remove.append(ca)
+        # The loop stops early when canceled, the next cover may still be loading
+        wait_for_cover(next_cover)
 
         self.atprogdialog.close()
 
@@ -1938,9 +2282,9 @@ class TaggerWindow(QtWidgets.QMainWindow):
                     self,
                     match_results.multiple_matches,
                     style,
-                    self.actual_issue_data_fetch,
-                    self.config[0],
-                    self.current_talker(),
+                    functools.partial(self.actual_issue_data_fetch, talker=talker),
+                    self._cfg,
+                    talker,
                 )
                 matchdlg.setModal(True)
                 matchdlg.exec()
@@ -1985,23 +2329,24 @@ class TaggerWindow(QtWidgets.QMainWindow):
             f"Exit {self.appName}", "If you quit now, data in the form will be lost.  Are you sure?"
         ):
             appsize = self.size()
-            self.config[0].internal__window_width = appsize.width()
-            self.config[0].internal__window_height = appsize.height()
-            self.config[0].internal__window_x = self.x()
-            self.config[0].internal__window_y = self.y()
-            self.config[0].internal__form_width = self.splitter.sizes()[0]
-            self.config[0].internal__list_width = self.splitter.sizes()[1]
+            self._cfg.internal__window_width = appsize.width()
+            self._cfg.internal__window_height = appsize.height()
+            self._cfg.internal__window_x = self.x()
+            self._cfg.internal__window_y = self.y()
+            self._cfg.internal__form_width, self._cfg.internal__list_width = self.splitter.sizes()[:2]
             (
-                self.config[0].internal__sort_column,
-                self.config[0].internal__sort_direction,
+                self._cfg.internal__sort_column,
+                self._cfg.internal__sort_direction,
             ) = self.fileSelectionList.get_sorting()
-            ctsettings.save_file(self.config, self.config[0].Runtime_Options__config.user_config_dir / "settings.json")
+            ctsettings.save_file(self.config, self._cfg.Runtime_Options__config.user_config_dir / "settings.json")
 
             event.accept()
         else:
             event.ignore()
 
     def show_page_browser(self) -> None:
+        from comictaggerlib.pagebrowser import PageBrowserWindow
+
         if self.page_browser is None:
             self.page_browser = PageBrowserWindow(self, self.metadata)
             if self.comic_archive is not None:
@@ -2019,10 +2364,15 @@ class TaggerWindow(QtWidgets.QMainWindow):
             dlg.exec()
 
     def view_raw_cbl_tags(self) -> None:
+        import pprint
+
         if self.comic_archive is not None and self.comic_archive.has_cbi():
             dlg = LogWindow(self)
-            text = pprint.pformat(json.loads(self.comic_archive.read_raw_cbi()), indent=4)
-            dlg.set_text(text)
+            key = (self.comic_archive.path, self.comic_archive.path.stat().st_mtime_ns)
+            if self.raw_cbl_view is None or self.raw_cbl_view[0] != key:
+                text = pprint.pformat(json.loads(self.comic_archive.read_raw_cbi()), indent=4)
+                self.raw_cbl_view = (key, text)
+            dlg.set_text(self.raw_cbl_view[1])
             dlg.setWindowTitle("Raw ComicBookLover Tag View")
             dlg.exec()
 
@@ -2036,30 +2386,32 @@ class TaggerWindow(QtWidgets.QMainWindow):
         webbrowser.open("https://github.com/comictagger/comictagger/discussions")
 
     def front_cover_changed(self) -> None:
-        self.metadata.pages = self.page_list_editor.get_page_list()
-        self.update_cover_image()
+        self.cover_changed = True
+        self.page_list_timer.start()
 
-    def page_list_order_changed(self) -> None:
+    def page_list_changed(self) -> None:
         self.metadata.pages = self.page_list_editor.get_page_list()
+        if self.cover_changed:
+            self.cover_changed = False
+            self.update_cover_image()
 
     def apply_cbl_transform(self) -> None:
         self.form_to_metadata()
-        self.metadata = CBLTransformer(self.metadata, self.config[0]).apply()
+        self.metadata = CBLTransformer(self.metadata, self._cfg).apply()
         self.metadata_to_form()
+        self.set_dirty_flag()
 
     def recalc_page_dimensions(self) -> None:
-        QtWidgets.QApplication.setOverrideCursor(QtGui.QCursor(QtCore.Qt.CursorShape.WaitCursor))
+        # The sizes are worked out again when the tags are saved
         for p in self.metadata.pages:
-            if "ImageSize" in p:
-                del p["ImageSize"]
-            if "ImageHeight" in p:
-                del p["ImageHeight"]
-            if "ImageWidth" in p:
-                del p["ImageWidth"]
+            p.pop("ImageSize", None)
+            p.pop("ImageHeight", None)
+            p.pop("ImageWidth", None)
         self.set_dirty_flag()
-        QtWidgets.QApplication.restoreOverrideCursor()
 
     def rename_archive(self) -> None:
+        from comictaggerlib.renamewindow import RenameWindow
+
         ca_list = self.fileSelectionList.get_selected_archive_list()
 
         if len(ca_list) == 0:
@@ -2079,6 +2431,8 @@ class TaggerWindow(QtWidgets.QMainWindow):
         self.load_archive(fi.ca)
 
     def load_archive(self, comic_archive: ComicArchive) -> None:
+        self.page_list_timer.stop()
+        self.cover_changed = False
         self.comic_archive = None
         self.clear_form()
 
@@ -2088,7 +2442,7 @@ class TaggerWindow(QtWidgets.QMainWindow):
             QtCore.QTimer.singleShot(1, self.fileSelectionList.revert_selection)
             return
 
-        self.config[0].internal__last_opened_folder = os.path.abspath(os.path.split(comic_archive.path)[0])
+        self._cfg.internal__last_opened_folder = os.path.abspath(os.path.split(comic_archive.path)[0])
         self.comic_archive = comic_archive
         try:
             self.metadata = self.comic_archive.read_metadata(self.load_data_style)
@@ -2102,88 +2456,103 @@ class TaggerWindow(QtWidgets.QMainWindow):
     def file_list_cleared(self) -> None:
         self.reset_app()
 
-    def splitter_moved_event(self, w1: int, w2: int) -> None:
-        scrollbar_w = 0
-        if self.scrollArea.verticalScrollBar().isVisible():
-            scrollbar_w = self.scrollArea.verticalScrollBar().width()
+    def form_scroll_range_changed(self, minimum: int, maximum: int) -> None:
+        # The scroll bar is only shown when there is something to scroll, the scroll area lays it out at its size hint
+        self.form_scrollbar_width = 0
+        if maximum > minimum:
+            self.form_scrollbar_width = self.scrollArea.verticalScrollBar().sizeHint().width()
 
-        new_w = self.scrollArea.width() - scrollbar_w - 5
+    def splitter_moved_event(self, w1: int, w2: int) -> None:
+        new_w = self.scrollArea.width() - self.form_scrollbar_width - 5
         self.scrollAreaWidgetContents.resize(new_w, self.scrollAreaWidgetContents.height())
 
     def resizeEvent(self, ev: QtGui.QResizeEvent | None) -> None:
-        self.splitter_moved_event(0, 0)
+        self.form_resize_timer.start()
 
     def tab_changed(self, idx: int) -> None:
         if idx == 0:
-            self.splitter_moved_event(0, 0)
+            self.form_resize_timer.start()
 
     def check_latest_version_online(self) -> None:
-        version_checker = VersionChecker()
-        self.version_check_complete(version_checker.get_latest_version(self.config[0].internal__install_id))
+        self.version_check_task = VersionCheckTask(self._cfg.internal__install_id)
+        self.version_check_task.signals.finished.connect(self.version_check_complete)
+        self.task_pool.start(self.version_check_task)
 
     def version_check_complete(self, new_version: tuple[str, str]) -> None:
-        if new_version[0] not in (self.version, self.config[0].Dialog_Flags__dont_notify_about_this_version):
-            website = "https://github.com/comictagger/comictagger"
+        self.version_check_task = None
+        # An empty version means the check failed
+        if new_version[0] not in ("", self.version, self._cfg.Dialog_Flags__dont_notify_about_this_version):
+            from comictaggerlib.optionalmsgdialog import OptionalMessageDialog
+
             checked = OptionalMessageDialog.msg(
                 self,
                 "New version available!",
-                f"New version ({new_version[1]}) available!<br>(You are currently running {self.version})<br><br>"
-                f"Visit <a href='{website}/releases/latest'>{website}/releases/latest</a> for more info.<br><br>",
+                new_version_message.format(new=new_version[1], current=self.version),
                 False,
                 "Don't tell me about this version again",
             )
             if checked:
-                self.config[0].Dialog_Flags__dont_notify_about_this_version = new_version[0]
+                self._cfg.Dialog_Flags__dont_notify_about_this_version = new_version[0]
 
     def on_incoming_socket_connection(self) -> None:
         # Accept connection from other instance.
         # Read in the file list if they're giving it, and add to our own list
+        # The list is read as it arrives instead of blocking the GUI thread until it has all been sent
         local_socket = self.socketServer.nextPendingConnection()
-        if local_socket.waitForReadyRead(3000):
-            byte_array = local_socket.readAll().data()
-            if len(byte_array) > 0:
-                obj = pickle.loads(byte_array)
+        buffer = bytearray()
+
+        def read_file_list() -> None:
+            # read returns bytes directly, readAll would copy through a QByteArray first
+            buffer.extend(local_socket.read(local_socket.bytesAvailable()))
+            # The buffer is checked in place, it is only decoded once the whole list is there
+            file_list = decode_file_list(buffer)
+            if file_list is not None:
+                local_socket.readyRead.disconnect(read_file_list)
                 local_socket.disconnectFromServer()
-                if isinstance(obj, list):
-                    self.fileSelectionList.add_path_list(obj)
+                self.fileSelectionList.add_path_list(file_list)
+
+        local_socket.readyRead.connect(read_file_list)
+        local_socket.disconnected.connect(local_socket.deleteLater)
+        if local_socket.bytesAvailable():
+            read_file_list()
 
         self.bring_to_top()
 
     def bring_to_top(self) -> None:
-        if platform.system() == "Windows":
+        if SYSTEM == "Windows":
             self.showNormal()
             self.raise_()
             self.activateWindow()
+            if not win32_available:
+                return
             try:
-                import win32con
-                import win32gui
-
                 hwnd = self.effectiveWinId()
-                rect = win32gui.GetWindowRect(hwnd)
-                x = rect[0]
-                y = rect[1]
-                w = rect[2] - x
-                h = rect[3] - y
+                # Only the z-order changes, the window keeps its position and size
+                flags = win32con.SWP_NOMOVE | win32con.SWP_NOSIZE | win32con.SWP_NOSENDCHANGING
                 # mark it "always on top", just for a moment, to force it to
                 # the top
-                win32gui.SetWindowPos(hwnd, win32con.HWND_TOPMOST, x, y, w, h, 0)
-                win32gui.SetWindowPos(hwnd, win32con.HWND_NOTOPMOST, x, y, w, h, 0)
+                win32gui.SetWindowPos(hwnd, win32con.HWND_TOPMOST, 0, 0, 0, 0, flags)
+                win32gui.SetWindowPos(hwnd, win32con.HWND_NOTOPMOST, 0, 0, 0, 0, flags)
             except Exception:
                 logger.exception("Fail to bring window to top")
-        elif platform.system() == "Darwin":
+        elif SYSTEM == "Darwin":
             self.raise_()
             self.showNormal()
             self.activateWindow()
         else:
-            flags = QtCore.Qt.WindowType(self.windowFlags())
-            self.setWindowFlags(
-                flags | QtCore.Qt.WindowType.WindowStaysOnTopHint | QtCore.Qt.WindowType.X11BypassWindowManagerHint
-            )
-            QtCore.QCoreApplication.processEvents()
-            self.setWindowFlags(flags)
-            self.show()
+            # Changing the window flags recreates the native window, activating it asks the window manager instead
+            self.showNormal()
+            self.raise_()
+            self.activateWindow()
 
     def auto_imprint(self) -> None:
-        self.form_to_metadata()
-        self.metadata.fix_publisher()
-        self.metadata_to_form()
+        # Only the publisher and imprint can change, the rest of the form doesn't need the round trip through metadata
+        md = GenericMetadata(publisher=utils.xlate(self.lePublisher.text()), imprint=utils.xlate(self.leImprint.text()))
+        md.fix_publisher()
+        changed = False
+        for field, value in ((self.lePublisher, md.publisher), (self.leImprint, md.imprint)):
+            if value is not None and field.text() != value:
+                field.setText(value)
+                changed = True
+        if changed:
+            self.set_dirty_flag()
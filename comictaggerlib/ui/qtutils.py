@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import io
 import logging
 import traceback
@@ -92,6 +93,24 @@ if qt_available:
         def new_web_view(parent: QWidget) -> QWebEngineView:
             ...
 
+    @functools.cache
+    def get_icon(name: str) -> QtGui.QIcon:
+        """Returns the icon from the graphics folder, shared by every widget that uses it"""
+        return QtGui.QIcon(str(graphics_path / name))
+
+    def get_pixmap(name: str) -> QtGui.QPixmap:
+        """Returns the image from the graphics folder, decoded once and kept in the QPixmapCache"""
+        pixmap = QtGui.QPixmapCache.find(name)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(str(graphics_path / name))
+            QtGui.QPixmapCache.insert(name, pixmap)
+        return pixmap
+
+    @functools.cache
+    def get_int_validator(bottom: int, top: int) -> QtGui.QIntValidator:
+        """Returns an unparented validator for the range, shared by every line edit that uses it"""
+        return QtGui.QIntValidator(bottom, top)
+
     def reduce_widget_font_size(widget: QtWidgets.QWidget, delta: int = 2) -> None:
         f = widget.font()
         if f.pointSize() > 10:
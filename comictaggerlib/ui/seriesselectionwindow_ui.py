@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'comictaggerlib/ui/seriesselectionwindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from __future__ import annotations
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_SeriesSelectionWindow(object):
+    def setupUi(self, SeriesSelectionWindow):
+        SeriesSelectionWindow.setObjectName("SeriesSelectionWindow")
+        SeriesSelectionWindow.resize(950, 600)
+        SeriesSelectionWindow.setSizeGripEnabled(False)
+        self.gridLayout = QtWidgets.QGridLayout(SeriesSelectionWindow)
+        self.gridLayout.setObjectName("gridLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setSizeConstraint(QtWidgets.QLayout.SetMaximumSize)
+        self.verticalLayout_3.setContentsMargins(0, -1, -1, -1)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.imageContainer = QtWidgets.QWidget(SeriesSelectionWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.imageContainer.sizePolicy().hasHeightForWidth())
+        self.imageContainer.setSizePolicy(sizePolicy)
+        self.imageContainer.setMinimumSize(QtCore.QSize(300, 450))
+        self.imageContainer.setMaximumSize(QtCore.QSize(300, 450))
+        self.imageContainer.setObjectName("imageContainer")
+        self.verticalLayout_3.addWidget(self.imageContainer, 0, QtCore.Qt.AlignTop)
+        self.line = QtWidgets.QFrame(SeriesSelectionWindow)
+        self.line.setLineWidth(2)
+        self.line.setMidLineWidth(1)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_3.addWidget(self.line)
+        self.lblSourceName = QtWidgets.QLabel(SeriesSelectionWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lblSourceName.sizePolicy().hasHeightForWidth())
+        self.lblSourceName.setSizePolicy(sizePolicy)
+        self.lblSourceName.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.lblSourceName.setAlignment(QtCore.Qt.AlignLeading | QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        self.lblSourceName.setOpenExternalLinks(True)
+        self.lblSourceName.setObjectName("lblSourceName")
+        self.verticalLayout_3.addWidget(self.lblSourceName)
+        self.imageSourceLogo = QtWidgets.QWidget(SeriesSelectionWindow)
+        self.imageSourceLogo.setMinimumSize(QtCore.QSize(300, 100))
+        self.imageSourceLogo.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.imageSourceLogo.setObjectName("imageSourceLogo")
+        self.verticalLayout_3.addWidget(self.imageSourceLogo)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_3)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.leFilter = QtWidgets.QLineEdit(SeriesSelectionWindow)
+        self.leFilter.setObjectName("leFilter")
+        self.verticalLayout.addWidget(self.leFilter)
+        self.splitter = QtWidgets.QSplitter(SeriesSelectionWindow)
+        self.splitter.setOrientation(QtCore.Qt.Vertical)
+        self.splitter.setChildrenCollapsible(False)
+        self.splitter.setObjectName("splitter")
+        self.twList = QtWidgets.QTableWidget(self.splitter)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(7)
+        sizePolicy.setHeightForWidth(self.twList.sizePolicy().hasHeightForWidth())
+        self.twList.setSizePolicy(sizePolicy)
+        self.twList.setMinimumSize(QtCore.QSize(0, 0))
+        self.twList.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.twList.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.twList.setRowCount(0)
+        self.twList.setColumnCount(4)
+        self.twList.setObjectName("twList")
+        item = QtWidgets.QTableWidgetItem()
+        self.twList.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twList.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twList.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twList.setHorizontalHeaderItem(3, item)
+        self.twList.horizontalHeader().setStretchLastSection(True)
+        self.twList.verticalHeader().setVisible(False)
+        self.teDetails = QtWidgets.QTextEdit(self.splitter)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(3)
+        sizePolicy.setHeightForWidth(self.teDetails.sizePolicy().hasHeightForWidth())
+        self.teDetails.setSizePolicy(sizePolicy)
+        self.teDetails.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.teDetails.setReadOnly(True)
+        self.teDetails.setTextInteractionFlags(QtCore.Qt.LinksAccessibleByMouse | QtCore.Qt.TextSelectableByMouse)
+        self.teDetails.setObjectName("teDetails")
+        self.verticalLayout.addWidget(self.splitter)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.btnAutoSelect = QtWidgets.QPushButton(SeriesSelectionWindow)
+        self.btnAutoSelect.setObjectName("btnAutoSelect")
+        self.horizontalLayout.addWidget(self.btnAutoSelect)
+        self.btnRequery = QtWidgets.QPushButton(SeriesSelectionWindow)
+        self.btnRequery.setObjectName("btnRequery")
+        self.horizontalLayout.addWidget(self.btnRequery)
+        self.btnIssues = QtWidgets.QPushButton(SeriesSelectionWindow)
+        self.btnIssues.setObjectName("btnIssues")
+        self.horizontalLayout.addWidget(self.btnIssues)
+        self.cbxFilter = QtWidgets.QCheckBox(SeriesSelectionWindow)
+        self.cbxFilter.setObjectName("cbxFilter")
+        self.horizontalLayout.addWidget(self.cbxFilter)
+        self.buttonBox = QtWidgets.QDialogButtonBox(SeriesSelectionWindow)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel | QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.horizontalLayout.addWidget(self.buttonBox)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.horizontalLayout_2.addLayout(self.verticalLayout)
+        self.gridLayout.addLayout(self.horizontalLayout_2, 0, 2, 1, 1)
+
+        self.retranslateUi(SeriesSelectionWindow)
+        self.buttonBox.accepted.connect(SeriesSelectionWindow.accept)  # type: ignore
+        self.buttonBox.rejected.connect(SeriesSelectionWindow.reject)  # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(SeriesSelectionWindow)
+
+    def retranslateUi(self, SeriesSelectionWindow):
+        _translate = QtCore.QCoreApplication.translate
+        SeriesSelectionWindow.setWindowTitle(_translate("SeriesSelectionWindow", "Select Series"))
+        self.lblSourceName.setText(_translate("SeriesSelectionWindow", "Data Source:"))
+        self.leFilter.setPlaceholderText(_translate("SeriesSelectionWindow", "Filter"))
+        item = self.twList.horizontalHeaderItem(0)
+        item.setText(_translate("SeriesSelectionWindow", "Series"))
+        item = self.twList.horizontalHeaderItem(1)
+        item.setText(_translate("SeriesSelectionWindow", "Year"))
+        item = self.twList.horizontalHeaderItem(2)
+        item.setText(_translate("SeriesSelectionWindow", "Issues"))
+        item = self.twList.horizontalHeaderItem(3)
+        item.setText(_translate("SeriesSelectionWindow", "Publisher"))
+        self.btnAutoSelect.setText(_translate("SeriesSelectionWindow", "Auto-Identify"))
+        self.btnRequery.setText(_translate("SeriesSelectionWindow", "Re-Search"))
+        self.btnIssues.setText(_translate("SeriesSelectionWindow", "Show Issues"))
+        self.cbxFilter.setToolTip(
+            _translate("SeriesSelectionWindow", "Filter the publishers based on the publisher filter.")
+        )
+        self.cbxFilter.setText(_translate("SeriesSelectionWindow", "Filter Publishers"))
@@ -0,0 +1,565 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'comictaggerlib/ui/settingswindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from __future__ import annotations
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_SettingsWindow(object):
+    def setupUi(self, SettingsWindow):
+        SettingsWindow.setObjectName("SettingsWindow")
+        SettingsWindow.resize(702, 559)
+        SettingsWindow.setSizeGripEnabled(False)
+        self.gridLayout_2 = QtWidgets.QGridLayout(SettingsWindow)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.tabWidget = QtWidgets.QTabWidget(SettingsWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tabWidget.sizePolicy().hasHeightForWidth())
+        self.tabWidget.setSizePolicy(sizePolicy)
+        self.tabWidget.setObjectName("tabWidget")
+        self.tGeneral = QtWidgets.QWidget()
+        self.tGeneral.setObjectName("tGeneral")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.tGeneral)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.grpBoxBtns = QtWidgets.QGroupBox(self.tGeneral)
+        self.grpBoxBtns.setTitle("")
+        self.grpBoxBtns.setObjectName("grpBoxBtns")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.grpBoxBtns)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.btnResetSettings = QtWidgets.QPushButton(self.grpBoxBtns)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btnResetSettings.sizePolicy().hasHeightForWidth())
+        self.btnResetSettings.setSizePolicy(sizePolicy)
+        self.btnResetSettings.setObjectName("btnResetSettings")
+        self.gridLayout_4.addWidget(self.btnResetSettings, 1, 0, 1, 1)
+        self.lblDefaultSettings = QtWidgets.QLabel(self.grpBoxBtns)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lblDefaultSettings.sizePolicy().hasHeightForWidth())
+        self.lblDefaultSettings.setSizePolicy(sizePolicy)
+        self.lblDefaultSettings.setWordWrap(True)
+        self.lblDefaultSettings.setObjectName("lblDefaultSettings")
+        self.gridLayout_4.addWidget(self.lblDefaultSettings, 1, 1, 1, 1)
+        self.btnClearCache = QtWidgets.QPushButton(self.grpBoxBtns)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btnClearCache.sizePolicy().hasHeightForWidth())
+        self.btnClearCache.setSizePolicy(sizePolicy)
+        self.btnClearCache.setObjectName("btnClearCache")
+        self.gridLayout_4.addWidget(self.btnClearCache, 2, 0, 1, 1)
+        self.label_2 = QtWidgets.QLabel(self.grpBoxBtns)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy)
+        self.label_2.setWordWrap(True)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout_4.addWidget(self.label_2, 2, 1, 1, 1)
+        self.cbxCheckForNewVersion = QtWidgets.QCheckBox(self.grpBoxBtns)
+        self.cbxCheckForNewVersion.setObjectName("cbxCheckForNewVersion")
+        self.gridLayout_4.addWidget(self.cbxCheckForNewVersion, 0, 0, 1, 2)
+        self.verticalLayout_2.addWidget(self.grpBoxBtns)
+        self.line_3 = QtWidgets.QFrame(self.tGeneral)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_2.addWidget(self.line_3)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem)
+        self.tabWidget.addTab(self.tGeneral, "")
+        self.tSearching = QtWidgets.QWidget()
+        self.tSearching.setObjectName("tSearching")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.tSearching)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.line_5 = QtWidgets.QFrame(self.tSearching)
+        self.line_5.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_5.setObjectName("line_5")
+        self.gridLayout_3.addWidget(self.line_5, 3, 0, 1, 1)
+        self.formLayout_2 = QtWidgets.QFormLayout()
+        self.formLayout_2.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.formLayout_2.setObjectName("formLayout_2")
+        self.label_3 = QtWidgets.QLabel(self.tSearching)
+        self.label_3.setToolTip("")
+        self.label_3.setObjectName("label_3")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.label = QtWidgets.QLabel(self.tSearching)
+        self.label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing | QtCore.Qt.AlignVCenter)
+        self.label.setObjectName("label")
+        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.label_9 = QtWidgets.QLabel(self.tSearching)
+        self.label_9.setObjectName("label_9")
+        self.formLayout_2.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_9)
+        self.cbxUseFilter = QtWidgets.QCheckBox(self.tSearching)
+        self.cbxUseFilter.setText("")
+        self.cbxUseFilter.setObjectName("cbxUseFilter")
+        self.formLayout_2.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.cbxUseFilter)
+        self.label_4 = QtWidgets.QLabel(self.tSearching)
+        self.label_4.setObjectName("label_4")
+        self.formLayout_2.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.label_4)
+        self.tePublisherFilter = QtWidgets.QPlainTextEdit(self.tSearching)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tePublisherFilter.sizePolicy().hasHeightForWidth())
+        self.tePublisherFilter.setSizePolicy(sizePolicy)
+        self.tePublisherFilter.setObjectName("tePublisherFilter")
+        self.formLayout_2.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.tePublisherFilter)
+        self.sbNameMatchSearchThresh = QtWidgets.QSpinBox(self.tSearching)
+        self.sbNameMatchSearchThresh.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.sbNameMatchSearchThresh.setMinimum(1)
+        self.sbNameMatchSearchThresh.setMaximum(100)
+        self.sbNameMatchSearchThresh.setObjectName("sbNameMatchSearchThresh")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.sbNameMatchSearchThresh)
+        self.sbNameMatchIdentifyThresh = QtWidgets.QSpinBox(self.tSearching)
+        self.sbNameMatchIdentifyThresh.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.sbNameMatchIdentifyThresh.setMinimum(1)
+        self.sbNameMatchIdentifyThresh.setMaximum(100)
+        self.sbNameMatchIdentifyThresh.setObjectName("sbNameMatchIdentifyThresh")
+        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.sbNameMatchIdentifyThresh)
+        self.gridLayout_3.addLayout(self.formLayout_2, 6, 0, 1, 1)
+        self.label_5 = QtWidgets.QLabel(self.tSearching)
+        self.label_5.setWordWrap(True)
+        self.label_5.setObjectName("label_5")
+        self.gridLayout_3.addWidget(self.label_5, 4, 0, 1, 1)
+        self.line_2 = QtWidgets.QFrame(self.tSearching)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.gridLayout_3.addWidget(self.line_2, 5, 0, 1, 1)
+        self.cbxExactMatches = QtWidgets.QCheckBox(self.tSearching)
+        self.cbxExactMatches.setObjectName("cbxExactMatches")
+        self.gridLayout_3.addWidget(self.cbxExactMatches, 1, 0, 1, 1)
+        self.cbxSortByYear = QtWidgets.QCheckBox(self.tSearching)
+        self.cbxSortByYear.setObjectName("cbxSortByYear")
+        self.gridLayout_3.addWidget(self.cbxSortByYear, 0, 0, 1, 1)
+        self.cbxClearFormBeforePopulating = QtWidgets.QCheckBox(self.tSearching)
+        self.cbxClearFormBeforePopulating.setObjectName("cbxClearFormBeforePopulating")
+        self.gridLayout_3.addWidget(self.cbxClearFormBeforePopulating, 2, 0, 1, 1)
+        self.tabWidget.addTab(self.tSearching, "")
+        self.tFilenameParser = QtWidgets.QWidget()
+        self.tFilenameParser.setObjectName("tFilenameParser")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.tFilenameParser)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.groupBox_2 = QtWidgets.QGroupBox(self.tFilenameParser)
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.cbxComplicatedParser = QtWidgets.QCheckBox(self.groupBox_2)
+        self.cbxComplicatedParser.setObjectName("cbxComplicatedParser")
+        self.verticalLayout_7.addWidget(self.cbxComplicatedParser)
+        self.cbxRemoveC2C = QtWidgets.QCheckBox(self.groupBox_2)
+        self.cbxRemoveC2C.setObjectName("cbxRemoveC2C")
+        self.verticalLayout_7.addWidget(self.cbxRemoveC2C)
+        self.cbxRemoveFCBD = QtWidgets.QCheckBox(self.groupBox_2)
+        self.cbxRemoveFCBD.setObjectName("cbxRemoveFCBD")
+        self.verticalLayout_7.addWidget(self.cbxRemoveFCBD)
+        self.cbxRemovePublisher = QtWidgets.QCheckBox(self.groupBox_2)
+        self.cbxRemovePublisher.setObjectName("cbxRemovePublisher")
+        self.verticalLayout_7.addWidget(self.cbxRemovePublisher)
+        self.cbxProtofoliusIssueNumberScheme = QtWidgets.QCheckBox(self.groupBox_2)
+        self.cbxProtofoliusIssueNumberScheme.setObjectName("cbxProtofoliusIssueNumberScheme")
+        self.verticalLayout_7.addWidget(self.cbxProtofoliusIssueNumberScheme)
+        self.cbxAllowIssueStartWithLetter = QtWidgets.QCheckBox(self.groupBox_2)
+        self.cbxAllowIssueStartWithLetter.setObjectName("cbxAllowIssueStartWithLetter")
+        self.verticalLayout_7.addWidget(self.cbxAllowIssueStartWithLetter)
+        self.verticalLayout_6.addWidget(self.groupBox_2)
+        self.groupBox_3 = QtWidgets.QGroupBox(self.tFilenameParser)
+        self.groupBox_3.setObjectName("groupBox_3")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.cbxSplitWords = QtWidgets.QCheckBox(self.groupBox_3)
+        self.cbxSplitWords.setObjectName("cbxSplitWords")
+        self.verticalLayout_8.addWidget(self.cbxSplitWords)
+        self.leFilenameParserTest = QtWidgets.QLineEdit(self.groupBox_3)
+        self.leFilenameParserTest.setObjectName("leFilenameParserTest")
+        self.verticalLayout_8.addWidget(self.leFilenameParserTest)
+        self.lblFilenameParserTest = QtWidgets.QLabel(self.groupBox_3)
+        self.lblFilenameParserTest.setTextFormat(QtCore.Qt.PlainText)
+        self.lblFilenameParserTest.setTextInteractionFlags(
+            QtCore.Qt.LinksAccessibleByMouse | QtCore.Qt.TextSelectableByKeyboard | QtCore.Qt.TextSelectableByMouse
+        )
+        self.lblFilenameParserTest.setObjectName("lblFilenameParserTest")
+        self.verticalLayout_8.addWidget(self.lblFilenameParserTest)
+        self.verticalLayout_6.addWidget(self.groupBox_3)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_6.addItem(spacerItem1)
+        self.tabWidget.addTab(self.tFilenameParser, "")
+        self.tComicTalkers = QtWidgets.QWidget()
+        self.tComicTalkers.setObjectName("tComicTalkers")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.tComicTalkers)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.tabWidget.addTab(self.tComicTalkers, "")
+        self.tCBL = QtWidgets.QWidget()
+        self.tCBL.setObjectName("tCBL")
+        self.gridLayout_6 = QtWidgets.QGridLayout(self.tCBL)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        self.cbxApplyCBLTransformOnCVIMport = QtWidgets.QCheckBox(self.tCBL)
+        self.cbxApplyCBLTransformOnCVIMport.setObjectName("cbxApplyCBLTransformOnCVIMport")
+        self.gridLayout_6.addWidget(self.cbxApplyCBLTransformOnCVIMport, 0, 0, 1, 1)
+        self.cbxApplyCBLTransformOnBatchOperation = QtWidgets.QCheckBox(self.tCBL)
+        self.cbxApplyCBLTransformOnBatchOperation.setObjectName("cbxApplyCBLTransformOnBatchOperation")
+        self.gridLayout_6.addWidget(self.cbxApplyCBLTransformOnBatchOperation, 1, 0, 1, 1)
+        self.groupBox = QtWidgets.QGroupBox(self.tCBL)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy)
+        self.groupBox.setObjectName("groupBox")
+        self.layoutWidget = QtWidgets.QWidget(self.groupBox)
+        self.layoutWidget.setGeometry(QtCore.QRect(11, 21, 251, 199))
+        self.layoutWidget.setObjectName("layoutWidget")
+        self.gridLayout_7 = QtWidgets.QGridLayout(self.layoutWidget)
+        self.gridLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.cbxCopyLocationsToTags = QtWidgets.QCheckBox(self.layoutWidget)
+        self.cbxCopyLocationsToTags.setObjectName("cbxCopyLocationsToTags")
+        self.gridLayout_7.addWidget(self.cbxCopyLocationsToTags, 3, 0, 1, 1)
+        self.cbxAssumeLoneCreditIsPrimary = QtWidgets.QCheckBox(self.layoutWidget)
+        self.cbxAssumeLoneCreditIsPrimary.setObjectName("cbxAssumeLoneCreditIsPrimary")
+        self.gridLayout_7.addWidget(self.cbxAssumeLoneCreditIsPrimary, 0, 0, 1, 1)
+        self.cbxCopyCharactersToTags = QtWidgets.QCheckBox(self.layoutWidget)
+        self.cbxCopyCharactersToTags.setObjectName("cbxCopyCharactersToTags")
+        self.gridLayout_7.addWidget(self.cbxCopyCharactersToTags, 1, 0, 1, 1)
+        self.cbxCopyTeamsToTags = QtWidgets.QCheckBox(self.layoutWidget)
+        self.cbxCopyTeamsToTags.setObjectName("cbxCopyTeamsToTags")
+        self.gridLayout_7.addWidget(self.cbxCopyTeamsToTags, 2, 0, 1, 1)
+        self.cbxCopyNotesToComments = QtWidgets.QCheckBox(self.layoutWidget)
+        self.cbxCopyNotesToComments.setObjectName("cbxCopyNotesToComments")
+        self.gridLayout_7.addWidget(self.cbxCopyNotesToComments, 5, 0, 1, 1)
+        self.cbxCopyWebLinkToComments = QtWidgets.QCheckBox(self.layoutWidget)
+        self.cbxCopyWebLinkToComments.setObjectName("cbxCopyWebLinkToComments")
+        self.gridLayout_7.addWidget(self.cbxCopyWebLinkToComments, 6, 0, 1, 1)
+        self.cbxCopyStoryArcsToTags = QtWidgets.QCheckBox(self.layoutWidget)
+        self.cbxCopyStoryArcsToTags.setObjectName("cbxCopyStoryArcsToTags")
+        self.gridLayout_7.addWidget(self.cbxCopyStoryArcsToTags, 4, 0, 1, 1)
+        self.gridLayout_6.addWidget(self.groupBox, 3, 0, 1, 1)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        self.gridLayout_6.addItem(spacerItem2, 2, 0, 1, 1)
+        self.tabWidget.addTab(self.tCBL, "")
+        self.tRename = QtWidgets.QWidget()
+        self.tRename.setObjectName("tRename")
+        self.gridLayout_5 = QtWidgets.QGridLayout(self.tRename)
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        self.btnAddValueReplacement = QtWidgets.QPushButton(self.tRename)
+        self.btnAddValueReplacement.setObjectName("btnAddValueReplacement")
+        self.gridLayout_5.addWidget(self.btnAddValueReplacement, 3, 2, 1, 1)
+        self.btnRemoveLiteralReplacement = QtWidgets.QPushButton(self.tRename)
+        self.btnRemoveLiteralReplacement.setObjectName("btnRemoveLiteralReplacement")
+        self.gridLayout_5.addWidget(self.btnRemoveLiteralReplacement, 3, 1, 1, 1)
+        self.formLayout_3 = QtWidgets.QFormLayout()
+        self.formLayout_3.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.formLayout_3.setObjectName("formLayout_3")
+        self.lblTemplate = QtWidgets.QLabel(self.tRename)
+        self.lblTemplate.setObjectName("lblTemplate")
+        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.lblTemplate)
+        self.leRenameTemplate = QtWidgets.QLineEdit(self.tRename)
+        self.leRenameTemplate.setObjectName("leRenameTemplate")
+        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.leRenameTemplate)
+        self.btnTemplateHelp = QtWidgets.QPushButton(self.tRename)
+        self.btnTemplateHelp.setObjectName("btnTemplateHelp")
+        self.formLayout_3.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.btnTemplateHelp)
+        self.lblRenameTest = QtWidgets.QLabel(self.tRename)
+        self.lblRenameTest.setText("")
+        self.lblRenameTest.setTextFormat(QtCore.Qt.PlainText)
+        self.lblRenameTest.setTextInteractionFlags(
+            QtCore.Qt.LinksAccessibleByMouse | QtCore.Qt.TextSelectableByKeyboard | QtCore.Qt.TextSelectableByMouse
+        )
+        self.lblRenameTest.setObjectName("lblRenameTest")
+        self.formLayout_3.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.lblRenameTest)
+        self.lblPadding = QtWidgets.QLabel(self.tRename)
+        self.lblPadding.setObjectName("lblPadding")
+        self.formLayout_3.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.lblPadding)
+        self.leIssueNumPadding = QtWidgets.QLineEdit(self.tRename)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.leIssueNumPadding.sizePolicy().hasHeightForWidth())
+        self.leIssueNumPadding.setSizePolicy(sizePolicy)
+        self.leIssueNumPadding.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.leIssueNumPadding.setObjectName("leIssueNumPadding")
+        self.formLayout_3.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.leIssueNumPadding)
+        self.cbxSmartCleanup = QtWidgets.QCheckBox(self.tRename)
+        self.cbxSmartCleanup.setObjectName("cbxSmartCleanup")
+        self.formLayout_3.setWidget(4, QtWidgets.QFormLayout.SpanningRole, self.cbxSmartCleanup)
+        self.cbxChangeExtension = QtWidgets.QCheckBox(self.tRename)
+        self.cbxChangeExtension.setObjectName("cbxChangeExtension")
+        self.formLayout_3.setWidget(5, QtWidgets.QFormLayout.SpanningRole, self.cbxChangeExtension)
+        self.cbxMoveFiles = QtWidgets.QCheckBox(self.tRename)
+        self.cbxMoveFiles.setObjectName("cbxMoveFiles")
+        self.formLayout_3.setWidget(7, QtWidgets.QFormLayout.LabelRole, self.cbxMoveFiles)
+        self.lblDirectory = QtWidgets.QLabel(self.tRename)
+        self.lblDirectory.setObjectName("lblDirectory")
+        self.formLayout_3.setWidget(9, QtWidgets.QFormLayout.LabelRole, self.lblDirectory)
+        self.leDirectory = QtWidgets.QLineEdit(self.tRename)
+        self.leDirectory.setObjectName("leDirectory")
+        self.formLayout_3.setWidget(9, QtWidgets.QFormLayout.FieldRole, self.leDirectory)
+        self.cbxRenameStrict = QtWidgets.QCheckBox(self.tRename)
+        self.cbxRenameStrict.setObjectName("cbxRenameStrict")
+        self.formLayout_3.setWidget(8, QtWidgets.QFormLayout.LabelRole, self.cbxRenameStrict)
+        self.lblDir = QtWidgets.QLabel(self.tRename)
+        self.lblDir.setObjectName("lblDir")
+        self.formLayout_3.setWidget(10, QtWidgets.QFormLayout.FieldRole, self.lblDir)
+        self.gridLayout_5.addLayout(self.formLayout_3, 0, 0, 1, 4)
+        self.btnAddLiteralReplacement = QtWidgets.QPushButton(self.tRename)
+        self.btnAddLiteralReplacement.setObjectName("btnAddLiteralReplacement")
+        self.gridLayout_5.addWidget(self.btnAddLiteralReplacement, 3, 0, 1, 1)
+        self.btnRemoveValueReplacement = QtWidgets.QPushButton(self.tRename)
+        self.btnRemoveValueReplacement.setObjectName("btnRemoveValueReplacement")
+        self.gridLayout_5.addWidget(self.btnRemoveValueReplacement, 3, 3, 1, 1)
+        self.twValueReplacements = QtWidgets.QTableWidget(self.tRename)
+        font = QtGui.QFont()
+        font.setFamily("Monaco")
+        self.twValueReplacements.setFont(font)
+        self.twValueReplacements.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.twValueReplacements.setObjectName("twValueReplacements")
+        self.twValueReplacements.setColumnCount(3)
+        self.twValueReplacements.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.twValueReplacements.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twValueReplacements.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twValueReplacements.setHorizontalHeaderItem(2, item)
+        self.twValueReplacements.horizontalHeader().setStretchLastSection(True)
+        self.gridLayout_5.addWidget(self.twValueReplacements, 2, 2, 1, 2)
+        self.twLiteralReplacements = QtWidgets.QTableWidget(self.tRename)
+        font = QtGui.QFont()
+        font.setFamily("Monaco")
+        self.twLiteralReplacements.setFont(font)
+        self.twLiteralReplacements.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+        self.twLiteralReplacements.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.twLiteralReplacements.setColumnCount(3)
+        self.twLiteralReplacements.setObjectName("twLiteralReplacements")
+        self.twLiteralReplacements.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.twLiteralReplacements.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twLiteralReplacements.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twLiteralReplacements.setHorizontalHeaderItem(2, item)
+        self.twLiteralReplacements.horizontalHeader().setStretchLastSection(True)
+        self.gridLayout_5.addWidget(self.twLiteralReplacements, 2, 0, 1, 2)
+        self.lblValueReplacements = QtWidgets.QLabel(self.tRename)
+        self.lblValueReplacements.setObjectName("lblValueReplacements")
+        self.gridLayout_5.addWidget(self.lblValueReplacements, 1, 2, 1, 2)
+        self.lblLiteralReplacements = QtWidgets.QLabel(self.tRename)
+        self.lblLiteralReplacements.setObjectName("lblLiteralReplacements")
+        self.gridLayout_5.addWidget(self.lblLiteralReplacements, 1, 0, 1, 2)
+        self.tabWidget.addTab(self.tRename, "")
+        self.tRARTools = QtWidgets.QWidget()
+        self.tRARTools.setObjectName("tRARTools")
+        self.verticalLayout_21 = QtWidgets.QVBoxLayout(self.tRARTools)
+        self.verticalLayout_21.setObjectName("verticalLayout_21")
+        self.grpBoxRar = QtWidgets.QGroupBox(self.tRARTools)
+        self.grpBoxRar.setObjectName("grpBoxRar")
+        self.gridLayout = QtWidgets.QGridLayout(self.grpBoxRar)
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_7 = QtWidgets.QLabel(self.grpBoxRar)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_7.sizePolicy().hasHeightForWidth())
+        self.label_7.setSizePolicy(sizePolicy)
+        self.label_7.setMinimumSize(QtCore.QSize(120, 0))
+        self.label_7.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.label_7.setObjectName("label_7")
+        self.gridLayout.addWidget(self.label_7, 1, 0, 1, 1)
+        self.leRarExePath = QtWidgets.QLineEdit(self.grpBoxRar)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.leRarExePath.sizePolicy().hasHeightForWidth())
+        self.leRarExePath.setSizePolicy(sizePolicy)
+        self.leRarExePath.setReadOnly(True)
+        self.leRarExePath.setObjectName("leRarExePath")
+        self.gridLayout.addWidget(self.leRarExePath, 1, 1, 1, 1)
+        self.btnBrowseRar = QtWidgets.QPushButton(self.grpBoxRar)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btnBrowseRar.sizePolicy().hasHeightForWidth())
+        self.btnBrowseRar.setSizePolicy(sizePolicy)
+        self.btnBrowseRar.setObjectName("btnBrowseRar")
+        self.gridLayout.addWidget(self.btnBrowseRar, 1, 2, 1, 1)
+        self.lblRarHelp = QtWidgets.QLabel(self.grpBoxRar)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lblRarHelp.sizePolicy().hasHeightForWidth())
+        self.lblRarHelp.setSizePolicy(sizePolicy)
+        self.lblRarHelp.setTextFormat(QtCore.Qt.RichText)
+        self.lblRarHelp.setAlignment(QtCore.Qt.AlignBottom | QtCore.Qt.AlignLeading | QtCore.Qt.AlignLeft)
+        self.lblRarHelp.setWordWrap(True)
+        self.lblRarHelp.setOpenExternalLinks(True)
+        self.lblRarHelp.setTextInteractionFlags(QtCore.Qt.LinksAccessibleByKeyboard | QtCore.Qt.LinksAccessibleByMouse)
+        self.lblRarHelp.setObjectName("lblRarHelp")
+        self.gridLayout.addWidget(self.lblRarHelp, 0, 0, 1, 3)
+        self.verticalLayout_21.addWidget(self.grpBoxRar)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_21.addItem(spacerItem3)
+        self.tabWidget.addTab(self.tRARTools, "")
+        self.verticalLayout.addWidget(self.tabWidget)
+        self.buttonBox = QtWidgets.QDialogButtonBox(SettingsWindow)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel | QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.gridLayout_2.addLayout(self.verticalLayout, 0, 0, 1, 1)
+
+        self.retranslateUi(SettingsWindow)
+        self.tabWidget.setCurrentIndex(3)
+        self.buttonBox.accepted.connect(SettingsWindow.accept)  # type: ignore
+        self.buttonBox.rejected.connect(SettingsWindow.reject)  # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(SettingsWindow)
+
+    def retranslateUi(self, SettingsWindow):
+        _translate = QtCore.QCoreApplication.translate
+        SettingsWindow.setWindowTitle(_translate("SettingsWindow", "Settings"))
+        self.btnResetSettings.setText(_translate("SettingsWindow", "Default Settings"))
+        self.lblDefaultSettings.setText(_translate("SettingsWindow", "Revert to default settings"))
+        self.btnClearCache.setText(_translate("SettingsWindow", "Clear Cache"))
+        self.label_2.setText(
+            _translate(
+                "SettingsWindow",
+                "If you need to free up the disk space, or the responses seems out of date, clear the online cache.",
+            )
+        )
+        self.cbxCheckForNewVersion.setText(_translate("SettingsWindow", "Check for new version on startup"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tGeneral), _translate("SettingsWindow", "General"))
+        self.label_3.setText(_translate("SettingsWindow", "Default Name Match Ratio Threshold: Search:"))
+        self.label.setText(_translate("SettingsWindow", "Default Name Match Ratio Threshold: Auto-Identify:"))
+        self.label_9.setText(_translate("SettingsWindow", 'Always use Publisher Filter on "manual" searches:'))
+        self.cbxUseFilter.setToolTip(
+            _translate(
+                "SettingsWindow",
+                '<html><head/><body><p>Applies the <span style=" font-weight:600;">Publisher Filter</span> on all searches.<br/>The search window has a dynamic toggle to show the unfiltered results.</p></body></html>',
+            )
+        )
+        self.label_4.setText(_translate("SettingsWindow", "Publisher Filter:"))
+        self.sbNameMatchSearchThresh.setSuffix(_translate("SettingsWindow", "%"))
+        self.sbNameMatchIdentifyThresh.setSuffix(_translate("SettingsWindow", "%"))
+        self.label_5.setText(
+            _translate(
+                "SettingsWindow",
+                "<html><head/><body><p>These settings are for the automatic issue identifier which searches online for matches. </p><p>Hover the mouse over an entry field for more info.</p></body></html>",
+            )
+        )
+        self.cbxExactMatches.setText(_translate("SettingsWindow", "Initially show Series Name exact matches first"))
+        self.cbxSortByYear.setText(
+            _translate("SettingsWindow", "Initially sort Series search results by Starting Year instead of No. Issues")
+        )
+        self.cbxClearFormBeforePopulating.setText(
+            _translate("SettingsWindow", "Clear form before importing comic metadata")
+        )
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tSearching), _translate("SettingsWindow", "Searching"))
+        self.cbxComplicatedParser.setText(_translate("SettingsWindow", 'Use "Complicated" Parser'))
+        self.cbxRemoveC2C.setText(_translate("SettingsWindow", "Remove 'C2C' from Scan Info"))
+        self.cbxRemoveFCBD.setText(_translate("SettingsWindow", "Remove 'FCBD' from Scan Info"))
+        self.cbxRemovePublisher.setText(_translate("SettingsWindow", "Remove Publisher from filename"))
+        self.cbxProtofoliusIssueNumberScheme.setText(
+            _translate("SettingsWindow", "Use protofolius's issue number scheme")
+        )
+        self.cbxAllowIssueStartWithLetter.setText(
+            _translate("SettingsWindow", "Allow issue numbers to start with a letter")
+        )
+        self.cbxSplitWords.setText(
+            _translate(
+                "SettingsWindow",
+                "!Preview only! Attempts to split words before parsing the filename. e.g. 'judgedredd' to 'judge dredd'",
+            )
+        )
+        self.tabWidget.setTabText(
+            self.tabWidget.indexOf(self.tFilenameParser), _translate("SettingsWindow", "Filename Parser")
+        )
+        self.tabWidget.setTabText(
+            self.tabWidget.indexOf(self.tComicTalkers), _translate("SettingsWindow", "Metadata Sources")
+        )
+        self.cbxApplyCBLTransformOnCVIMport.setText(
+            _translate("SettingsWindow", "Apply CBL Transforms on ComicVine Import")
+        )
+        self.cbxApplyCBLTransformOnBatchOperation.setText(
+            _translate("SettingsWindow", "Apply CBL Transforms on Batch Copy Operations to CBL Tags")
+        )
+        self.groupBox.setTitle(_translate("SettingsWindow", "CBL Transforms"))
+        self.cbxCopyLocationsToTags.setText(_translate("SettingsWindow", "Copy Locations to Generic Tags"))
+        self.cbxAssumeLoneCreditIsPrimary.setText(_translate("SettingsWindow", "Assume Lone Credit Is Primary"))
+        self.cbxCopyCharactersToTags.setText(_translate("SettingsWindow", "Copy Characters to Generic Tags"))
+        self.cbxCopyTeamsToTags.setText(_translate("SettingsWindow", "Copy Teams to Generic Tags"))
+        self.cbxCopyNotesToComments.setText(_translate("SettingsWindow", "Copy Notes to Comments"))
+        self.cbxCopyWebLinkToComments.setText(_translate("SettingsWindow", "Copy Web Link to Comments"))
+        self.cbxCopyStoryArcsToTags.setText(_translate("SettingsWindow", "Copy Story Arcs to Generic Tags"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tCBL), _translate("SettingsWindow", "CBL"))
+        self.btnAddValueReplacement.setText(_translate("SettingsWindow", "Add Replacement"))
+        self.btnRemoveLiteralReplacement.setText(_translate("SettingsWindow", "Remove Replacement"))
+        self.lblTemplate.setText(_translate("SettingsWindow", "Template:"))
+        self.btnTemplateHelp.setText(_translate("SettingsWindow", "Template Help"))
+        self.lblPadding.setText(_translate("SettingsWindow", "Issue # Zero Padding"))
+        self.leIssueNumPadding.setToolTip(
+            _translate(
+                "SettingsWindow",
+                '<html><head/><body><p><span style=" font-weight:600;">Issue # Zero Padding</span> dictates if the issue number should be padded on left with zeros.  A value of 2, for example, means that the number will always be at least two digits.</p></body></html>',
+            )
+        )
+        self.cbxSmartCleanup.setToolTip(
+            _translate(
+                "SettingsWindow",
+                '<html><head/><body><p><span style=" font-weight:600;">&quot;Smart Text Cleanup&quot; </span>will attempt to clean up the new filename if there are missing fields from the template.  For example, removing empty braces, repeated spaces and dashes, and more.  Experimental feature.</p></body></html>',
+            )
+        )
+        self.cbxSmartCleanup.setText(_translate("SettingsWindow", "Use Smart Text Cleanup (Experimental)"))
+        self.cbxChangeExtension.setText(_translate("SettingsWindow", "Change Extension Based On Archive Type"))
+        self.cbxMoveFiles.setToolTip(_translate("SettingsWindow", "If checked moves files to specified folder"))
+        self.cbxMoveFiles.setText(_translate("SettingsWindow", "Move files when renaming"))
+        self.lblDirectory.setText(_translate("SettingsWindow", "Destination Directory:"))
+        self.cbxRenameStrict.setToolTip(
+            _translate(
+                "SettingsWindow",
+                "If checked will ensure reserved characters and filenames are removed for all Operating Systems.<br/>By default only removes restricted characters and filenames for the current Operating System.",
+            )
+        )
+        self.cbxRenameStrict.setText(_translate("SettingsWindow", "Strict renaming"))
+        self.btnAddLiteralReplacement.setText(_translate("SettingsWindow", "Add Replacement"))
+        self.btnRemoveValueReplacement.setText(_translate("SettingsWindow", "Remove Replacement"))
+        item = self.twValueReplacements.horizontalHeaderItem(0)
+        item.setText(_translate("SettingsWindow", "Find"))
+        item = self.twValueReplacements.horizontalHeaderItem(1)
+        item.setText(_translate("SettingsWindow", "Replacement"))
+        item = self.twValueReplacements.horizontalHeaderItem(2)
+        item.setText(_translate("SettingsWindow", "Strict Only"))
+        item = self.twLiteralReplacements.horizontalHeaderItem(0)
+        item.setText(_translate("SettingsWindow", "Find"))
+        item = self.twLiteralReplacements.horizontalHeaderItem(1)
+        item.setText(_translate("SettingsWindow", "Replacement"))
+        item = self.twLiteralReplacements.horizontalHeaderItem(2)
+        item.setText(_translate("SettingsWindow", "Strict Only"))
+        self.lblValueReplacements.setText(_translate("SettingsWindow", "Value Text Replacements"))
+        self.lblLiteralReplacements.setText(_translate("SettingsWindow", "Literal Text Replacements"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tRename), _translate("SettingsWindow", "Rename"))
+        self.label_7.setText(_translate("SettingsWindow", "RAR program"))
+        self.btnBrowseRar.setText(_translate("SettingsWindow", "..."))
+        self.lblRarHelp.setText(
+            _translate(
+                "SettingsWindow",
+                '<html><head/><body><p>In order to write to CBR/RAR archives, you will need to have the shareware tools from <a href="www.win-rar.com/download.html"><span style=" text-decoration: underline; color:#0000ff;">WinRAR</span></a> installed. </p></body></html>',
+            )
+        )
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tRARTools), _translate("SettingsWindow", "RAR Tools"))
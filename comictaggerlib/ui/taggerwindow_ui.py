@@ -0,0 +1,876 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'comictaggerlib/ui/taggerwindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from __future__ import annotations
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_TaggerWindow(object):
+    def setupUi(self, TaggerWindow):
+        TaggerWindow.setObjectName("TaggerWindow")
+        TaggerWindow.resize(1096, 621)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(TaggerWindow.sizePolicy().hasHeightForWidth())
+        TaggerWindow.setSizePolicy(sizePolicy)
+        TaggerWindow.setAcceptDrops(False)
+        TaggerWindow.setUnifiedTitleAndToolBarOnMac(True)
+        self.centralWidget = QtWidgets.QWidget(TaggerWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralWidget.sizePolicy().hasHeightForWidth())
+        self.centralWidget.setSizePolicy(sizePolicy)
+        self.centralWidget.setAcceptDrops(True)
+        self.centralWidget.setObjectName("centralWidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.centralWidget)
+        self.gridLayout.setContentsMargins(11, 11, 11, 11)
+        self.gridLayout.setSpacing(6)
+        self.gridLayout.setObjectName("gridLayout")
+        self.splitter = QtWidgets.QSplitter(self.centralWidget)
+        self.splitter.setEnabled(True)
+        self.splitter.setAcceptDrops(True)
+        self.splitter.setOrientation(QtCore.Qt.Horizontal)
+        self.splitter.setObjectName("splitter")
+        self.layoutWidget = QtWidgets.QWidget(self.splitter)
+        self.layoutWidget.setObjectName("layoutWidget")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.layoutWidget)
+        self.horizontalLayout_2.setContentsMargins(11, 11, 11, 11)
+        self.horizontalLayout_2.setSpacing(6)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setSpacing(6)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.formLayout.setFormAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop)
+        self.formLayout.setSpacing(6)
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(self.layoutWidget)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.cbLoadDataStyle = QtWidgets.QComboBox(self.layoutWidget)
+        self.cbLoadDataStyle.setObjectName("cbLoadDataStyle")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.cbLoadDataStyle)
+        self.saveStyleLabel = QtWidgets.QLabel(self.layoutWidget)
+        self.saveStyleLabel.setObjectName("saveStyleLabel")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.saveStyleLabel)
+        self.cbSaveDataStyle = QtWidgets.QComboBox(self.layoutWidget)
+        self.cbSaveDataStyle.setObjectName("cbSaveDataStyle")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.cbSaveDataStyle)
+        self.lbl_md_source = QtWidgets.QLabel(self.layoutWidget)
+        self.lbl_md_source.setObjectName("lbl_md_source")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.lbl_md_source)
+        self.cbx_sources = QtWidgets.QComboBox(self.layoutWidget)
+        self.cbx_sources.setObjectName("cbx_sources")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.cbx_sources)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.frameInfoBox = QtWidgets.QFrame(self.layoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frameInfoBox.sizePolicy().hasHeightForWidth())
+        self.frameInfoBox.setSizePolicy(sizePolicy)
+        self.frameInfoBox.setMinimumSize(QtCore.QSize(230, 0))
+        self.frameInfoBox.setMaximumSize(QtCore.QSize(230, 16777215))
+        self.frameInfoBox.setFrameShape(QtWidgets.QFrame.Panel)
+        self.frameInfoBox.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.frameInfoBox.setObjectName("frameInfoBox")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.frameInfoBox)
+        self.verticalLayout_4.setContentsMargins(6, 6, 6, 6)
+        self.verticalLayout_4.setSpacing(6)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.lblFilename = QtWidgets.QLabel(self.frameInfoBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lblFilename.sizePolicy().hasHeightForWidth())
+        self.lblFilename.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.lblFilename.setFont(font)
+        self.lblFilename.setText("")
+        self.lblFilename.setWordWrap(True)
+        self.lblFilename.setObjectName("lblFilename")
+        self.verticalLayout_4.addWidget(self.lblFilename)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setSpacing(6)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.lblArchiveType = QtWidgets.QLabel(self.frameInfoBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lblArchiveType.sizePolicy().hasHeightForWidth())
+        self.lblArchiveType.setSizePolicy(sizePolicy)
+        self.lblArchiveType.setMaximumSize(QtCore.QSize(200, 16777215))
+        font = QtGui.QFont()
+        font.setItalic(False)
+        self.lblArchiveType.setFont(font)
+        self.lblArchiveType.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.lblArchiveType.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.lblArchiveType.setText("")
+        self.lblArchiveType.setWordWrap(False)
+        self.lblArchiveType.setObjectName("lblArchiveType")
+        self.horizontalLayout_4.addWidget(self.lblArchiveType)
+        self.lblPageCount = QtWidgets.QLabel(self.frameInfoBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lblPageCount.sizePolicy().hasHeightForWidth())
+        self.lblPageCount.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setItalic(True)
+        self.lblPageCount.setFont(font)
+        self.lblPageCount.setText("")
+        self.lblPageCount.setObjectName("lblPageCount")
+        self.horizontalLayout_4.addWidget(self.lblPageCount)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_4)
+        self.lblTagList = QtWidgets.QLabel(self.frameInfoBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lblTagList.sizePolicy().hasHeightForWidth())
+        self.lblTagList.setSizePolicy(sizePolicy)
+        self.lblTagList.setText("")
+        self.lblTagList.setObjectName("lblTagList")
+        self.verticalLayout_4.addWidget(self.lblTagList)
+        self.verticalLayout.addWidget(self.frameInfoBox)
+        self.coverImageContainer = QtWidgets.QWidget(self.layoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.coverImageContainer.sizePolicy().hasHeightForWidth())
+        self.coverImageContainer.setSizePolicy(sizePolicy)
+        self.coverImageContainer.setMinimumSize(QtCore.QSize(230, 380))
+        self.coverImageContainer.setMaximumSize(QtCore.QSize(230, 380))
+        self.coverImageContainer.setObjectName("coverImageContainer")
+        self.verticalLayout.addWidget(self.coverImageContainer)
+        spacerItem = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.horizontalLayout_2.addLayout(self.verticalLayout)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout.setSpacing(6)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.tabWidget = QtWidgets.QTabWidget(self.layoutWidget)
+        self.tabWidget.setEnabled(True)
+        self.tabWidget.setAcceptDrops(False)
+        self.tabWidget.setObjectName("tabWidget")
+        self.tab = QtWidgets.QWidget()
+        self.tab.setObjectName("tab")
+        self.gridLayout_5 = QtWidgets.QGridLayout(self.tab)
+        self.gridLayout_5.setContentsMargins(11, 11, 11, 11)
+        self.gridLayout_5.setSpacing(6)
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        self.scrollArea = QtWidgets.QScrollArea(self.tab)
+        self.scrollArea.setBaseSize(QtCore.QSize(0, 0))
+        self.scrollArea.setAcceptDrops(True)
+        self.scrollArea.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        self.scrollArea.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        self.scrollArea.setWidgetResizable(False)
+        self.scrollArea.setObjectName("scrollArea")
+        self.scrollAreaWidgetContents = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents.setEnabled(True)
+        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 470, 520))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.scrollAreaWidgetContents.sizePolicy().hasHeightForWidth())
+        self.scrollAreaWidgetContents.setSizePolicy(sizePolicy)
+        self.scrollAreaWidgetContents.setBaseSize(QtCore.QSize(0, 0))
+        self.scrollAreaWidgetContents.setAcceptDrops(True)
+        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+        self.gridLayout_6 = QtWidgets.QGridLayout(self.scrollAreaWidgetContents)
+        self.gridLayout_6.setContentsMargins(11, 11, 11, 11)
+        self.gridLayout_6.setSpacing(6)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setSpacing(6)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.formLayout_3 = QtWidgets.QFormLayout()
+        self.formLayout_3.setFieldGrowthPolicy(QtWidgets.QFormLayout.FieldsStayAtSizeHint)
+        self.formLayout_3.setRowWrapPolicy(QtWidgets.QFormLayout.WrapAllRows)
+        self.formLayout_3.setLabelAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing | QtCore.Qt.AlignVCenter)
+        self.formLayout_3.setHorizontalSpacing(6)
+        self.formLayout_3.setVerticalSpacing(1)
+        self.formLayout_3.setObjectName("formLayout_3")
+        self.label_4 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_4.setObjectName("label_4")
+        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_4)
+        self.leIssueNum = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leIssueNum.setAcceptDrops(False)
+        self.leIssueNum.setObjectName("leIssueNum")
+        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.leIssueNum)
+        self.label_6 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_6.setObjectName("label_6")
+        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_6)
+        self.lePubYear = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lePubYear.sizePolicy().hasHeightForWidth())
+        self.lePubYear.setSizePolicy(sizePolicy)
+        self.lePubYear.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.lePubYear.setAcceptDrops(False)
+        self.lePubYear.setInputMethodHints(QtCore.Qt.ImhDigitsOnly)
+        self.lePubYear.setObjectName("lePubYear")
+        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.lePubYear)
+        self.label_35 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_35.setObjectName("label_35")
+        self.formLayout_3.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_35)
+        self.lePubMonth = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lePubMonth.sizePolicy().hasHeightForWidth())
+        self.lePubMonth.setSizePolicy(sizePolicy)
+        self.lePubMonth.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.lePubMonth.setAcceptDrops(False)
+        self.lePubMonth.setInputMethodHints(QtCore.Qt.ImhDigitsOnly)
+        self.lePubMonth.setObjectName("lePubMonth")
+        self.formLayout_3.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.lePubMonth)
+        self.lblDay = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.lblDay.setObjectName("lblDay")
+        self.formLayout_3.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.lblDay)
+        self.lePubDay = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lePubDay.sizePolicy().hasHeightForWidth())
+        self.lePubDay.setSizePolicy(sizePolicy)
+        self.lePubDay.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.lePubDay.setAcceptDrops(False)
+        self.lePubDay.setInputMethodHints(QtCore.Qt.ImhDigitsOnly)
+        self.lePubDay.setObjectName("lePubDay")
+        self.formLayout_3.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.lePubDay)
+        self.label_5 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_5.setObjectName("label_5")
+        self.formLayout_3.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.label_5)
+        self.leIssueCount = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leIssueCount.setAcceptDrops(False)
+        self.leIssueCount.setInputMethodHints(QtCore.Qt.ImhDigitsOnly)
+        self.leIssueCount.setObjectName("leIssueCount")
+        self.formLayout_3.setWidget(4, QtWidgets.QFormLayout.FieldRole, self.leIssueCount)
+        self.label_9 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_9.setObjectName("label_9")
+        self.formLayout_3.setWidget(5, QtWidgets.QFormLayout.LabelRole, self.label_9)
+        self.leVolumeNum = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leVolumeNum.setAcceptDrops(False)
+        self.leVolumeNum.setObjectName("leVolumeNum")
+        self.formLayout_3.setWidget(5, QtWidgets.QFormLayout.FieldRole, self.leVolumeNum)
+        self.label_12 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_12.setObjectName("label_12")
+        self.formLayout_3.setWidget(6, QtWidgets.QFormLayout.LabelRole, self.label_12)
+        self.leVolumeCount = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leVolumeCount.setAcceptDrops(False)
+        self.leVolumeCount.setInputMethodHints(QtCore.Qt.ImhDigitsOnly)
+        self.leVolumeCount.setObjectName("leVolumeCount")
+        self.formLayout_3.setWidget(6, QtWidgets.QFormLayout.FieldRole, self.leVolumeCount)
+        self.label_22 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_22.setObjectName("label_22")
+        self.formLayout_3.setWidget(7, QtWidgets.QFormLayout.LabelRole, self.label_22)
+        self.leAltIssueNum = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.leAltIssueNum.sizePolicy().hasHeightForWidth())
+        self.leAltIssueNum.setSizePolicy(sizePolicy)
+        self.leAltIssueNum.setAcceptDrops(False)
+        self.leAltIssueNum.setObjectName("leAltIssueNum")
+        self.formLayout_3.setWidget(7, QtWidgets.QFormLayout.FieldRole, self.leAltIssueNum)
+        self.label_23 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_23.setObjectName("label_23")
+        self.formLayout_3.setWidget(8, QtWidgets.QFormLayout.LabelRole, self.label_23)
+        self.leAltIssueCount = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leAltIssueCount.setAcceptDrops(False)
+        self.leAltIssueCount.setObjectName("leAltIssueCount")
+        self.formLayout_3.setWidget(8, QtWidgets.QFormLayout.FieldRole, self.leAltIssueCount)
+        self.horizontalLayout_5.addLayout(self.formLayout_3)
+        self.formLayout_2 = QtWidgets.QFormLayout()
+        self.formLayout_2.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.formLayout_2.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self.formLayout_2.setRowWrapPolicy(QtWidgets.QFormLayout.WrapAllRows)
+        self.formLayout_2.setLabelAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing | QtCore.Qt.AlignVCenter)
+        self.formLayout_2.setFormAlignment(QtCore.Qt.AlignLeading | QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        self.formLayout_2.setHorizontalSpacing(0)
+        self.formLayout_2.setVerticalSpacing(1)
+        self.formLayout_2.setObjectName("formLayout_2")
+        self.label_2 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_2.setObjectName("label_2")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.leSeries = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leSeries.setAcceptDrops(False)
+        self.leSeries.setObjectName("leSeries")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.leSeries)
+        self.label_3 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_3.setObjectName("label_3")
+        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.leTitle = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leTitle.setAcceptDrops(False)
+        self.leTitle.setObjectName("leTitle")
+        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.leTitle)
+        self.label_8 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_8.setObjectName("label_8")
+        self.formLayout_2.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_8)
+        self.lePublisher = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.lePublisher.setAcceptDrops(False)
+        self.lePublisher.setObjectName("lePublisher")
+        self.formLayout_2.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.lePublisher)
+        self.label_10 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_10.setObjectName("label_10")
+        self.formLayout_2.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.label_10)
+        self.leImprint = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.leImprint.sizePolicy().hasHeightForWidth())
+        self.leImprint.setSizePolicy(sizePolicy)
+        self.leImprint.setAcceptDrops(False)
+        self.leImprint.setObjectName("leImprint")
+        self.formLayout_2.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.leImprint)
+        self.label_33 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_33.setObjectName("label_33")
+        self.formLayout_2.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.label_33)
+        self.leSeriesGroup = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leSeriesGroup.setAcceptDrops(False)
+        self.leSeriesGroup.setObjectName("leSeriesGroup")
+        self.formLayout_2.setWidget(4, QtWidgets.QFormLayout.FieldRole, self.leSeriesGroup)
+        self.label_25 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_25.setObjectName("label_25")
+        self.formLayout_2.setWidget(5, QtWidgets.QFormLayout.LabelRole, self.label_25)
+        self.leStoryArc = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leStoryArc.setAcceptDrops(False)
+        self.leStoryArc.setObjectName("leStoryArc")
+        self.formLayout_2.setWidget(5, QtWidgets.QFormLayout.FieldRole, self.leStoryArc)
+        self.label_24 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_24.setObjectName("label_24")
+        self.formLayout_2.setWidget(6, QtWidgets.QFormLayout.LabelRole, self.label_24)
+        self.leGenre = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leGenre.setAcceptDrops(False)
+        self.leGenre.setObjectName("leGenre")
+        self.formLayout_2.setWidget(6, QtWidgets.QFormLayout.FieldRole, self.leGenre)
+        self.label_18 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_18.setObjectName("label_18")
+        self.formLayout_2.setWidget(7, QtWidgets.QFormLayout.LabelRole, self.label_18)
+        self.cbMaturityRating = QtWidgets.QComboBox(self.scrollAreaWidgetContents)
+        self.cbMaturityRating.setAutoFillBackground(False)
+        self.cbMaturityRating.setEditable(True)
+        self.cbMaturityRating.setObjectName("cbMaturityRating")
+        self.formLayout_2.setWidget(7, QtWidgets.QFormLayout.FieldRole, self.cbMaturityRating)
+        self.label_31 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_31.setObjectName("label_31")
+        self.formLayout_2.setWidget(8, QtWidgets.QFormLayout.LabelRole, self.label_31)
+        self.cbManga = QtWidgets.QComboBox(self.scrollAreaWidgetContents)
+        self.cbManga.setAutoFillBackground(False)
+        self.cbManga.setObjectName("cbManga")
+        self.formLayout_2.setWidget(8, QtWidgets.QFormLayout.FieldRole, self.cbManga)
+        self.label_26 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_26.setObjectName("label_26")
+        self.formLayout_2.setWidget(9, QtWidgets.QFormLayout.LabelRole, self.label_26)
+        self.cbFormat = QtWidgets.QComboBox(self.scrollAreaWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cbFormat.sizePolicy().hasHeightForWidth())
+        self.cbFormat.setSizePolicy(sizePolicy)
+        self.cbFormat.setEditable(True)
+        self.cbFormat.setObjectName("cbFormat")
+        self.formLayout_2.setWidget(9, QtWidgets.QFormLayout.FieldRole, self.cbFormat)
+        self.label_32 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_32.setObjectName("label_32")
+        self.formLayout_2.setWidget(10, QtWidgets.QFormLayout.LabelRole, self.label_32)
+        self.cbBW = QtWidgets.QCheckBox(self.scrollAreaWidgetContents)
+        self.cbBW.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.cbBW.setAutoFillBackground(False)
+        self.cbBW.setText("")
+        self.cbBW.setObjectName("cbBW")
+        self.formLayout_2.setWidget(10, QtWidgets.QFormLayout.FieldRole, self.cbBW)
+        self.label_13 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_13.setObjectName("label_13")
+        self.formLayout_2.setWidget(11, QtWidgets.QFormLayout.LabelRole, self.label_13)
+        self.cbLanguage = QtWidgets.QComboBox(self.scrollAreaWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cbLanguage.sizePolicy().hasHeightForWidth())
+        self.cbLanguage.setSizePolicy(sizePolicy)
+        self.cbLanguage.setObjectName("cbLanguage")
+        self.formLayout_2.setWidget(11, QtWidgets.QFormLayout.FieldRole, self.cbLanguage)
+        self.label_14 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_14.setObjectName("label_14")
+        self.formLayout_2.setWidget(12, QtWidgets.QFormLayout.LabelRole, self.label_14)
+        self.cbCountry = QtWidgets.QComboBox(self.scrollAreaWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cbCountry.sizePolicy().hasHeightForWidth())
+        self.cbCountry.setSizePolicy(sizePolicy)
+        self.cbCountry.setObjectName("cbCountry")
+        self.formLayout_2.setWidget(12, QtWidgets.QFormLayout.FieldRole, self.cbCountry)
+        self.label_21 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_21.setObjectName("label_21")
+        self.formLayout_2.setWidget(13, QtWidgets.QFormLayout.LabelRole, self.label_21)
+        self.leAltSeries = QtWidgets.QLineEdit(self.scrollAreaWidgetContents)
+        self.leAltSeries.setAcceptDrops(False)
+        self.leAltSeries.setObjectName("leAltSeries")
+        self.formLayout_2.setWidget(13, QtWidgets.QFormLayout.FieldRole, self.leAltSeries)
+        self.horizontalLayout_5.addLayout(self.formLayout_2)
+        self.horizontalLayout_5.setStretch(0, 20)
+        self.horizontalLayout_5.setStretch(1, 100)
+        self.gridLayout_6.addLayout(self.horizontalLayout_5, 0, 0, 1, 1)
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+        self.gridLayout_5.addWidget(self.scrollArea, 0, 0, 1, 1)
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_2 = QtWidgets.QWidget()
+        self.tab_2.setObjectName("tab_2")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.tab_2)
+        self.gridLayout_4.setContentsMargins(11, 11, 11, 11)
+        self.gridLayout_4.setSpacing(6)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setSpacing(6)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setSpacing(6)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.twCredits = QtWidgets.QTableWidget(self.tab_2)
+        self.twCredits.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.twCredits.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.twCredits.setRowCount(0)
+        self.twCredits.setColumnCount(3)
+        self.twCredits.setObjectName("twCredits")
+        item = QtWidgets.QTableWidgetItem()
+        item.setTextAlignment(QtCore.Qt.AlignCenter)
+        self.twCredits.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twCredits.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.twCredits.setHorizontalHeaderItem(2, item)
+        self.twCredits.horizontalHeader().setMinimumSectionSize(2)
+        self.twCredits.horizontalHeader().setStretchLastSection(True)
+        self.twCredits.verticalHeader().setVisible(False)
+        self.verticalLayout_3.addWidget(self.twCredits)
+        self.formLayout_8 = QtWidgets.QFormLayout()
+        self.formLayout_8.setFieldGrowthPolicy(QtWidgets.QFormLayout.ExpandingFieldsGrow)
+        self.formLayout_8.setSpacing(6)
+        self.formLayout_8.setObjectName("formLayout_8")
+        self.label_20 = QtWidgets.QLabel(self.tab_2)
+        self.label_20.setObjectName("label_20")
+        self.formLayout_8.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_20)
+        self.leScanInfo = QtWidgets.QLineEdit(self.tab_2)
+        self.leScanInfo.setObjectName("leScanInfo")
+        self.formLayout_8.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.leScanInfo)
+        self.verticalLayout_3.addLayout(self.formLayout_8)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_3)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setSpacing(6)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.btnAddCredit = QtWidgets.QPushButton(self.tab_2)
+        self.btnAddCredit.setObjectName("btnAddCredit")
+        self.verticalLayout_2.addWidget(self.btnAddCredit)
+        self.btnRemoveCredit = QtWidgets.QPushButton(self.tab_2)
+        self.btnRemoveCredit.setObjectName("btnRemoveCredit")
+        self.verticalLayout_2.addWidget(self.btnRemoveCredit)
+        self.btnEditCredit = QtWidgets.QPushButton(self.tab_2)
+        self.btnEditCredit.setObjectName("btnEditCredit")
+        self.verticalLayout_2.addWidget(self.btnEditCredit)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem1)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_2)
+        self.gridLayout_4.addLayout(self.horizontalLayout_3, 0, 0, 1, 1)
+        self.tabWidget.addTab(self.tab_2, "")
+        self.tab_3 = QtWidgets.QWidget()
+        self.tab_3.setObjectName("tab_3")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.tab_3)
+        self.gridLayout_2.setContentsMargins(11, 11, 11, 11)
+        self.gridLayout_2.setSpacing(6)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.formLayout_6 = QtWidgets.QFormLayout()
+        self.formLayout_6.setFieldGrowthPolicy(QtWidgets.QFormLayout.ExpandingFieldsGrow)
+        self.formLayout_6.setSpacing(6)
+        self.formLayout_6.setObjectName("formLayout_6")
+        self.label_15 = QtWidgets.QLabel(self.tab_3)
+        self.label_15.setObjectName("label_15")
+        self.formLayout_6.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_15)
+        self.teComments = QtWidgets.QTextEdit(self.tab_3)
+        self.teComments.setAcceptDrops(False)
+        self.teComments.setObjectName("teComments")
+        self.formLayout_6.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.teComments)
+        self.label_16 = QtWidgets.QLabel(self.tab_3)
+        self.label_16.setObjectName("label_16")
+        self.formLayout_6.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_16)
+        self.teNotes = QtWidgets.QTextEdit(self.tab_3)
+        self.teNotes.setAcceptDrops(False)
+        self.teNotes.setObjectName("teNotes")
+        self.formLayout_6.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.teNotes)
+        self.label_19 = QtWidgets.QLabel(self.tab_3)
+        self.label_19.setObjectName("label_19")
+        self.formLayout_6.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_19)
+        self.gridLayout_7 = QtWidgets.QGridLayout()
+        self.gridLayout_7.setSpacing(6)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.leWebLink = QtWidgets.QLineEdit(self.tab_3)
+        self.leWebLink.setAcceptDrops(False)
+        self.leWebLink.setObjectName("leWebLink")
+        self.gridLayout_7.addWidget(self.leWebLink, 0, 0, 1, 1)
+        self.btnOpenWebLink = QtWidgets.QPushButton(self.tab_3)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btnOpenWebLink.sizePolicy().hasHeightForWidth())
+        self.btnOpenWebLink.setSizePolicy(sizePolicy)
+        self.btnOpenWebLink.setMaximumSize(QtCore.QSize(40, 16777215))
+        self.btnOpenWebLink.setObjectName("btnOpenWebLink")
+        self.gridLayout_7.addWidget(self.btnOpenWebLink, 0, 1, 1, 1)
+        self.formLayout_6.setLayout(2, QtWidgets.QFormLayout.FieldRole, self.gridLayout_7)
+        self.lblCriticalRating = QtWidgets.QLabel(self.tab_3)
+        self.lblCriticalRating.setObjectName("lblCriticalRating")
+        self.formLayout_6.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.lblCriticalRating)
+        self.dsbCriticalRating = QtWidgets.QDoubleSpinBox(self.tab_3)
+        self.dsbCriticalRating.setMinimumSize(QtCore.QSize(80, 0))
+        self.dsbCriticalRating.setDecimals(1)
+        self.dsbCriticalRating.setMinimum(0.0)
+        self.dsbCriticalRating.setMaximum(5.0)
+        self.dsbCriticalRating.setSingleStep(0.1)
+        self.dsbCriticalRating.setObjectName("dsbCriticalRating")
+        self.formLayout_6.setWidget(4, QtWidgets.QFormLayout.FieldRole, self.dsbCriticalRating)
+        self.gridLayout_2.addLayout(self.formLayout_6, 0, 0, 1, 1)
+        self.tabWidget.addTab(self.tab_3, "")
+        self.tab_4 = QtWidgets.QWidget()
+        self.tab_4.setObjectName("tab_4")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.tab_4)
+        self.gridLayout_3.setContentsMargins(11, 11, 11, 11)
+        self.gridLayout_3.setSpacing(6)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.formLayout_11 = QtWidgets.QFormLayout()
+        self.formLayout_11.setFieldGrowthPolicy(QtWidgets.QFormLayout.ExpandingFieldsGrow)
+        self.formLayout_11.setSpacing(6)
+        self.formLayout_11.setObjectName("formLayout_11")
+        self.label_29 = QtWidgets.QLabel(self.tab_4)
+        self.label_29.setObjectName("label_29")
+        self.formLayout_11.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_29)
+        self.teCharacters = QtWidgets.QTextEdit(self.tab_4)
+        self.teCharacters.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.teCharacters.sizePolicy().hasHeightForWidth())
+        self.teCharacters.setSizePolicy(sizePolicy)
+        self.teCharacters.setMinimumSize(QtCore.QSize(0, 0))
+        self.teCharacters.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.teCharacters.setAcceptDrops(False)
+        self.teCharacters.setObjectName("teCharacters")
+        self.formLayout_11.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.teCharacters)
+        self.label_30 = QtWidgets.QLabel(self.tab_4)
+        self.label_30.setObjectName("label_30")
+        self.formLayout_11.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_30)
+        self.teTeams = QtWidgets.QTextEdit(self.tab_4)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.teTeams.sizePolicy().hasHeightForWidth())
+        self.teTeams.setSizePolicy(sizePolicy)
+        self.teTeams.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.teTeams.setAcceptDrops(False)
+        self.teTeams.setObjectName("teTeams")
+        self.formLayout_11.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.teTeams)
+        self.label_27 = QtWidgets.QLabel(self.tab_4)
+        self.label_27.setObjectName("label_27")
+        self.formLayout_11.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.label_27)
+        self.teLocations = QtWidgets.QTextEdit(self.tab_4)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.teLocations.sizePolicy().hasHeightForWidth())
+        self.teLocations.setSizePolicy(sizePolicy)
+        self.teLocations.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.teLocations.setAcceptDrops(False)
+        self.teLocations.setObjectName("teLocations")
+        self.formLayout_11.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.teLocations)
+        self.label_28 = QtWidgets.QLabel(self.tab_4)
+        self.label_28.setObjectName("label_28")
+        self.formLayout_11.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.label_28)
+        self.teTags = QtWidgets.QTextEdit(self.tab_4)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.teTags.sizePolicy().hasHeightForWidth())
+        self.teTags.setSizePolicy(sizePolicy)
+        self.teTags.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.teTags.setBaseSize(QtCore.QSize(0, 100))
+        self.teTags.setAcceptDrops(False)
+        self.teTags.setObjectName("teTags")
+        self.formLayout_11.setWidget(4, QtWidgets.QFormLayout.FieldRole, self.teTags)
+        self.gridLayout_3.addLayout(self.formLayout_11, 0, 0, 1, 1)
+        self.tabWidget.addTab(self.tab_4, "")
+        self.tabPages = QtWidgets.QWidget()
+        self.tabPages.setObjectName("tabPages")
+        self.tabWidget.addTab(self.tabPages, "")
+        self.horizontalLayout.addWidget(self.tabWidget)
+        self.horizontalLayout_2.addLayout(self.horizontalLayout)
+        self.widgetListHolder = QtWidgets.QWidget(self.splitter)
+        self.widgetListHolder.setAcceptDrops(False)
+        self.widgetListHolder.setObjectName("widgetListHolder")
+        self.gridLayout.addWidget(self.splitter, 0, 0, 1, 1)
+        TaggerWindow.setCentralWidget(self.centralWidget)
+        self.menuBar = QtWidgets.QMenuBar(TaggerWindow)
+        self.menuBar.setGeometry(QtCore.QRect(0, 0, 1096, 21))
+        self.menuBar.setObjectName("menuBar")
+        self.menuComicTagger = QtWidgets.QMenu(self.menuBar)
+        self.menuComicTagger.setObjectName("menuComicTagger")
+        self.menuRemove = QtWidgets.QMenu(self.menuComicTagger)
+        self.menuRemove.setObjectName("menuRemove")
+        self.menuViewRawTags = QtWidgets.QMenu(self.menuComicTagger)
+        self.menuViewRawTags.setObjectName("menuViewRawTags")
+        self.menuHelp = QtWidgets.QMenu(self.menuBar)
+        self.menuHelp.setObjectName("menuHelp")
+        self.menuTags = QtWidgets.QMenu(self.menuBar)
+        self.menuTags.setObjectName("menuTags")
+        self.menuWindow = QtWidgets.QMenu(self.menuBar)
+        self.menuWindow.setObjectName("menuWindow")
+        TaggerWindow.setMenuBar(self.menuBar)
+        self.toolBar = QtWidgets.QToolBar(TaggerWindow)
+        self.toolBar.setMovable(False)
+        self.toolBar.setAllowedAreas(QtCore.Qt.NoToolBarArea)
+        self.toolBar.setToolButtonStyle(QtCore.Qt.ToolButtonTextBesideIcon)
+        self.toolBar.setFloatable(False)
+        self.toolBar.setObjectName("toolBar")
+        TaggerWindow.addToolBar(QtCore.Qt.TopToolBarArea, self.toolBar)
+        self.actionLoad = QtWidgets.QAction(TaggerWindow)
+        self.actionLoad.setObjectName("actionLoad")
+        self.actionWrite_Tags = QtWidgets.QAction(TaggerWindow)
+        self.actionWrite_Tags.setObjectName("actionWrite_Tags")
+        self.actionRepackage = QtWidgets.QAction(TaggerWindow)
+        self.actionRepackage.setObjectName("actionRepackage")
+        self.actionExit = QtWidgets.QAction(TaggerWindow)
+        self.actionExit.setObjectName("actionExit")
+        self.actionAbout = QtWidgets.QAction(TaggerWindow)
+        self.actionAbout.setObjectName("actionAbout")
+        self.actionParse_Filename = QtWidgets.QAction(TaggerWindow)
+        self.actionParse_Filename.setObjectName("actionParse_Filename")
+        self.actionSearchOnline = QtWidgets.QAction(TaggerWindow)
+        self.actionSearchOnline.setObjectName("actionSearchOnline")
+        self.actionClearEntryForm = QtWidgets.QAction(TaggerWindow)
+        self.actionClearEntryForm.setObjectName("actionClearEntryForm")
+        self.actionRemoveCRTags = QtWidgets.QAction(TaggerWindow)
+        self.actionRemoveCRTags.setObjectName("actionRemoveCRTags")
+        self.actionRemoveCBLTags = QtWidgets.QAction(TaggerWindow)
+        self.actionRemoveCBLTags.setObjectName("actionRemoveCBLTags")
+        self.actionReloadCBLTags = QtWidgets.QAction(TaggerWindow)
+        self.actionReloadCBLTags.setObjectName("actionReloadCBLTags")
+        self.actionReloadCRTags = QtWidgets.QAction(TaggerWindow)
+        self.actionReloadCRTags.setObjectName("actionReloadCRTags")
+        self.actionReloadAuto = QtWidgets.QAction(TaggerWindow)
+        self.actionReloadAuto.setObjectName("actionReloadAuto")
+        self.actionSettings = QtWidgets.QAction(TaggerWindow)
+        self.actionSettings.setObjectName("actionSettings")
+        self.actionAutoIdentify = QtWidgets.QAction(TaggerWindow)
+        self.actionAutoIdentify.setObjectName("actionAutoIdentify")
+        self.actionPageBrowser = QtWidgets.QAction(TaggerWindow)
+        self.actionPageBrowser.setObjectName("actionPageBrowser")
+        self.actionViewRawCRTags = QtWidgets.QAction(TaggerWindow)
+        self.actionViewRawCRTags.setObjectName("actionViewRawCRTags")
+        self.actionViewRawCBLTags = QtWidgets.QAction(TaggerWindow)
+        self.actionViewRawCBLTags.setObjectName("actionViewRawCBLTags")
+        self.actionReportBug = QtWidgets.QAction(TaggerWindow)
+        self.actionReportBug.setObjectName("actionReportBug")
+        self.actionComicTaggerForum = QtWidgets.QAction(TaggerWindow)
+        self.actionComicTaggerForum.setObjectName("actionComicTaggerForum")
+        self.actionWiki = QtWidgets.QAction(TaggerWindow)
+        self.actionWiki.setObjectName("actionWiki")
+        self.actionRemoveAuto = QtWidgets.QAction(TaggerWindow)
+        self.actionRemoveAuto.setObjectName("actionRemoveAuto")
+        self.actionRename = QtWidgets.QAction(TaggerWindow)
+        self.actionRename.setObjectName("actionRename")
+        self.actionApplyCBLTransform = QtWidgets.QAction(TaggerWindow)
+        self.actionApplyCBLTransform.setObjectName("actionApplyCBLTransform")
+        self.actionReCalcPageDims = QtWidgets.QAction(TaggerWindow)
+        self.actionReCalcPageDims.setObjectName("actionReCalcPageDims")
+        self.actionLoadFolder = QtWidgets.QAction(TaggerWindow)
+        self.actionLoadFolder.setObjectName("actionLoadFolder")
+        self.actionCopyTags = QtWidgets.QAction(TaggerWindow)
+        self.actionCopyTags.setObjectName("actionCopyTags")
+        self.actionAutoTag = QtWidgets.QAction(TaggerWindow)
+        self.actionAutoTag.setObjectName("actionAutoTag")
+        self.actionAutoImprint = QtWidgets.QAction(TaggerWindow)
+        self.actionAutoImprint.setObjectName("actionAutoImprint")
+        self.actionParse_Filename_split_words = QtWidgets.QAction(TaggerWindow)
+        self.actionParse_Filename_split_words.setObjectName("actionParse_Filename_split_words")
+        self.actionLogWindow = QtWidgets.QAction(TaggerWindow)
+        self.actionLogWindow.setObjectName("actionLogWindow")
+        self.actionLiteralSearch = QtWidgets.QAction(TaggerWindow)
+        self.actionLiteralSearch.setObjectName("actionLiteralSearch")
+        self.actionOpenFolderAsComic = QtWidgets.QAction(TaggerWindow)
+        self.actionOpenFolderAsComic.setObjectName("actionOpenFolderAsComic")
+        self.menuRemove.addAction(self.actionRemoveAuto)
+        self.menuRemove.addAction(self.actionRemoveCBLTags)
+        self.menuRemove.addAction(self.actionRemoveCRTags)
+        self.menuViewRawTags.addAction(self.actionViewRawCRTags)
+        self.menuViewRawTags.addAction(self.actionViewRawCBLTags)
+        self.menuComicTagger.addAction(self.actionLoad)
+        self.menuComicTagger.addAction(self.actionLoadFolder)
+        self.menuComicTagger.addAction(self.actionOpenFolderAsComic)
+        self.menuComicTagger.addAction(self.actionWrite_Tags)
+        self.menuComicTagger.addAction(self.actionAutoTag)
+        self.menuComicTagger.addAction(self.actionCopyTags)
+        self.menuComicTagger.addAction(self.menuRemove.menuAction())
+        self.menuComicTagger.addAction(self.menuViewRawTags.menuAction())
+        self.menuComicTagger.addAction(self.actionRepackage)
+        self.menuComicTagger.addAction(self.actionRename)
+        self.menuComicTagger.addAction(self.actionSettings)
+        self.menuComicTagger.addAction(self.actionExit)
+        self.menuHelp.addAction(self.actionWiki)
+        self.menuHelp.addAction(self.actionReportBug)
+        self.menuHelp.addAction(self.actionComicTaggerForum)
+        self.menuHelp.addSeparator()
+        self.menuHelp.addAction(self.actionAbout)
+        self.menuTags.addAction(self.actionClearEntryForm)
+        self.menuTags.addAction(self.actionParse_Filename)
+        self.menuTags.addAction(self.actionParse_Filename_split_words)
+        self.menuTags.addAction(self.actionSearchOnline)
+        self.menuTags.addAction(self.actionAutoIdentify)
+        self.menuTags.addAction(self.actionAutoImprint)
+        self.menuTags.addAction(self.actionLiteralSearch)
+        self.menuTags.addSeparator()
+        self.menuTags.addAction(self.actionApplyCBLTransform)
+        self.menuTags.addAction(self.actionReCalcPageDims)
+        self.menuWindow.addAction(self.actionPageBrowser)
+        self.menuWindow.addAction(self.actionLogWindow)
+        self.menuBar.addAction(self.menuComicTagger.menuAction())
+        self.menuBar.addAction(self.menuTags.menuAction())
+        self.menuBar.addAction(self.menuWindow.menuAction())
+        self.menuBar.addAction(self.menuHelp.menuAction())
+        self.toolBar.addSeparator()
+
+        self.retranslateUi(TaggerWindow)
+        self.tabWidget.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(TaggerWindow)
+
+    def retranslateUi(self, TaggerWindow):
+        _translate = QtCore.QCoreApplication.translate
+        TaggerWindow.setWindowTitle(_translate("TaggerWindow", "ComicTagger"))
+        self.label.setText(_translate("TaggerWindow", "Read Style"))
+        self.saveStyleLabel.setText(_translate("TaggerWindow", "Modify Style"))
+        self.lbl_md_source.setText(_translate("TaggerWindow", "Metadata Source"))
+        self.label_4.setText(_translate("TaggerWindow", "Issue"))
+        self.label_6.setText(_translate("TaggerWindow", "Year"))
+        self.label_35.setText(_translate("TaggerWindow", "Month"))
+        self.lblDay.setText(_translate("TaggerWindow", "Day"))
+        self.label_5.setText(_translate("TaggerWindow", "# Issues"))
+        self.label_9.setText(_translate("TaggerWindow", "Volume"))
+        self.label_12.setText(_translate("TaggerWindow", "# Volumes"))
+        self.label_22.setText(_translate("TaggerWindow", "Alt.Issue"))
+        self.label_23.setText(_translate("TaggerWindow", "Alt. # Issues"))
+        self.label_2.setText(_translate("TaggerWindow", "Series"))
+        self.label_3.setText(_translate("TaggerWindow", "Title"))
+        self.label_8.setText(_translate("TaggerWindow", "Publisher"))
+        self.label_10.setText(_translate("TaggerWindow", "Imprint"))
+        self.label_33.setText(_translate("TaggerWindow", "Series Group"))
+        self.label_25.setText(_translate("TaggerWindow", "Story Arc"))
+        self.label_24.setText(_translate("TaggerWindow", "Genre"))
+        self.label_18.setText(_translate("TaggerWindow", "Maturity Rating"))
+        self.label_31.setText(_translate("TaggerWindow", "Manga"))
+        self.label_26.setText(_translate("TaggerWindow", "Format"))
+        self.label_32.setText(_translate("TaggerWindow", "Black & White"))
+        self.label_13.setText(_translate("TaggerWindow", "Language"))
+        self.label_14.setText(_translate("TaggerWindow", "Country"))
+        self.label_21.setText(_translate("TaggerWindow", "Alt. Series"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), _translate("TaggerWindow", "Details"))
+        item = self.twCredits.horizontalHeaderItem(0)
+        item.setText(_translate("TaggerWindow", "Primary"))
+        item = self.twCredits.horizontalHeaderItem(1)
+        item.setText(_translate("TaggerWindow", "Credit"))
+        item = self.twCredits.horizontalHeaderItem(2)
+        item.setText(_translate("TaggerWindow", "Name"))
+        self.label_20.setText(_translate("TaggerWindow", "Scan Info"))
+        self.btnAddCredit.setText(_translate("TaggerWindow", "Add Credit"))
+        self.btnRemoveCredit.setText(_translate("TaggerWindow", "Remove Credit"))
+        self.btnEditCredit.setText(_translate("TaggerWindow", "Edit Credit"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), _translate("TaggerWindow", "Credits"))
+        self.label_15.setText(_translate("TaggerWindow", "Comments"))
+        self.label_16.setText(_translate("TaggerWindow", "Notes"))
+        self.label_19.setText(_translate("TaggerWindow", "Web"))
+        self.lblCriticalRating.setText(_translate("TaggerWindow", "Critical Rating"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), _translate("TaggerWindow", "Notes"))
+        self.label_29.setText(_translate("TaggerWindow", "Characters"))
+        self.label_30.setText(_translate("TaggerWindow", "Teams"))
+        self.label_27.setText(_translate("TaggerWindow", "Locations"))
+        self.label_28.setText(_translate("TaggerWindow", "Other Tags"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), _translate("TaggerWindow", "Other"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabPages), _translate("TaggerWindow", "Pages"))
+        self.menuComicTagger.setTitle(_translate("TaggerWindow", "File"))
+        self.menuRemove.setTitle(_translate("TaggerWindow", "Remove Tags"))
+        self.menuViewRawTags.setTitle(_translate("TaggerWindow", "View Raw Tags"))
+        self.menuHelp.setTitle(_translate("TaggerWindow", "Help"))
+        self.menuTags.setTitle(_translate("TaggerWindow", "Tags"))
+        self.menuWindow.setTitle(_translate("TaggerWindow", "Window"))
+        self.toolBar.setWindowTitle(_translate("TaggerWindow", "toolBar"))
+        self.actionLoad.setText(_translate("TaggerWindow", "Open"))
+        self.actionWrite_Tags.setText(_translate("TaggerWindow", "Save Tags"))
+        self.actionRepackage.setText(_translate("TaggerWindow", "Export as Zip Archive"))
+        self.actionExit.setText(_translate("TaggerWindow", "Exit"))
+        self.actionAbout.setText(_translate("TaggerWindow", "About ComicTagger"))
+        self.actionParse_Filename.setText(_translate("TaggerWindow", "Parse Filename"))
+        self.actionSearchOnline.setText(_translate("TaggerWindow", "Search Online"))
+        self.actionClearEntryForm.setText(_translate("TaggerWindow", "Clear Form"))
+        self.actionRemoveCRTags.setText(_translate("TaggerWindow", "Remove ComicRack Tags"))
+        self.actionRemoveCBLTags.setText(_translate("TaggerWindow", "Remove ComicBookLover Tags"))
+        self.actionReloadCBLTags.setText(_translate("TaggerWindow", "Reload ComicBookLover Tags"))
+        self.actionReloadCRTags.setText(_translate("TaggerWindow", "Reload ComicRack Tags"))
+        self.actionReloadAuto.setText(_translate("TaggerWindow", "Reload Selected Tag Style"))
+        self.actionSettings.setText(_translate("TaggerWindow", "Settings..."))
+        self.actionAutoIdentify.setText(_translate("TaggerWindow", "Auto-Identify"))
+        self.actionAutoIdentify.setIconText(_translate("TaggerWindow", "Auto-Identify"))
+        self.actionAutoIdentify.setToolTip(
+            _translate("TaggerWindow", "Search online for tags and auto-identify best match for single archive")
+        )
+        self.actionAutoIdentify.setStatusTip(
+            _translate("TaggerWindow", "Search online for tags and auto-identify best match for single archive")
+        )
+        self.actionPageBrowser.setText(_translate("TaggerWindow", "Show Page Browser"))
+        self.actionPageBrowser.setIconText(_translate("TaggerWindow", "Page Browser"))
+        self.actionPageBrowser.setToolTip(_translate("TaggerWindow", "Show the Page Browser to inspect the comic"))
+        self.actionPageBrowser.setStatusTip(_translate("TaggerWindow", "Show the Page Browser to inspect the comic"))
+        self.actionViewRawCRTags.setText(_translate("TaggerWindow", "View Raw ComicRack Tags"))
+        self.actionViewRawCBLTags.setText(_translate("TaggerWindow", "View Raw ComicBookLover Tags"))
+        self.actionReportBug.setText(_translate("TaggerWindow", "Report Bug..."))
+        self.actionComicTaggerForum.setText(_translate("TaggerWindow", "ComicTagger Discussions..."))
+        self.actionWiki.setText(_translate("TaggerWindow", "Online Docs..."))
+        self.actionRemoveAuto.setText(_translate("TaggerWindow", "Remove Current 'Modify' Tag Style"))
+        self.actionRename.setText(_translate("TaggerWindow", "Rename"))
+        self.actionApplyCBLTransform.setText(_translate("TaggerWindow", "Apply CBL Transform"))
+        self.actionReCalcPageDims.setText(_translate("TaggerWindow", "Re-Calculate Page Dimensions"))
+        self.actionLoadFolder.setText(_translate("TaggerWindow", "Open Folder"))
+        self.actionCopyTags.setText(_translate("TaggerWindow", "Copy Tags"))
+        self.actionAutoTag.setText(_translate("TaggerWindow", "Auto-Tag"))
+        self.actionAutoTag.setToolTip(
+            _translate("TaggerWindow", "Search online for tags,auto-identify best match, and save to archive")
+        )
+        self.actionAutoTag.setStatusTip(
+            _translate("TaggerWindow", "Search online for tags,auto-identify best match, and save to archive")
+        )
+        self.actionAutoImprint.setText(_translate("TaggerWindow", "Auto Imprint"))
+        self.actionAutoImprint.setToolTip(
+            _translate(
+                "TaggerWindow",
+                "Normalize the publisher and map imprints to their parent publisher (e.g. Vertigo is an imprint of DC Comics)",
+            )
+        )
+        self.actionParse_Filename_split_words.setText(_translate("TaggerWindow", "Parse Filename and split words"))
+        self.actionParse_Filename_split_words.setToolTip(_translate("TaggerWindow", "Parse Filename and split words"))
+        self.actionLogWindow.setText(_translate("TaggerWindow", "Show Log Window"))
+        self.actionLiteralSearch.setText(_translate("TaggerWindow", "Literal Search"))
+        self.actionLiteralSearch.setToolTip(
+            _translate("TaggerWindow", "perform a literal search on the series and return the first 50 results")
+        )
+        self.actionOpenFolderAsComic.setText(_translate("TaggerWindow", "Open Folder as Comic"))
@@ -6,11 +6,11 @@ from pathlib import Path
 from typing import Any, NamedTuple, cast
 
 import settngs
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
 from comictaggerlib.coverimagewidget import CoverImageWidget
 from comictaggerlib.ctsettings import ct_ns, group_for_plugin
-from comictaggerlib.graphics import graphics_path
+from comictaggerlib.ui.qtutils import get_icon
 from comictalker.comictalker import ComicTalker
 
 logger = logging.getLogger(__name__)
@@ -37,8 +37,8 @@ class PasswordEdit(QtWidgets.QLineEdit):
     def __init__(self, show_visibility: bool = True, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
-        self.visibleIcon = QtGui.QIcon(str(graphics_path / "eye.svg"))
-        self.hiddenIcon = QtGui.QIcon(str(graphics_path / "hidden.svg"))
+        self.visibleIcon = get_icon("eye.svg")
+        self.hiddenIcon = get_icon("hidden.svg")
 
         self.setEchoMode(QtWidgets.QLineEdit.Password)
 
@@ -285,21 +285,31 @@ def settings_to_talker_form(sources: Sources, config: settngs.Config[ct_ns]) ->
                 logger.debug("Failed to set value of %s for %s(%s)", dest, talker.name, talker.id)
 
 
+def get_widget_value(widget: QtWidgets.QWidget) -> Any:
+    if isinstance(widget, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+        return widget.value()
+    if isinstance(widget, QtWidgets.QLineEdit):
+        return widget.text().strip()
+    if isinstance(widget, QtWidgets.QComboBox):
+        return widget.currentText()
+    if isinstance(widget, QtWidgets.QCheckBox):
+        return widget.isChecked()
+    return None
+
+
+def talker_form_state(sources: Sources) -> tuple[Any, ...]:
+    """Returns the unparsed values of the talker form, for detecting whether it was changed"""
+    return (
+        sources.cbx_sources.currentData(),
+        *(get_widget_value(widget) for _, tab in sources.tabs for widget in tab.widgets.values()),
+    )
+
+
 def get_config_from_tab(tab: TalkerTab, definitions: settngs.Group) -> dict[str, Any]:
     talker_options = {}
     # dest is guaranteed to be unique within a talker and refer to the correct item in config.values['group name']
     for dest, widget in tab.widgets.items():
-        widget_value = None
-
-        # Retrieve the widget value
-        if isinstance(widget, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
-            widget_value = widget.value()
-        elif isinstance(widget, QtWidgets.QLineEdit):
-            widget_value = widget.text().strip()
-        elif isinstance(widget, QtWidgets.QComboBox):
-            widget_value = widget.currentText()
-        elif isinstance(widget, QtWidgets.QCheckBox):
-            widget_value = widget.isChecked()
+        widget_value = get_widget_value(widget)
 
         # Reset to default if the widget_value is empty
         if (isinstance(widget_value, str) and widget_value == "") or widget_value is None:
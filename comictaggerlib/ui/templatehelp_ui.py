@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'comictaggerlib/ui/TemplateHelp.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from __future__ import annotations
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_TemplateHelpWindow(object):
+    def setupUi(self, TemplateHelpWindow):
+        TemplateHelpWindow.setObjectName("TemplateHelpWindow")
+        TemplateHelpWindow.resize(702, 452)
+        TemplateHelpWindow.setSizeGripEnabled(True)
+        self.verticalLayout = QtWidgets.QVBoxLayout(TemplateHelpWindow)
+        self.verticalLayout.setContentsMargins(2, 2, -1, -1)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.textEdit = QtWidgets.QTextBrowser(TemplateHelpWindow)
+        self.textEdit.setReadOnly(True)
+        self.textEdit.setTextInteractionFlags(QtCore.Qt.TextBrowserInteraction)
+        self.textEdit.setOpenExternalLinks(True)
+        self.textEdit.setObjectName("textEdit")
+        self.verticalLayout.addWidget(self.textEdit)
+
+        self.retranslateUi(TemplateHelpWindow)
+        QtCore.QMetaObject.connectSlotsByName(TemplateHelpWindow)
+
+    def retranslateUi(self, TemplateHelpWindow):
+        _translate = QtCore.QCoreApplication.translate
+        TemplateHelpWindow.setWindowTitle(_translate("TemplateHelpWindow", "Template Help"))
+        self.textEdit.setHtml(
+            _translate(
+                "TemplateHelpWindow",
+                "<html>\n"
+                "     <head>\n"
+                "     <style>\n"
+                "table {\n"
+                "  font-family: arial, sans-serif;\n"
+                "  border-collapse: collapse;\n"
+                "  width: 100%;\n"
+                "}\n"
+                "\n"
+                "td, th {\n"
+                "  border: 1px solid #dddddd;\n"
+                "  text-align: left;\n"
+                "  padding: 8px;\n"
+                "}\n"
+                "\n"
+                "tr:nth-child(even) {\n"
+                "  background-color: #dddddd;\n"
+                "}\n"
+                "</style>\n"
+                "     </head>\n"
+                "     <body>\n"
+                '          <h1 style="text-align: center">Template help</h1>\n'
+                "          <p>The template uses Python format strings, in the simplest use it replaces the field (e.g. {issue}) with the value for that particular comic (e.g. 1) for advanced formatting please reference the\n"
+                "\n"
+                '               <a href="https://docs.python.org/3/library/string.html#format-string-syntax">Python 3 documentation</a></p>\n'
+                "          Accepts the following variables:\n"
+                "<table>\n"
+                "     <tr>\n"
+                "          <th>Tag name</th>\n"
+                "          <th>Type</th>\n"
+                "     </tr>\n"
+                "     <tr><td>{is_empty}</td><td>boolean</td></tr>\n"
+                "     <tr><td>{tag_origin}</td><td>string</td></tr>\n"
+                "     <tr><td>{series}</td><td>string</td></tr>\n"
+                "     <tr><td>{issue}</td><td>string</td></tr>\n"
+                "     <tr><td>{title}</td><td>string</td></tr>\n"
+                "     <tr><td>{publisher}</td><td>string</td></tr>\n"
+                "     <tr><td>{month}</td><td>integer</td></tr>\n"
+                "     <tr><td>{year}</td><td>integer</td></tr>\n"
+                "     <tr><td>{day}</td><td>integer</td></tr>\n"
+                "     <tr><td>{issue_count}</td><td>integer</td></tr>\n"
+                "     <tr><td>{volume}</td><td>integer</td></tr>\n"
+                "     <tr><td>{genre}</td><td>string</td></tr>\n"
+                "     <tr><td>{language}</td><td>string</td></tr>\n"
+                "     <tr><td>{comments}</td><td>string</td></tr>\n"
+                "     <tr><td>{volume_count}</td><td>integer</td></tr>\n"
+                "     <tr><td>{critical_rating}</td><td>float</td></tr>\n"
+                "     <tr><td>{country}</td><td>string</td></tr>\n"
+                "     <tr><td>{alternate_series}</td><td>string</td></tr>\n"
+                "     <tr><td>{alternate_number}</td><td>string</td></tr>\n"
+                "     <tr><td>{alternate_count}</td><td>integer</td></tr>\n"
+                "     <tr><td>{imprint}</td><td>string</td></tr>\n"
+                "     <tr><td>{notes}</td><td>string</td></tr>\n"
+                "     <tr><td>{web_link}</td><td>string</td></tr>\n"
+                "     <tr><td>{format}</td><td>string</td></tr>\n"
+                "     <tr><td>{manga}</td><td>string</td></tr>\n"
+                "     <tr><td>{black_and_white}</td><td>boolean</td></tr>\n"
+                "     <tr><td>{page_count}</td><td>integer</td></tr>\n"
+                "     <tr><td>{maturity_rating}</td><td>string</td></tr>\n"
+                "     <tr><td>{story_arc}</td><td>string</td></tr>\n"
+                "     <tr><td>{series_group}</td><td>string</td></tr>\n"
+                "     <tr><td>{scan_info}</td><td>string</td></tr>\n"
+                "     <tr><td>{characters}</td><td>string</td></tr>\n"
+                "     <tr><td>{teams}</td><td>string</td></tr>\n"
+                "     <tr><td>{locations}</td><td>string</td></tr>\n"
+                "     <tr><td>{credits}</td><td>list of dict({'role': string, 'person': string, 'primary': boolean})</td></tr>\n"
+                "     <tr><td>{writer}</td><td>(string)</td></tr>\n"
+                "     <tr><td>{penciller}</td><td>(string)</td></tr>\n"
+                "     <tr><td>{inker}</td><td>(string)</td></tr>\n"
+                "     <tr><td>{colorist}</td><td>(string)</td></tr>\n"
+                "     <tr><td>{letterer}</td><td>(string)</td></tr>\n"
+                "     <tr><td>{cover artist}</td><td>(string)</td></tr>\n"
+                "     <tr><td>{editor}</td><td>(string)</td></tr>\n"
+                "     <tr><td>{tags}</td><td>list of str</td></tr>\n"
+                "     <tr><td>{pages}</td><td>list of dict({'Image': string(int), 'Type': string, 'Bookmark': string, 'DoublePage': boolean})</td></tr>\n"
+                "     <tr><td>{price}</td><td>float</td></tr>\n"
+                "     <tr><td>{is_version_of}</td><td>string</td></tr>\n"
+                "     <tr><td>{rights}</td><td>string</td></tr>\n"
+                "     <tr><td>{identifier}</td><td>string</td></tr>\n"
+                "     <tr><td>{last_mark}</td><td>string</td></tr>\n"
+                "     <tr><td>{cover_image}</td><td>string</td></tr>\n"
+                "</table>\n"
+                "<pre>\n"
+                "Examples:\n"
+                "\n"
+                "{series} {issue} ({year})\n"
+                "Spider-Geddon 1 (2018)\n"
+                "\n"
+                "{series} #{issue} - {title}\n"
+                "Spider-Geddon #1 - New Players; Check In\n"
+                "\n"
+                "</pre>\n"
+                "     </body>\n"
+                "</html>",
+            )
+        )
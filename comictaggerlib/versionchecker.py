@@ -38,6 +38,7 @@ class VersionChecker:
                 url,
                 params=params,
                 headers={"user-agent": "comictagger/" + ctversion.version},
+                timeout=10,
             ).json()
         except Exception:
             return "", ""
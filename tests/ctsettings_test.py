@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import settngs
+
+import comictaggerlib.ctsettings
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+def test_save_file(config, tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(comictaggerlib.ctsettings, "orjson_available", use_orjson)
+    settings_file = tmp_path / "settings.json"
+    config[0].internal__last_opened_folder = tmp_path / "Bücher 漫画"
+
+    assert comictaggerlib.ctsettings.save_file(config, settings_file)
+
+    assert list(tmp_path.glob("*.tmp")) == []
+    saved_text = settings_file.read_text(encoding="utf-8")
+    assert "Bücher 漫画" in saved_text
+    saved = json.loads(saved_text)
+    expected = json.loads(
+        json.dumps(settngs.clean_config(config, file=True), cls=comictaggerlib.ctsettings.SettingsEncoder)
+    )
+    assert saved == expected
+
+
+def test_save_file_writers_match(config, tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    config[0].internal__last_opened_folder = tmp_path / "Bücher 漫画"
+
+    comictaggerlib.ctsettings.save_file(config, tmp_path / "orjson.json")
+    monkeypatch.setattr(comictaggerlib.ctsettings, "orjson_available", False)
+    comictaggerlib.ctsettings.save_file(config, tmp_path / "json.json")
+
+    assert (tmp_path / "orjson.json").read_bytes() == (tmp_path / "json.json").read_bytes()
@@ -15,6 +15,17 @@ def test_set_default_page_list(tmp_path):
     assert isinstance(md.pages[0]["Image"], int)
 
 
+def test_get_cover_page_index():
+    md = comicapi.genericmetadata.GenericMetadata()
+    assert md.get_cover_page_index() == 0
+
+    md.set_default_page_list(3)
+    md.pages[0]["Type"] = comicapi.genericmetadata.PageType.Story
+    md.pages[2]["Type"] = comicapi.genericmetadata.PageType.FrontCover
+    assert md.get_cover_page_index() == 2
+    assert md.get_cover_page_index() == md.get_cover_page_index_list()[0]
+
+
 @pytest.mark.parametrize("replaced, expected", metadata)
 def test_metadata_overlay(md: comicapi.genericmetadata.GenericMetadata, replaced, expected):
     md.overlay(replaced)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import comictaggerlib.main
+
+publishers = {"Marvel": {"Epic": "Epic Comics", "Max": "Max Comics"}, "DC Comics": {"Vertigo": "Vertigo"}}
+
+
+def test_load_json_file(tmp_path):
+    pytest.importorskip("orjson")
+    json_file = tmp_path / "publishers.json"
+    json_file.write_text(json.dumps(publishers), encoding="utf-8")
+
+    assert comictaggerlib.main._load_json_file(json_file) == publishers
+
+
+def test_load_json_file_no_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(comictaggerlib.main, "orjson_available", False)
+    json_file = tmp_path / "publishers.json"
+    json_file.write_text(json.dumps(publishers), encoding="utf-8")
+
+    assert comictaggerlib.main._load_json_file(json_file) == publishers
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PyQt5.QtNetwork")
+
+from comictaggerlib.taggerwindow import decode_file_list, encode_file_list  # noqa: E402
+
+file_lists = [
+    pytest.param(["/comics/Cory Doctorow's Futuristic Tales of the Here and Now #001.cbz"], id="single"),
+    pytest.param(["/comics/a.cbz", "/comics/b.cbr", "relative/c.cb7"], id="multiple"),
+    pytest.param(["/comics/Bücher/漫画 #1.cbz"], id="non-ascii"),
+    pytest.param(["/comics/invalid-\udcff-utf8.cbz"], id="surrogateescape"),
+    pytest.param([], id="empty"),
+]
+
+
+@pytest.mark.parametrize("file_list", file_lists)
+def test_file_list_round_trip(file_list: list[str]):
+    assert decode_file_list(encode_file_list(file_list)) == file_list
+
+
+@pytest.mark.parametrize("file_list", file_lists)
+def test_file_list_bytearray(file_list: list[str]):
+    assert decode_file_list(bytearray(encode_file_list(file_list))) == file_list
+
+
+@pytest.mark.parametrize("file_list", file_lists)
+def test_file_list_partial(file_list: list[str]):
+    data = encode_file_list(file_list)
+    # Anything short of the whole message, including a partial length prefix, is not decoded yet
+    for end in range(len(data)):
+        assert decode_file_list(data[:end]) is None
+
+
+def test_file_list_split():
+    file_list = ["/comics/a.cbz", "/comics/b.cbz"]
+    data = encode_file_list(file_list)
+    buffer = bytearray()
+    # The receiver appends each chunk as it arrives and decodes once all of it is there
+    for chunk in (data[:2], data[2:7], data[7:]):
+        assert decode_file_list(buffer) is None
+        buffer += chunk
+    assert decode_file_list(buffer) == file_list
+
+
+def test_file_list_length_prefix():
+    data = encode_file_list(["/comics/a.cbz"])
+    assert data[:4] == len("/comics/a.cbz").to_bytes(4, "big")
+    assert decode_file_list(data + b"extra") == ["/comics/a.cbz"]
@@ -160,6 +160,7 @@ def test_unique_file(tmp_path):
 
     file.mkdir()
     assert (tmp_path / "test (1).cbz") == comicapi.utils.unique_file(file)
+    assert (tmp_path / "test (2).cbz") == comicapi.utils.unique_file(file, {tmp_path / "test (1).cbz"})
 
 
 def test_add_to_path(monkeypatch):